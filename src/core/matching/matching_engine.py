@@ -870,26 +870,17 @@ class MatchingEngine:
             keyword_w = self.weights["keyword_match"]
             semantic_score = result.keyword_score   # fallback: keyword as proxy
 
-        breakdown = ScoreBreakdown(
+        breakdown = ScoreBreakdown.from_components(
             skills_score=result.skills_score,
             skills_weight=skills_w,
-            skills_weighted=result.skills_score * skills_w,
-
             experience_score=result.experience_score,
             experience_weight=experience_w,
-            experience_weighted=result.experience_score * experience_w,
-
             education_score=result.education_score,
             education_weight=education_w,
-            education_weighted=result.education_score * education_w,
-
             semantic_score=semantic_score,
             semantic_weight=semantic_w,
-            semantic_weighted=semantic_score * semantic_w,
-
             keyword_score=result.keyword_score,
             keyword_weight=keyword_w,
-            keyword_weighted=result.keyword_score * keyword_w,
         )
 
         return breakdown
@@ -2,14 +2,15 @@
 Database connection manager for AI-ATS.
 
 Provides MongoDB connection management with both synchronous (PyMongo)
-and asynchronous (Motor) client support.
+and asynchronous (PyMongo AsyncMongoClient) client support.
 """
 
+import threading
 from contextlib import asynccontextmanager, contextmanager
 from typing import Any, Optional
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 
@@ -29,7 +30,7 @@ class DatabaseManager:
 
     _instance: Optional["DatabaseManager"] = None
     _sync_client: Optional[MongoClient] = None
-    _async_client: Optional[AsyncIOMotorClient] = None
+    _async_client: Optional[AsyncMongoClient] = None
 
     def __new__(cls) -> "DatabaseManager":
         """Ensure singleton instance."""
@@ -45,6 +46,9 @@ class DatabaseManager:
         self._settings = get_settings()
         self._db_name = self._settings.database.name
         self._uri = self._build_uri()
+        # Collection handles per client, reset whenever a client is recreated
+        self._sync_collections: dict[str, Any] = {}
+        self._async_collections: dict[str, Any] = {}
         self._initialized = True
 
     def _build_uri(self) -> str:
@@ -80,13 +84,14 @@ class DatabaseManager:
         """Get or create synchronous MongoDB client."""
         if self._sync_client is None:
             logger.info("Creating synchronous MongoDB client")
+            self._sync_collections = {}
             try:
                 self._sync_client = MongoClient(
                     self._uri,
                     serverSelectionTimeoutMS=5000,
                     connectTimeoutMS=5000,
-                    maxPoolSize=50,
-                    minPoolSize=5,
+                    maxPoolSize=self._settings.database.max_pool_size,
+                    minPoolSize=self._settings.database.min_pool_size,
                 )
             except Exception as e:
                 self._sync_client = None
@@ -99,8 +104,13 @@ class DatabaseManager:
         return self.get_sync_client()[self._db_name]
 
     def get_sync_collection(self, collection_name: str) -> Any:
-        """Get a synchronous collection by name."""
-        return self.get_sync_database()[collection_name]
+        """Get a synchronous collection by name, reusing the handle."""
+        client = self.get_sync_client()
+        collection = self._sync_collections.get(collection_name)
+        if collection is None:
+            collection = client[self._db_name][collection_name]
+            self._sync_collections[collection_name] = collection
+        return collection
 
     @contextmanager
     def sync_session(self):
@@ -130,32 +140,38 @@ class DatabaseManager:
     # Asynchronous Client
     # -------------------------------------------------------------------------
 
-    def get_async_client(self) -> AsyncIOMotorClient:
+    def get_async_client(self) -> AsyncMongoClient:
         """Get or create asynchronous MongoDB client."""
         if self._async_client is None:
             logger.info("Creating asynchronous MongoDB client")
-            self._async_client = AsyncIOMotorClient(
+            self._async_collections = {}
+            self._async_client = AsyncMongoClient(
                 self._uri,
                 serverSelectionTimeoutMS=5000,
                 connectTimeoutMS=5000,
-                maxPoolSize=50,
-                minPoolSize=5,
+                maxPoolSize=self._settings.database.max_pool_size,
+                minPoolSize=self._settings.database.min_pool_size,
             )
         return self._async_client
 
-    def get_async_database(self) -> AsyncIOMotorDatabase:
+    def get_async_database(self) -> AsyncDatabase:
         """Get asynchronous database instance."""
         return self.get_async_client()[self._db_name]
 
     def get_async_collection(self, collection_name: str) -> Any:
-        """Get an asynchronous collection by name."""
-        return self.get_async_database()[collection_name]
+        """Get an asynchronous collection by name, reusing the handle."""
+        client = self.get_async_client()
+        collection = self._async_collections.get(collection_name)
+        if collection is None:
+            collection = client[self._db_name][collection_name]
+            self._async_collections[collection_name] = collection
+        return collection
 
     @asynccontextmanager
     async def async_session(self):
         """Context manager for asynchronous database session."""
         client = self.get_async_client()
-        session = await client.start_session()
+        session = client.start_session()
         try:
             yield session
         finally:
@@ -181,17 +197,17 @@ class DatabaseManager:
             self._sync_client.close()
             self._sync_client = None
 
-    def close_async(self) -> None:
+    async def close_async(self) -> None:
         """Close asynchronous client connection."""
         if self._async_client:
             logger.info("Closing asynchronous MongoDB client")
-            self._async_client.close()
+            await self._async_client.close()
             self._async_client = None
 
-    def close_all(self) -> None:
+    async def close_all(self) -> None:
         """Close all database connections."""
         self.close_sync()
-        self.close_async()
+        await self.close_async()
 
     # -------------------------------------------------------------------------
     # Index Management
@@ -204,9 +220,17 @@ class DatabaseManager:
         # Candidates collection indexes
         candidates = self.get_async_collection("candidates")
         await candidates.create_index("contact.email", unique=True)
-        await candidates.create_index("status")
+        await candidates.create_index([("status", 1), ("created_at", -1)])
         await candidates.create_index("metadata.tags")
         await candidates.create_index("created_at")
+        await candidates.create_index(
+            [
+                ("first_name", "text"),
+                ("last_name", "text"),
+                ("headline", "text"),
+                ("summary", "text"),
+            ]
+        )
 
         # Resumes collection indexes
         resumes = self.get_async_collection("resumes")
@@ -217,8 +241,21 @@ class DatabaseManager:
 
         # Jobs collection indexes
         jobs = self.get_async_collection("jobs")
-        await jobs.create_index("status")
-        await jobs.create_index("company_name")
+        # get_open_jobs: status equality, posted_date sort, closing_date range
+        await jobs.create_index([("status", 1), ("posted_date", -1), ("closing_date", 1)])
+        await jobs.create_index([("status", 1), ("created_at", -1)])
+        await jobs.create_index("skill_requirements.name")
+        await jobs.create_index(
+            [("title", "text"), ("description", "text"), ("company_name", "text")],
+            weights={"title": 10, "company_name": 5, "description": 1},
+            name="job_text_idx",
+        )
+        # get_by_company/search compare company names under this collation
+        await jobs.create_index(
+            "company_name",
+            collation={"locale": "en", "strength": 2},
+            name="company_name_ci",
+        )
         await jobs.create_index("employment_type")
         await jobs.create_index("experience_level")
         await jobs.create_index("metadata.tags")
@@ -230,36 +267,72 @@ class DatabaseManager:
         await matches.create_index(
             [("candidate_id", 1), ("job_id", 1)], unique=True
         )
-        await matches.create_index("job_id")
+        # Equality fields first, then the sort each list query uses, so the
+        # results come back already ordered instead of sorted in memory
+        # Trailing status/rank/candidate_id let list_top_ranks be a covered query
+        await matches.create_index(
+            [
+                ("job_id", 1),
+                ("overall_score", -1),
+                ("_id", 1),
+                ("status", 1),
+                ("rank", 1),
+                ("candidate_id", 1),
+            ]
+        )
+        await matches.create_index([("candidate_id", 1), ("overall_score", -1), ("_id", 1)])
+        await matches.create_index([("job_id", 1), ("status", 1), ("created_at", -1)])
+        await matches.create_index([("job_id", 1), ("score_level", 1), ("overall_score", -1)])
+        await matches.create_index([("status", 1), ("created_at", -1)])
+        await matches.create_index([("score_level", 1), ("overall_score", -1)])
         await matches.create_index("overall_score")
-        await matches.create_index("score_level")
-        await matches.create_index("status")
         await matches.create_index("rank")
         await matches.create_index("created_at")
 
         # Audit logs collection indexes
+        # Every audit query filters on one field and sorts newest-first, so
+        # each filter gets an (equality, created_at desc) compound index.
         audit_logs = self.get_async_collection("audit_logs")
-        await audit_logs.create_index("action")
-        await audit_logs.create_index("actor.actor_id")
-        await audit_logs.create_index("resource.resource_type")
-        await audit_logs.create_index("resource.resource_id")
-        await audit_logs.create_index("related_candidate_id")
-        await audit_logs.create_index("related_job_id")
-        await audit_logs.create_index("compliance_relevant")
-        await audit_logs.create_index("created_at")
+        await audit_logs.create_index([("action", 1), ("created_at", -1), ("_id", -1)])
+        await audit_logs.create_index([("actor.actor_id", 1), ("created_at", -1), ("_id", -1)])
+        await audit_logs.create_index(
+            [("resource.resource_type", 1), ("created_at", -1), ("_id", -1)]
+        )
+        await audit_logs.create_index(
+            [
+                ("resource.resource_type", 1),
+                ("resource.resource_id", 1),
+                ("created_at", -1),
+                ("_id", -1),
+            ]
+        )
+        await audit_logs.create_index(
+            [("related_candidate_id", 1), ("created_at", -1), ("_id", -1)]
+        )
+        await audit_logs.create_index([("related_job_id", 1), ("created_at", -1), ("_id", -1)])
+        await audit_logs.create_index([("related_match_id", 1), ("created_at", -1), ("_id", -1)])
+        await audit_logs.create_index(
+            [("compliance_relevant", 1), ("created_at", -1), ("_id", -1)],
+            partialFilterExpression={"compliance_relevant": True},
+        )
+        await audit_logs.create_index([("created_at", -1), ("_id", -1)])
+        await audit_logs.create_index([("retention_period_days", 1), ("created_at", 1)])
 
         logger.info("Database indexes created successfully")
 
 
 # Global database manager instance
 _db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
 
 
 def get_database_manager() -> DatabaseManager:
-    """Get the global database manager instance."""
+    """Get the global database manager instance (thread-safe)."""
     global _db_manager
     if _db_manager is None:
-        _db_manager = DatabaseManager()
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
     return _db_manager
 
 
@@ -268,6 +341,6 @@ def get_sync_db() -> Database:
     return get_database_manager().get_sync_database()
 
 
-def get_async_db() -> AsyncIOMotorDatabase:
+def get_async_db() -> AsyncDatabase:
     """Convenience function to get asynchronous database."""
     return get_database_manager().get_async_database()
@@ -6,13 +6,14 @@ including database documents, embedded models, and API schemas.
 """
 
 # Base models
-from .base import BaseDocument, EmbeddedModel, PyObjectId, TimestampMixin
+from .base import BaseDocument, EmbeddedModel, FrozenEmbeddedModel, PyObjectId, TimestampMixin
 
 # Candidate models
 from .candidate import (
     Candidate,
     CandidateCreate,
     CandidateMetadata,
+    CandidateSummary,
     CandidateUpdate,
     Certification,
     ContactInfo,
@@ -46,6 +47,7 @@ from .job import (
     Job,
     JobCreate,
     JobMetadata,
+    JobSummary,
     JobUpdate,
     Location,
     SalaryRange,
@@ -65,6 +67,7 @@ from .match import (
     Match,
     MatchCreate,
     MatchStatus,
+    MatchRankEntry,
     MatchSummary,
     MatchUpdate,
     RecruiterFeedback,
@@ -94,12 +97,14 @@ __all__ = [
     # Base
     "BaseDocument",
     "EmbeddedModel",
+    "FrozenEmbeddedModel",
     "PyObjectId",
     "TimestampMixin",
     # Candidate
     "Candidate",
     "CandidateCreate",
     "CandidateMetadata",
+    "CandidateSummary",
     "CandidateUpdate",
     "Certification",
     "ContactInfo",
@@ -127,6 +132,7 @@ __all__ = [
     "Job",
     "JobCreate",
     "JobMetadata",
+    "JobSummary",
     "JobUpdate",
     "Location",
     "SalaryRange",
@@ -143,6 +149,7 @@ __all__ = [
     "Match",
     "MatchCreate",
     "MatchStatus",
+    "MatchRankEntry",
     "MatchSummary",
     "MatchUpdate",
     "RecruiterFeedback",
@@ -131,14 +131,21 @@ class AuditLog(BaseDocument):
 
         name = "audit_logs"
         indexes = [
-            "action",
-            "actor.actor_id",
-            "resource.resource_type",
-            "resource.resource_id",
-            "related_candidate_id",
-            "related_job_id",
-            "compliance_relevant",
-            "created_at",
+            [("action", 1), ("created_at", -1), ("_id", -1)],
+            [("actor.actor_id", 1), ("created_at", -1), ("_id", -1)],
+            [("resource.resource_type", 1), ("created_at", -1), ("_id", -1)],
+            [
+                ("resource.resource_type", 1),
+                ("resource.resource_id", 1),
+                ("created_at", -1),
+                ("_id", -1),
+            ],
+            [("related_candidate_id", 1), ("created_at", -1), ("_id", -1)],
+            [("related_job_id", 1), ("created_at", -1), ("_id", -1)],
+            [("related_match_id", 1), ("created_at", -1), ("_id", -1)],
+            [("compliance_relevant", 1), ("created_at", -1), ("_id", -1)],
+            [("created_at", -1), ("_id", -1)],
+            [("retention_period_days", 1), ("created_at", 1)],
         ]
 
 
@@ -4,11 +4,74 @@ Base model classes for AI-ATS data models.
 Provides common fields and functionality shared across all models.
 """
 
+import sys
+import types
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, timezone
-from typing import Any, Optional
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Literal, Optional, Union, get_args, get_origin
 
+import orjson
 from bson import ObjectId
-from pydantic import BaseModel, ConfigDict, Field
+from bson.errors import InvalidId
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Timestamp shared by every default factory inside a pinned_utc_now() block
+_pinned_now: ContextVar[Optional[datetime]] = ContextVar("pinned_now", default=None)
+
+
+def utc_now() -> datetime:
+    """Current UTC time, or the pinned batch time inside ``pinned_utc_now()``."""
+    pinned = _pinned_now.get()
+    if pinned is not None:
+        return pinned
+    return datetime.now(timezone.utc)
+
+
+@contextmanager
+def pinned_utc_now() -> Iterator[datetime]:
+    """
+    Pin ``utc_now()`` to a single timestamp for the duration of the block.
+
+    Bulk ingestion builds thousands of models that all default their
+    timestamps; pinning reads the clock once and gives the whole batch a
+    consistent time. A nested block keeps the outer block's timestamp.
+    """
+    token = _pinned_now.set(_pinned_now.get() or datetime.now(timezone.utc))
+    try:
+        yield _pinned_now.get()  # type: ignore[misc]
+    finally:
+        _pinned_now.reset(token)
+
+
+@lru_cache(maxsize=4096)
+def normalize_skill_name(name: str) -> str:
+    """
+    Strip and lowercase a skill name, interning the result.
+
+    Skill vocabularies are small and highly repetitive, so the cache turns
+    most calls into a dict lookup and interning lets set-based matching
+    compare by identity.
+    """
+    return sys.intern(name.strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def parse_object_id(value: str) -> ObjectId:
+    """
+    Parse a hex string into an ObjectId.
+
+    Cached because the same ids recur constantly: related ids (job,
+    candidate) across documents loaded in one batch, and the ids passed to
+    repository lookups. ObjectId is immutable, so sharing instances is safe.
+
+    Raises:
+        bson.errors.InvalidId: If ``value`` is not a 24-character hex string.
+    """
+    return ObjectId(value)
 
 
 class PyObjectId(ObjectId):
@@ -36,16 +99,140 @@ class PyObjectId(ObjectId):
         """Validate and convert string to ObjectId."""
         if isinstance(value, ObjectId):
             return value
-        if isinstance(value, str) and ObjectId.is_valid(value):
-            return ObjectId(value)
+        if isinstance(value, str):
+            try:
+                return parse_object_id(value)
+            except InvalidId:
+                pass
         raise ValueError(f"Invalid ObjectId: {value}")
 
 
+# One list[Model] adapter per document class, built on first use
+_LIST_ADAPTERS: dict[type, TypeAdapter] = {}
+
+
+# Per-model {field key: converter} plans used by construct_trusted
+_TRUSTED_PLANS: dict[type, dict[str, Callable[[Any], Any]]] = {}
+
+
+def _trusted_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Build a converter turning a raw stored value into the field's Python type.
+
+    Only nested models and ``date`` fields need work (Mongo returns dicts and
+    datetimes for them); everything else is returned as ``None`` (no-op).
+    """
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) != 1:
+            return None
+        return _trusted_converter(args[0])
+    if origin is list:
+        args = get_args(annotation)
+        inner = _trusted_converter(args[0]) if args else None
+        if inner is None:
+            return None
+        return lambda value: [inner(item) for item in value]
+    if annotation is date:
+        return lambda value: value.date() if isinstance(value, datetime) else value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: (
+            construct_trusted(annotation, value) if isinstance(value, dict) else value
+        )
+    return None
+
+
+def construct_trusted(model_class: type[Any], data: dict[str, Any]) -> Any:
+    """
+    Build ``model_class`` from a stored document without running validation.
+
+    Nested models are rebuilt recursively with ``model_construct`` and
+    ``date`` fields are narrowed back from the datetimes they are stored as.
+    Only use this for documents this application wrote itself.
+    """
+    plan = _TRUSTED_PLANS.get(model_class)
+    if plan is None:
+        plan = {}
+        for name, field in model_class.model_fields.items():
+            converter = _trusted_converter(field.annotation)
+            if converter is not None:
+                plan[field.alias or name] = converter
+        _TRUSTED_PLANS[model_class] = plan
+
+    values = dict(data)
+    for key, converter in plan.items():
+        value = values.get(key)
+        if value is not None:
+            values[key] = converter(value)
+    return model_class.model_construct(**values)
+
+
+# Scalar field types that can never hold a ``date`` once dumped
+_DATE_FREE_TYPES: tuple[type, ...] = (str, int, float, bool, bytes, datetime, ObjectId, Enum)
+
+# Per-class aliases of the fields whose dumped value may contain a ``date``
+_DATE_FIELD_KEYS: dict[type, tuple[str, ...]] = {}
+
+
+def _may_hold_date(annotation: Any, seen: frozenset[type] = frozenset()) -> bool:
+    """
+    Whether a value of ``annotation`` can contain a ``date`` after dumping.
+
+    Conservative: ``Any``, bare containers and unknown types count as yes.
+    """
+    if annotation is date:
+        return True
+    if annotation is type(None):
+        return False
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return False
+    if origin is not None:
+        args = get_args(annotation)
+        return not args or any(_may_hold_date(a, seen) for a in args if a is not Ellipsis)
+    if isinstance(annotation, type):
+        if issubclass(annotation, _DATE_FREE_TYPES):
+            return False
+        if issubclass(annotation, BaseModel):
+            if annotation in seen:
+                return False
+            seen = seen | {annotation}
+            return any(
+                _may_hold_date(field.annotation, seen)
+                for field in annotation.model_fields.values()
+            )
+    return True
+
+
+def _date_field_keys(model_class: type[BaseModel]) -> tuple[str, ...]:
+    """Return (and cache) the dump keys of ``model_class`` that may hold dates."""
+    keys = _DATE_FIELD_KEYS.get(model_class)
+    if keys is None:
+        keys = tuple(
+            field.alias or name
+            for name, field in model_class.model_fields.items()
+            if _may_hold_date(field.annotation, frozenset({model_class}))
+        )
+        _DATE_FIELD_KEYS[model_class] = keys
+    return keys
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        # Embedded models: hand orjson the field values directly
+        return obj.__dict__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class TimestampMixin(BaseModel):
     """Mixin providing timestamp fields for models."""
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
 
 class BaseDocument(TimestampMixin):
@@ -80,12 +267,57 @@ class BaseDocument(TimestampMixin):
             return [BaseDocument._convert_dates(item) for item in obj]
         return obj
 
-    def model_dump_mongo(self) -> dict[str, Any]:
-        """Convert model to MongoDB-compatible dictionary."""
-        data = self.model_dump(by_alias=True, exclude_none=True)
+    @classmethod
+    def from_trusted_dict(cls, document: dict[str, Any]) -> Any:
+        """Build the model from a trusted MongoDB document, skipping validation."""
+        return construct_trusted(cls, document)
+
+    @classmethod
+    def validate_many(cls, documents: list[dict[str, Any]]) -> list[Any]:
+        """
+        Validate a list of raw documents in a single pydantic-core call.
+
+        Equivalent to ``[cls.model_validate(d) for d in documents]`` but runs
+        the loop in Rust via a cached ``TypeAdapter(list[cls])``.
+        """
+        adapter = _LIST_ADAPTERS.get(cls)
+        if adapter is None:
+            adapter = _LIST_ADAPTERS[cls] = TypeAdapter(list[cls])  # type: ignore[valid-type]
+        return adapter.validate_python(documents)
+
+    def model_dump_mongo(self, exclude: Optional[set[str]] = None) -> dict[str, Any]:
+        """
+        Convert model to MongoDB-compatible dictionary.
+
+        Only the fields whose type can contain a ``date`` are walked for
+        conversion; the set of such fields is worked out once per class.
+        ``exclude`` takes field names (``id``, not ``_id``) that the caller
+        is about to overwrite or drop, so they are never serialized.
+        """
+        data = self.model_dump(by_alias=True, exclude_none=True, exclude=exclude)
         if data.get("_id") is None:
             data.pop("_id", None)
-        return self._convert_dates(data)
+        for key in _date_field_keys(type(self)):
+            value = data.get(key)
+            if value is not None:
+                data[key] = self._convert_dates(value)
+        return data
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the document to JSON bytes for API responses.
+
+        Feeds the field values straight to orjson, skipping pydantic's
+        serializer; embedded models are expanded through their ``__dict__``.
+        Only ``id`` is aliased (to ``_id``). Naive datetimes are treated as UTC.
+        """
+        data = dict(self.__dict__)
+        data["_id"] = data.pop("id", None)
+        return orjson.dumps(
+            data,
+            default=_orjson_default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY,
+        )
 
 
 class EmbeddedModel(BaseModel):
@@ -100,3 +332,15 @@ class EmbeddedModel(BaseModel):
         populate_by_name=True,
         use_enum_values=True,
     )
+
+
+class FrozenEmbeddedModel(EmbeddedModel):
+    """
+    Immutable embedded document.
+
+    Use for result objects that are never modified after construction.
+    Fields cannot be reassigned after construction. Instances are only
+    hashable when every field value is; list or dict fields make hash() raise.
+    """
+
+    model_config = ConfigDict(frozen=True)
@@ -8,11 +8,12 @@ skills, work experience, and education.
 from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, PrivateAttr, field_validator
 
-from src.utils.constants import CandidateStatus
+from src.utils.constants import EDUCATION_LEVELS, CandidateStatus
 
 from .base import BaseDocument, EmbeddedModel, PyObjectId
+from .base import normalize_skill_name as _normalize_skill_name
 
 
 class ContactInfo(EmbeddedModel):
@@ -29,6 +30,17 @@ class ContactInfo(EmbeddedModel):
     country: Optional[str] = None
     postal_code: Optional[str] = None
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """
+        Lowercase the whole address.
+
+        EmailStr only lowercases the domain, but candidates are looked up by
+        ``email.lower()``, so a mixed-case local part would never match.
+        """
+        return v.lower()
+
 
 class Skill(EmbeddedModel):
     """Represents a single skill with metadata."""
@@ -43,7 +55,7 @@ class Skill(EmbeddedModel):
     @classmethod
     def normalize_skill_name(cls, v: str) -> str:
         """Normalize skill names to lowercase for consistency."""
-        return v.strip().lower()
+        return _normalize_skill_name(v)
 
     def __hash__(self) -> int:
         return hash(self.name)
@@ -175,6 +187,11 @@ class Candidate(BaseDocument):
     # Deduplication — SHA-256 hashes of every resume file ingested for this candidate
     file_hashes: list[str] = Field(default_factory=list)
 
+    # (source list, its length, skill names) so matching can use set algebra
+    _skill_name_set_cache: Optional[tuple[list[Skill], int, frozenset[str]]] = PrivateAttr(
+        default=None
+    )
+
     @property
     def full_name(self) -> str:
         """Get candidate's full name."""
@@ -192,8 +209,6 @@ class Candidate(BaseDocument):
     @property
     def highest_education_level(self) -> Optional[str]:
         """Get the highest education level achieved."""
-        from src.utils.constants import EDUCATION_LEVELS
-
         if not self.education:
             return None
 
@@ -214,15 +229,37 @@ class Candidate(BaseDocument):
         """Get list of all skill names."""
         return [skill.name for skill in self.skills]
 
+    @property
+    def skill_name_set(self) -> frozenset[str]:
+        """
+        Get the set of skill names for fast membership and intersection tests.
+
+        Cached on the identity and length of ``skills``, so reassigning or
+        appending to the list rebuilds it. Replacing an element in place
+        (``skills[0] = ...``) is not detected; reassign the list instead.
+        """
+        skills = self.skills
+        cache = self._skill_name_set_cache
+        if cache is None or cache[0] is not skills or cache[1] != len(skills):
+            names = frozenset(skill.name for skill in skills)
+            cache = self._skill_name_set_cache = (skills, len(skills), names)
+        return cache[2]
+
     class Settings:
         """MongoDB collection settings."""
 
         name = "candidates"
         indexes = [
             "contact.email",
-            "status",
+            [("status", 1), ("created_at", -1)],
             "metadata.tags",
             "created_at",
+            [
+                ("first_name", "text"),
+                ("last_name", "text"),
+                ("headline", "text"),
+                ("summary", "text"),
+            ],
         ]
 
 
@@ -257,3 +294,19 @@ class CandidateUpdate(BaseModel):
     languages: Optional[list[Language]] = None
     status: Optional[CandidateStatus] = None
     metadata: Optional[CandidateMetadata] = None
+
+
+class CandidateSummary(BaseModel):
+    """Summary view of a candidate for list displays."""
+
+    candidate_id: str
+    first_name: str
+    last_name: str
+    headline: Optional[str] = None
+    status: CandidateStatus
+    created_at: datetime
+
+    @property
+    def full_name(self) -> str:
+        """Get candidate's full name."""
+        return f"{self.first_name} {self.last_name}"
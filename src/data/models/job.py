@@ -5,15 +5,22 @@ Defines the schema for job postings, including requirements,
 qualifications, and matching criteria.
 """
 
+import sys
 from datetime import date, datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 from src.utils.constants import DEFAULT_SCORING_WEIGHTS, JobStatus
 
-from .base import BaseDocument, EmbeddedModel, PyObjectId
+from .base import (
+    BaseDocument,
+    EmbeddedModel,
+    FrozenEmbeddedModel,
+    PyObjectId,
+)
+from .base import normalize_skill_name as _normalize_skill_name
 
 
 class EmploymentType(str, Enum):
@@ -53,16 +60,17 @@ class SalaryRange(EmbeddedModel):
     currency: str = "USD"
     pay_period: str = "yearly"  # yearly, monthly, hourly
 
-    @field_validator("min_amount", "max_amount")
-    @classmethod
-    def validate_amount(cls, v: Optional[float]) -> Optional[float]:
-        """Validate salary amount is positive."""
-        if v is not None and v < 0:
+    @model_validator(mode="after")
+    def validate_amounts(self) -> "SalaryRange":
+        """Validate salary amounts are non-negative."""
+        if (self.min_amount is not None and self.min_amount < 0) or (
+            self.max_amount is not None and self.max_amount < 0
+        ):
             raise ValueError("Salary amount must be non-negative")
-        return v
+        return self
 
 
-class Location(EmbeddedModel):
+class Location(FrozenEmbeddedModel):
     """Physical location for the job."""
 
     city: Optional[str] = None
@@ -71,11 +79,25 @@ class Location(EmbeddedModel):
     postal_code: Optional[str] = None
     timezone: Optional[str] = None
 
+    _display_string: Optional[str] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _build_display_string(self) -> "Location":
+        """Format the display string once; the model is frozen so it cannot go stale."""
+        self._display_string = self._format_display_string()
+        return self
+
+    def _format_display_string(self) -> str:
+        parts = [p for p in (self.city, self.state, self.country) if p]
+        # City/state/country combinations repeat heavily across postings
+        return sys.intern(", ".join(parts)) if parts else "Location not specified"
+
     @property
     def display_string(self) -> str:
         """Get formatted location string."""
-        parts = [p for p in [self.city, self.state, self.country] if p]
-        return ", ".join(parts) if parts else "Location not specified"
+        if self._display_string is None:
+            self._display_string = self._format_display_string()
+        return self._display_string
 
 
 class SkillRequirement(EmbeddedModel):
@@ -92,7 +114,7 @@ class SkillRequirement(EmbeddedModel):
     @classmethod
     def normalize_skill_name(cls, v: str) -> str:
         """Normalize skill names to lowercase."""
-        return v.strip().lower()
+        return _normalize_skill_name(v)
 
 
 class EducationRequirement(EmbeddedModel):
@@ -212,20 +234,44 @@ class Job(BaseDocument):
     # Vector embedding for semantic matching
     embedding_id: Optional[str] = None
 
+    # (source list, its length, all, required, preferred) skill names
+    _skill_names_cache: Optional[
+        tuple[list[SkillRequirement], int, tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+    ] = PrivateAttr(default=None)
+
+    def _skill_name_groups(self) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+        """
+        Return (all, required, preferred) skill names, computed once per list.
+
+        The cache is keyed on the identity and length of ``skill_requirements``
+        so reassigning or appending to it rebuilds the groups. Changes that
+        keep the same list and length are not seen: replacing an element in
+        place (``skill_requirements[0] = ...``) or toggling ``is_required`` on
+        one. Reassign the list after such edits.
+        """
+        reqs = self.skill_requirements
+        cache = self._skill_names_cache
+        if cache is None or cache[0] is not reqs or cache[1] != len(reqs):
+            all_names = tuple(s.name for s in reqs)
+            required = tuple(s.name for s in reqs if s.is_required)
+            preferred = tuple(s.name for s in reqs if not s.is_required)
+            cache = self._skill_names_cache = (reqs, len(reqs), all_names, required, preferred)
+        return cache[2], cache[3], cache[4]
+
     @property
-    def required_skills(self) -> list[str]:
-        """Get list of required skill names."""
-        return [s.name for s in self.skill_requirements if s.is_required]
+    def required_skills(self) -> tuple[str, ...]:
+        """Get the required skill names (cached; see ``_skill_name_groups``)."""
+        return self._skill_name_groups()[1]
 
     @property
-    def preferred_skills(self) -> list[str]:
-        """Get list of preferred (nice-to-have) skill names."""
-        return [s.name for s in self.skill_requirements if not s.is_required]
+    def preferred_skills(self) -> tuple[str, ...]:
+        """Get the preferred (nice-to-have) skill names (cached)."""
+        return self._skill_name_groups()[2]
 
     @property
-    def all_skills(self) -> list[str]:
-        """Get all skill names."""
-        return [s.name for s in self.skill_requirements]
+    def all_skills(self) -> tuple[str, ...]:
+        """Get all skill names (cached)."""
+        return self._skill_name_groups()[0]
 
     @property
     def is_active(self) -> bool:
@@ -261,7 +307,10 @@ class Job(BaseDocument):
 
         name = "jobs"
         indexes = [
-            "status",
+            [("status", 1), ("posted_date", -1), ("closing_date", 1)],
+            [("status", 1), ("created_at", -1)],
+            "skill_requirements.name",
+            [("title", "text"), ("description", "text"), ("company_name", "text")],
             "company_name",
             "employment_type",
             "experience_level",
@@ -322,3 +371,14 @@ class JobUpdate(BaseModel):
     positions_available: Optional[int] = None
     scoring_weights: Optional[ScoringWeights] = None
     metadata: Optional[JobMetadata] = None
+
+
+class JobSummary(BaseModel):
+    """Summary view of a job posting for list displays."""
+
+    job_id: str
+    title: str
+    company_name: str
+    location: Location = Field(default_factory=Location)
+    status: JobStatus
+    posted_date: Optional[datetime] = None
@@ -5,15 +5,20 @@ Defines the schema for candidate-job matches, scoring results,
 and explainability components.
 """
 
-from datetime import datetime, timezone
+import sys
+from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 from src.utils.constants import MatchScoreLevel
 
-from .base import BaseDocument, EmbeddedModel, PyObjectId
+from .base import BaseDocument, EmbeddedModel, FrozenEmbeddedModel, PyObjectId, utc_now
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class MatchStatus(str, Enum):
@@ -41,6 +46,12 @@ class SkillMatch(EmbeddedModel):
     partial_match: bool = False  # True if related skill found
     related_skill: Optional[str] = None  # If partial match, what skill matched
 
+    @field_validator("skill_name")
+    @classmethod
+    def intern_skill_name(cls, v: str) -> str:
+        """Share one string object per skill name across matches."""
+        return sys.intern(v)
+
     @field_validator("match_score", mode="before")
     @classmethod
     def clamp_match_score(cls, v: float) -> float:
@@ -80,7 +91,7 @@ class EducationMatch(EmbeddedModel):
         return max(0.0, min(1.0, float(v)))
 
 
-class SemanticMatch(EmbeddedModel):
+class SemanticMatch(FrozenEmbeddedModel):
     """Results from semantic/embedding-based matching."""
 
     overall_similarity: float = 0.0  # Cosine similarity 0-1
@@ -101,7 +112,7 @@ class SemanticMatch(EmbeddedModel):
         return max(0.0, min(1.0, float(v)))
 
 
-class KeywordMatch(EmbeddedModel):
+class KeywordMatch(FrozenEmbeddedModel):
     """Results from keyword-based matching."""
 
     total_keywords: int = 0
@@ -134,6 +145,9 @@ class ScoreBreakdown(EmbeddedModel):
     keyword_weight: float = 0.05
     keyword_weighted: float = 0.0
 
+    # Sum of the weighted components, cached once the breakdown is built
+    _total_score: Optional[float] = PrivateAttr(default=None)
+
     @field_validator(
         "skills_score", "experience_score", "education_score",
         "semantic_score", "keyword_score",
@@ -143,9 +157,71 @@ class ScoreBreakdown(EmbeddedModel):
     def clamp_component_score(cls, v: float) -> float:
         return max(0.0, min(1.0, float(v)))
 
-    @property
-    def total_score(self) -> float:
-        """Calculate total weighted score."""
+    @model_validator(mode="after")
+    def _compute_weighted(self) -> "ScoreBreakdown":
+        """Fill unset ``*_weighted`` fields from score x weight and cache the total."""
+        fields_set = self.model_fields_set
+        if "skills_weighted" not in fields_set:
+            self.skills_weighted = self.skills_score * self.skills_weight
+        if "experience_weighted" not in fields_set:
+            self.experience_weighted = self.experience_score * self.experience_weight
+        if "education_weighted" not in fields_set:
+            self.education_weighted = self.education_score * self.education_weight
+        if "semantic_weighted" not in fields_set:
+            self.semantic_weighted = self.semantic_score * self.semantic_weight
+        if "keyword_weighted" not in fields_set:
+            self.keyword_weighted = self.keyword_score * self.keyword_weight
+        self._total_score = self._sum_weighted()
+        return self
+
+    @classmethod
+    def from_components(
+        cls,
+        *,
+        skills_score: float,
+        skills_weight: float,
+        experience_score: float,
+        experience_weight: float,
+        education_score: float,
+        education_weight: float,
+        semantic_score: float,
+        semantic_weight: float,
+        keyword_score: float,
+        keyword_weight: float,
+    ) -> "ScoreBreakdown":
+        """
+        Build a breakdown from component scores and weights.
+
+        Fast path for the matching engine: scores are clamped and weighted
+        here and the model is assembled with ``model_construct``, skipping
+        the validator pipeline for inputs that are already plain floats.
+        """
+        skills_score = max(0.0, min(1.0, float(skills_score)))
+        experience_score = max(0.0, min(1.0, float(experience_score)))
+        education_score = max(0.0, min(1.0, float(education_score)))
+        semantic_score = max(0.0, min(1.0, float(semantic_score)))
+        keyword_score = max(0.0, min(1.0, float(keyword_score)))
+        breakdown = cls.model_construct(
+            skills_score=skills_score,
+            skills_weight=skills_weight,
+            skills_weighted=skills_score * skills_weight,
+            experience_score=experience_score,
+            experience_weight=experience_weight,
+            experience_weighted=experience_score * experience_weight,
+            education_score=education_score,
+            education_weight=education_weight,
+            education_weighted=education_score * education_weight,
+            semantic_score=semantic_score,
+            semantic_weight=semantic_weight,
+            semantic_weighted=semantic_score * semantic_weight,
+            keyword_score=keyword_score,
+            keyword_weight=keyword_weight,
+            keyword_weighted=keyword_score * keyword_weight,
+        )
+        breakdown._total_score = breakdown._sum_weighted()
+        return breakdown
+
+    def _sum_weighted(self) -> float:
         return (
             self.skills_weighted
             + self.experience_weighted
@@ -154,8 +230,29 @@ class ScoreBreakdown(EmbeddedModel):
             + self.keyword_weighted
         )
 
+    @property
+    def total_score(self) -> float:
+        """
+        Get total weighted score.
+
+        Cached at construction; build a new breakdown (or use
+        ``model_validate``) rather than mutating component fields.
+        """
+        if self._total_score is None:
+            self._total_score = self._sum_weighted()
+        return self._total_score
+
+
+_WEIGHTED_COMPONENTS = attrgetter(
+    "skills_weighted",
+    "experience_weighted",
+    "education_weighted",
+    "semantic_weighted",
+    "keyword_weighted",
+)
+
 
-class ExplanationFactor(EmbeddedModel):
+class ExplanationFactor(FrozenEmbeddedModel):
     """A single factor contributing to the match explanation."""
 
     factor_name: str
@@ -182,7 +279,7 @@ class Explanation(EmbeddedModel):
 class BiasCheckResult(EmbeddedModel):
     """Results of bias detection check for this match."""
 
-    checked_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    checked_at: datetime = Field(default_factory=utc_now)
     model_version: str = "1.0"
 
     # Bias flags
@@ -204,7 +301,7 @@ class RecruiterFeedback(EmbeddedModel):
     rating: Optional[int] = None  # 1-5 rating
     comments: Optional[str] = None
     decision: Optional[str] = None  # shortlist, reject, etc.
-    feedback_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    feedback_at: datetime = Field(default_factory=utc_now)
 
 
 class Match(BaseDocument):
@@ -212,6 +309,8 @@ class Match(BaseDocument):
     Main match document representing a candidate-job match result.
 
     Stores scoring results, detailed breakdowns, and explanations.
+    ``score_level`` is not derived on validation; call
+    ``calculate_score_level()`` after setting ``overall_score``.
     """
 
     # References
@@ -249,19 +348,20 @@ class Match(BaseDocument):
 
     # Processing Info
     scoring_model_version: str = "1.0"
-    scored_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    @field_validator("overall_score")
-    @classmethod
-    def set_score_level(cls, v: float, info) -> float:
-        """Score level is set separately after validation."""
-        return v
+    scored_at: datetime = Field(default_factory=utc_now)
 
     def calculate_score_level(self) -> MatchScoreLevel:
         """Calculate and update score level from overall score."""
         self.score_level = MatchScoreLevel.from_score(self.overall_score)
         return self.score_level
 
+    @staticmethod
+    def calculate_score_levels_bulk(matches: list["Match"]) -> None:
+        """Calculate and update score levels for many matches in one pass."""
+        levels = MatchScoreLevel.from_scores([m.overall_score for m in matches])
+        for match, level in zip(matches, levels, strict=True):
+            match.score_level = level
+
     @property
     def effective_score(self) -> float:
         """Get the effective score (manual override if present)."""
@@ -275,11 +375,62 @@ class Match(BaseDocument):
     @property
     def skills_match_percentage(self) -> float:
         """Calculate percentage of required skills matched."""
-        required_skills = [s for s in self.skill_matches if s.required]
-        if not required_skills:
+        required = matched = 0
+        for s in self.skill_matches:
+            if s.required:
+                required += 1
+                matched += s.candidate_has_skill
+        if not required:
             return 100.0
-        matched = sum(1 for s in required_skills if s.candidate_has_skill)
-        return (matched / len(required_skills)) * 100
+        return (matched / required) * 100
+
+    @staticmethod
+    def batch_total_scores(matches: list["Match"]) -> "np.ndarray":
+        """
+        Compute ``score_breakdown.total_score`` for many matches at once.
+
+        Returns a float64 array aligned with ``matches``.
+        """
+        import numpy as np
+
+        n = len(matches)
+        components = np.fromiter(
+            (v for m in matches for v in _WEIGHTED_COMPONENTS(m.score_breakdown)),
+            dtype=np.float64,
+            count=n * 5,
+        )
+        return components.reshape(n, 5).sum(axis=1)
+
+    @staticmethod
+    def batch_skills_match_percentage(matches: list["Match"]) -> "np.ndarray":
+        """
+        Compute ``skills_match_percentage`` for many matches at once.
+
+        All skill matches are flattened into two boolean arrays and counted
+        per match with ``np.bincount``. Returns a float64 array aligned with
+        ``matches``.
+        """
+        import numpy as np
+
+        n = len(matches)
+        lengths = np.fromiter((len(m.skill_matches) for m in matches), dtype=np.intp, count=n)
+        total = int(lengths.sum())
+        required = np.fromiter(
+            (s.required for m in matches for s in m.skill_matches), dtype=np.bool_, count=total
+        )
+        has_skill = np.fromiter(
+            (s.candidate_has_skill for m in matches for s in m.skill_matches),
+            dtype=np.bool_,
+            count=total,
+        )
+        owner = np.repeat(np.arange(n), lengths)
+        required_counts = np.bincount(owner, weights=required, minlength=n)
+        matched_counts = np.bincount(owner, weights=required & has_skill, minlength=n)
+        return np.where(
+            required_counts > 0,
+            matched_counts / np.maximum(required_counts, 1) * 100,
+            100.0,
+        )
 
     def add_feedback(
         self,
@@ -298,6 +449,30 @@ class Match(BaseDocument):
             )
         )
 
+    def to_summary(self, candidate_name: str, job_title: str) -> "MatchSummary":
+        """
+        Build the list-view summary for this match.
+
+        Every field is taken from this already-validated document, so the
+        summary is assembled with ``model_construct`` instead of being
+        validated a second time.
+        """
+        explanation = self.explanation
+        return MatchSummary.model_construct(
+            match_id=str(self.id),
+            candidate_id=str(self.candidate_id),
+            candidate_name=candidate_name,
+            job_id=str(self.job_id),
+            job_title=job_title,
+            overall_score=self.overall_score,
+            score_level=MatchScoreLevel(self.score_level),
+            status=MatchStatus(self.status),
+            skills_match_percentage=self.skills_match_percentage,
+            top_strengths=list(explanation.strengths[:3]) if explanation else [],
+            key_gaps=list(explanation.gaps[:3]) if explanation else [],
+            created_at=self.created_at,
+        )
+
     def override_score(self, new_score: float, reason: str) -> None:
         """Manually override the AI-generated score."""
         self.manual_score_override = new_score
@@ -310,10 +485,20 @@ class Match(BaseDocument):
         name = "matches"
         indexes = [
             [("candidate_id", 1), ("job_id", 1)],  # Compound unique index
-            "job_id",
+            [
+                ("job_id", 1),
+                ("overall_score", -1),
+                ("_id", 1),
+                ("status", 1),
+                ("rank", 1),
+                ("candidate_id", 1),
+            ],
+            [("candidate_id", 1), ("overall_score", -1), ("_id", 1)],
+            [("job_id", 1), ("status", 1), ("created_at", -1)],
+            [("job_id", 1), ("score_level", 1), ("overall_score", -1)],
+            [("status", 1), ("created_at", -1)],
+            [("score_level", 1), ("overall_score", -1)],
             "overall_score",
-            "score_level",
-            "status",
             "rank",
             "created_at",
         ]
@@ -349,3 +534,13 @@ class MatchSummary(BaseModel):
     top_strengths: list[str] = Field(default_factory=list)
     key_gaps: list[str] = Field(default_factory=list)
     created_at: datetime
+
+
+class MatchRankEntry(BaseModel):
+    """Score and rank of one match, as read straight from the job's score index."""
+
+    match_id: str
+    candidate_id: str
+    overall_score: float
+    status: MatchStatus
+    rank: Optional[int] = None
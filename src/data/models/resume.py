@@ -5,13 +5,14 @@ Defines the schema for resume documents, including file metadata,
 parsed content, and processing status.
 """
 
-from datetime import datetime, timezone
+import sys
+from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
-from .base import BaseDocument, EmbeddedModel, PyObjectId
+from .base import BaseDocument, EmbeddedModel, PyObjectId, utc_now
 
 
 class ResumeFormat(str, Enum):
@@ -46,7 +47,7 @@ class FileMetadata(EmbeddedModel):
     file_hash: str  # SHA-256 hash for deduplication
     storage_path: str  # Relative path to file storage
     mime_type: Optional[str] = None
-    uploaded_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    uploaded_at: datetime = Field(default_factory=utc_now)
 
     @field_validator("file_size_bytes")
     @classmethod
@@ -80,6 +81,12 @@ class ExtractedEntity(EmbeddedModel):
     confidence: float = 1.0
     context: Optional[str] = None  # Surrounding text for context
 
+    @field_validator("entity_type")
+    @classmethod
+    def intern_entity_type(cls, v: str) -> str:
+        """Entity types come from a small closed set; share one string each."""
+        return sys.intern(v)
+
 
 class ParsedContent(EmbeddedModel):
     """Structured content extracted from the resume."""
@@ -92,6 +99,25 @@ class ParsedContent(EmbeddedModel):
     language: str = "en"  # Detected language
     language_confidence: float = 1.0
 
+    # (entities list, length, {entity_type: entities}) built on first lookup
+    _entities_index: Optional[tuple] = PrivateAttr(default=None)
+
+    def entities_of_type(self, entity_type: str) -> list[ExtractedEntity]:
+        """
+        Get the extracted entities of a given type, e.g. ``"SKILL"``.
+
+        Entities are grouped by type in one pass and the grouping is reused
+        until ``entities`` is reassigned or grows.
+        """
+        entities = self.entities
+        index = self._entities_index
+        if index is None or index[0] is not entities or index[1] != len(entities):
+            groups: dict[str, list[ExtractedEntity]] = {}
+            for entity in entities:
+                groups.setdefault(entity.entity_type, []).append(entity)
+            index = self._entities_index = (entities, len(entities), groups)
+        return list(index[2].get(entity_type, ()))
+
 
 class ProcessingError(EmbeddedModel):
     """Record of a processing error."""
@@ -99,7 +125,7 @@ class ProcessingError(EmbeddedModel):
     stage: str  # e.g., "parsing", "nlp", "embedding"
     error_type: str
     error_message: str
-    occurred_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    occurred_at: datetime = Field(default_factory=utc_now)
     is_recoverable: bool = True
 
 
@@ -3,21 +3,59 @@ Database repositories for AI-ATS data access.
 
 This module provides repository classes for all database collections,
 implementing the repository pattern for clean data access.
+
+Entity repositories are imported lazily (PEP 562) so that importing one
+repository does not pay for building the models and driver imports of
+all the others.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Base repository
-from .base import BaseRepository
+from .base import BaseRepository, BulkWriter, cached_reads
+
+if TYPE_CHECKING:
+    from .audit_repository import AuditRepository, get_audit_repository
+    from .candidate_repository import CandidateRepository, get_candidate_repository
+    from .job_repository import JobRepository, get_job_repository
+    from .match_repository import MatchRepository, get_match_repository
+    from .resume_repository import ResumeRepository, get_resume_repository
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "CandidateRepository": ".candidate_repository",
+    "get_candidate_repository": ".candidate_repository",
+    "ResumeRepository": ".resume_repository",
+    "get_resume_repository": ".resume_repository",
+    "JobRepository": ".job_repository",
+    "get_job_repository": ".job_repository",
+    "MatchRepository": ".match_repository",
+    "get_match_repository": ".match_repository",
+    "AuditRepository": ".audit_repository",
+    "get_audit_repository": ".audit_repository",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import entity repositories on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Entity repositories
-from .candidate_repository import CandidateRepository, get_candidate_repository
-from .resume_repository import ResumeRepository, get_resume_repository
-from .job_repository import JobRepository, get_job_repository
-from .match_repository import MatchRepository, get_match_repository
-from .audit_repository import AuditRepository, get_audit_repository
 
 __all__ = [
     # Base
     "BaseRepository",
+    "BulkWriter",
+    "cached_reads",
     # Candidate
     "CandidateRepository",
     "get_candidate_repository",
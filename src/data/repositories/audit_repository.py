@@ -5,10 +5,16 @@ Provides data access operations for audit log documents,
 supporting compliance, transparency, and system monitoring.
 """
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
 from bson import ObjectId
+from pymongo.write_concern import WriteConcern
 
 from src.data.models.audit import (
     AuditLog,
@@ -16,6 +22,8 @@ from src.data.models.audit import (
     AuditLogQuery,
     AuditSummary,
 )
+from src.data.models.base import utc_now
+from src.utils.config import get_settings
 from src.utils.constants import AuditAction
 from src.utils.logger import get_logger
 
@@ -23,9 +31,101 @@ from .base import BaseRepository
 
 logger = get_logger(__name__)
 
+# A queued audit log and the future its log_async caller is awaiting
+_PendingWrite = tuple[AuditLog, "asyncio.Future[AuditLog]"]
+
+_BIAS_DETECTED = AuditAction.BIAS_DETECTED.value
+_MANUAL_OVERRIDE = AuditAction.MANUAL_OVERRIDE.value
+# Newest first, with _id breaking created_at ties (batched writes share one
+# timestamp) so keyset pagination is deterministic
+_NEWEST_FIRST = [("created_at", -1), ("_id", -1)]
+
+# Actions with dedicated counters in AuditSummary
+_SUMMARY_ACTIONS = frozenset({_BIAS_DETECTED, _MANUAL_OVERRIDE})
+
+_UNACKNOWLEDGED = WriteConcern(w=0)
+
+# AuditLogQuery attribute -> (query key, value conversion); falsy values are skipped
+_SEARCH_FIELDS: tuple[tuple[str, str, Optional[Callable[[Any], Any]]], ...] = (
+    ("action", "action", lambda action: action.value),
+    ("actor_id", "actor.actor_id", None),
+    ("resource_type", "resource.resource_type", None),
+    ("resource_id", "resource.resource_id", None),
+    ("candidate_id", "related_candidate_id", BaseRepository._to_object_id),
+    ("job_id", "related_job_id", BaseRepository._to_object_id),
+    ("compliance_only", "compliance_relevant", None),
+)
+
+# get_summary's $facet stage is constant; only the leading $match varies
+_SUMMARY_FACET_STAGE: dict[str, Any] = {
+    "$facet": {
+        "totals": [
+            {
+                "$group": {
+                    "_id": None,
+                    "total_actions": {"$sum": 1},
+                    "ai_decisions_count": {
+                        "$sum": {"$cond": [{"$ne": ["$ai_decision", None]}, 1, 0]}
+                    },
+                    "manual_overrides_count": {
+                        "$sum": {"$cond": [{"$eq": ["$action", _MANUAL_OVERRIDE]}, 1, 0]}
+                    },
+                    "bias_detections_count": {
+                        "$sum": {"$cond": [{"$eq": ["$action", _BIAS_DETECTED]}, 1, 0]}
+                    },
+                    "compliance_events_count": {
+                        "$sum": {"$cond": ["$compliance_relevant", 1, 0]}
+                    },
+                }
+            }
+        ],
+        "by_action": [{"$group": {"_id": "$action", "count": {"$sum": 1}}}],
+    }
+}
+
 
 class AuditRepository(BaseRepository[AuditLog]):
-    """Repository for audit log document operations."""
+    """
+    Repository for audit log document operations.
+
+    List methods accept a ``projection``; pass ``LIST_PROJECTION`` for
+    index/list views that only show summary columns.
+    """
+
+    # Drops the bulky detail payloads. Listed logs keep their defaults for
+    # these fields, so is_ai_action / involves_bias are not meaningful on them.
+    LIST_PROJECTION: dict[str, Any] = {
+        "changes": 0,
+        "ai_decision": 0,
+        "bias_audit": 0,
+        "context": 0,
+    }
+
+    # Async write batching (DB_AUDIT_BATCH_WRITES); off unless configured
+    _batch_writes: bool = False
+    _batch_max_size: int = 500
+    _batch_interval: float = 0.02
+    # Per event loop: asyncio queues and tasks are bound to the loop that made them
+    _write_queues: Optional[
+        dict[asyncio.AbstractEventLoop, tuple["asyncio.Queue[_PendingWrite]", "asyncio.Task[None]"]]
+    ] = None
+
+    # Fire-and-forget writes for routine events (DB_AUDIT_UNACKNOWLEDGED_WRITES)
+    _unacknowledged_writes: bool = False
+
+    # get_summary result cache: (start, end) -> (stored_at, summary)
+    SUMMARY_CACHE_TTL: float = 10.0
+    SUMMARY_CACHE_MAXSIZE: int = 128
+    _summary_cache: Optional[OrderedDict[tuple, tuple[float, AuditSummary]]] = None
+    _summary_locks: Optional[dict[asyncio.AbstractEventLoop, asyncio.Lock]] = None
+
+    def __init__(self) -> None:
+        super().__init__()
+        db_settings = get_settings().database
+        self._batch_writes = db_settings.audit_batch_writes
+        self._batch_max_size = db_settings.audit_batch_max_size
+        self._batch_interval = db_settings.audit_batch_interval_ms / 1000
+        self._unacknowledged_writes = db_settings.audit_unacknowledged_writes
 
     @property
     def collection_name(self) -> str:
@@ -41,37 +141,55 @@ class AuditRepository(BaseRepository[AuditLog]):
 
     def log(self, data: AuditLogCreate) -> AuditLog:
         """Create an audit log entry from a create schema."""
-        audit_log = AuditLog(
-            action=data.action,
-            action_description=data.action_description,
-            actor=data.actor if data.actor else None,
-            resource=data.resource,
-            changes=data.changes,
-            ai_decision=data.ai_decision,
-            bias_audit=data.bias_audit,
-            context=data.context,
-            related_candidate_id=(
-                self._to_object_id(data.related_candidate_id)
-                if data.related_candidate_id
-                else None
-            ),
-            related_job_id=(
-                self._to_object_id(data.related_job_id)
-                if data.related_job_id
-                else None
-            ),
-            related_match_id=(
-                self._to_object_id(data.related_match_id)
-                if data.related_match_id
-                else None
-            ),
-            compliance_relevant=data.compliance_relevant,
-        )
-        return self.create(audit_log)
+        audit_log = self._build_audit_log(data)
+        audit_log = self.create(audit_log, write_concern=self._write_concern_for(audit_log))
+        self._invalidate_summary_for(audit_log)
+        return audit_log
 
     async def log_async(self, data: AuditLogCreate) -> AuditLog:
-        """Create an audit log entry from a create schema asynchronously."""
-        audit_log = AuditLog(
+        """
+        Create an audit log entry from a create schema asynchronously.
+
+        With ``DB_AUDIT_BATCH_WRITES`` enabled, routine entries are queued
+        and written together with other concurrent entries via
+        ``insert_many``; the call still returns only after its batch has
+        been sent.
+        """
+        audit_log = self._build_audit_log(data)
+        if not self._batch_writes or not self._is_routine(audit_log):
+            audit_log = await self.create_async(
+                audit_log, write_concern=self._write_concern_for(audit_log)
+            )
+        else:
+            future: asyncio.Future[AuditLog] = asyncio.get_running_loop().create_future()
+            self._get_write_queue().put_nowait((audit_log, future))
+            audit_log = await future
+        self._invalidate_summary_for(audit_log)
+        return audit_log
+
+    @staticmethod
+    def _is_routine(audit_log: AuditLog) -> bool:
+        """Routine events are neither compliance-relevant nor summary counters."""
+        return not audit_log.compliance_relevant and audit_log.action not in _SUMMARY_ACTIONS
+
+    def _write_concern_for(self, audit_log: AuditLog) -> Optional[WriteConcern]:
+        """Unacknowledged writes for routine events when enabled, else default."""
+        if self._unacknowledged_writes and self._is_routine(audit_log):
+            return _UNACKNOWLEDGED
+        return None
+
+    def _invalidate_summary_for(self, audit_log: AuditLog) -> None:
+        """
+        Drop cached summaries when a log changes a tracked counter.
+
+        Plain action counts are allowed to lag by up to the cache TTL.
+        """
+        if audit_log.compliance_relevant or audit_log.action in _SUMMARY_ACTIONS:
+            self.invalidate_summary_cache()
+
+    def _build_audit_log(self, data: AuditLogCreate) -> AuditLog:
+        """Build an AuditLog document from a create schema."""
+        return AuditLog(
             action=data.action,
             action_description=data.action_description,
             actor=data.actor if data.actor else None,
@@ -97,7 +215,82 @@ class AuditRepository(BaseRepository[AuditLog]):
             ),
             compliance_relevant=data.compliance_relevant,
         )
-        return await self.create_async(audit_log)
+
+    # -------------------------------------------------------------------------
+    # Write Batching
+    # -------------------------------------------------------------------------
+
+    def _get_write_queue(self) -> "asyncio.Queue[_PendingWrite]":
+        """Return the running loop's pending-write queue, starting its flusher if needed."""
+        loop = asyncio.get_running_loop()
+        if self._write_queues is None:
+            self._write_queues = {}
+        for other in [other for other in list(self._write_queues) if other.is_closed()]:
+            self._write_queues.pop(other, None)
+
+        queue, flusher = self._write_queues.get(loop, (None, None))
+        if queue is None:
+            queue = asyncio.Queue()
+        if flusher is None or flusher.done():
+            flusher = loop.create_task(self._flush_writes(queue))
+        self._write_queues[loop] = (queue, flusher)
+        return queue
+
+    async def _flush_writes(self, queue: "asyncio.Queue[_PendingWrite]") -> None:
+        """Drain queued audit logs into ``insert_many`` batches."""
+        loop = asyncio.get_running_loop()
+        batch: list[_PendingWrite] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self._batch_interval
+                while len(batch) < self._batch_max_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await self._insert_batch(batch)
+                batch = []
+        finally:
+            # Callers awaiting a log that will never be written must not hang
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            error = RuntimeError("Audit log writer stopped before the entry was written")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+    async def _insert_batch(self, batch: list["_PendingWrite"]) -> None:
+        """Insert one batch and resolve each caller's future."""
+        now = utc_now()
+        documents = []
+        for audit_log, _ in batch:
+            document = self._to_document(audit_log, self._TIMESTAMP_FIELDS)
+            document["created_at"] = now
+            document["updated_at"] = now
+            documents.append(document)
+
+        collection = self._get_async_collection()
+        if self._unacknowledged_writes:
+            # Batches only ever hold routine events
+            collection = collection.with_options(write_concern=_UNACKNOWLEDGED)
+        try:
+            result = await collection.insert_many(documents, ordered=False)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (audit_log, future), inserted_id in zip(batch, result.inserted_ids, strict=True):
+            audit_log.id = inserted_id
+            audit_log.created_at = audit_log.updated_at = now
+            if not future.done():
+                future.set_result(audit_log)
+        logger.debug(f"Created {len(batch)} {self.collection_name} documents in one batch")
 
     # -------------------------------------------------------------------------
     # Query Operations
@@ -108,14 +301,16 @@ class AuditRepository(BaseRepository[AuditLog]):
         action: AuditAction,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get audit logs by action type."""
         return self.find(
-            {"action": action.value},
+            self._after({"action": action.value}, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     async def get_by_action_async(
@@ -123,14 +318,16 @@ class AuditRepository(BaseRepository[AuditLog]):
         action: AuditAction,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get audit logs by action type asynchronously."""
         return await self.find_async(
-            {"action": action.value},
+            self._after({"action": action.value}, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     def get_by_actor(
@@ -138,14 +335,16 @@ class AuditRepository(BaseRepository[AuditLog]):
         actor_id: str,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get audit logs by actor ID."""
         return self.find(
-            {"actor.actor_id": actor_id},
+            self._after({"actor.actor_id": actor_id}, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     async def get_by_actor_async(
@@ -153,14 +352,16 @@ class AuditRepository(BaseRepository[AuditLog]):
         actor_id: str,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get audit logs by actor ID asynchronously."""
         return await self.find_async(
-            {"actor.actor_id": actor_id},
+            self._after({"actor.actor_id": actor_id}, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     def get_by_resource(
@@ -169,17 +370,17 @@ class AuditRepository(BaseRepository[AuditLog]):
         resource_id: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get audit logs by resource type and optionally ID."""
-        query: dict[str, Any] = {"resource.resource_type": resource_type}
-        if resource_id:
-            query["resource.resource_id"] = resource_id
+        query = self._build_resource_query(resource_type, resource_id)
         return self.find(
-            query,
+            self._after(query, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     async def get_by_resource_async(
@@ -188,17 +389,17 @@ class AuditRepository(BaseRepository[AuditLog]):
         resource_id: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get audit logs by resource type and optionally ID asynchronously."""
-        query: dict[str, Any] = {"resource.resource_type": resource_type}
-        if resource_id:
-            query["resource.resource_id"] = resource_id
+        query = self._build_resource_query(resource_type, resource_id)
         return await self.find_async(
-            query,
+            self._after(query, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     def get_for_candidate(
@@ -206,14 +407,16 @@ class AuditRepository(BaseRepository[AuditLog]):
         candidate_id: str | ObjectId,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get all audit logs related to a candidate."""
         return self.find(
-            {"related_candidate_id": self._to_object_id(candidate_id)},
+            self._after({"related_candidate_id": self._to_object_id(candidate_id)}, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     async def get_for_candidate_async(
@@ -221,14 +424,16 @@ class AuditRepository(BaseRepository[AuditLog]):
         candidate_id: str | ObjectId,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get all audit logs related to a candidate asynchronously."""
         return await self.find_async(
-            {"related_candidate_id": self._to_object_id(candidate_id)},
+            self._after({"related_candidate_id": self._to_object_id(candidate_id)}, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     def get_for_job(
@@ -236,14 +441,16 @@ class AuditRepository(BaseRepository[AuditLog]):
         job_id: str | ObjectId,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get all audit logs related to a job."""
         return self.find(
-            {"related_job_id": self._to_object_id(job_id)},
+            self._after({"related_job_id": self._to_object_id(job_id)}, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     async def get_for_job_async(
@@ -251,14 +458,16 @@ class AuditRepository(BaseRepository[AuditLog]):
         job_id: str | ObjectId,
         skip: int = 0,
         limit: int = 100,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get all audit logs related to a job asynchronously."""
         return await self.find_async(
-            {"related_job_id": self._to_object_id(job_id)},
+            self._after({"related_job_id": self._to_object_id(job_id)}, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     def get_compliance_logs(
@@ -267,23 +476,17 @@ class AuditRepository(BaseRepository[AuditLog]):
         limit: int = 100,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get compliance-relevant audit logs."""
-        query: dict[str, Any] = {"compliance_relevant": True}
-
-        if start_date or end_date:
-            query["created_at"] = {}
-            if start_date:
-                query["created_at"]["$gte"] = start_date
-            if end_date:
-                query["created_at"]["$lte"] = end_date
-
+        query = self._compliance_query(start_date, end_date)
         return self.find(
-            query,
+            self._after(query, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     async def get_compliance_logs_async(
@@ -292,23 +495,17 @@ class AuditRepository(BaseRepository[AuditLog]):
         limit: int = 100,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get compliance-relevant audit logs asynchronously."""
-        query: dict[str, Any] = {"compliance_relevant": True}
-
-        if start_date or end_date:
-            query["created_at"] = {}
-            if start_date:
-                query["created_at"]["$gte"] = start_date
-            if end_date:
-                query["created_at"]["$lte"] = end_date
-
+        query = self._compliance_query(start_date, end_date)
         return await self.find_async(
-            query,
+            self._after(query, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     def get_bias_detections(
@@ -317,23 +514,17 @@ class AuditRepository(BaseRepository[AuditLog]):
         limit: int = 100,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get bias detection audit logs."""
-        query: dict[str, Any] = {"action": AuditAction.BIAS_DETECTED.value}
-
-        if start_date or end_date:
-            query["created_at"] = {}
-            if start_date:
-                query["created_at"]["$gte"] = start_date
-            if end_date:
-                query["created_at"]["$lte"] = end_date
-
+        query = self._bias_query(start_date, end_date)
         return self.find(
-            query,
+            self._after(query, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
     async def get_bias_detections_async(
@@ -342,108 +533,175 @@ class AuditRepository(BaseRepository[AuditLog]):
         limit: int = 100,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
     ) -> list[AuditLog]:
         """Get bias detection audit logs asynchronously."""
-        query: dict[str, Any] = {"action": AuditAction.BIAS_DETECTED.value}
-
-        if start_date or end_date:
-            query["created_at"] = {}
-            if start_date:
-                query["created_at"]["$gte"] = start_date
-            if end_date:
-                query["created_at"]["$lte"] = end_date
-
+        query = self._bias_query(start_date, end_date)
         return await self.find_async(
-            query,
+            self._after(query, after),
             skip=skip,
             limit=limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
-    def search(self, query_params: AuditLogQuery) -> list[AuditLog]:
-        """Search audit logs with multiple filters."""
-        query: dict[str, Any] = {}
-
-        if query_params.action:
-            query["action"] = query_params.action.value
-
-        if query_params.actor_id:
-            query["actor.actor_id"] = query_params.actor_id
-
-        if query_params.resource_type:
-            query["resource.resource_type"] = query_params.resource_type
+    def count_compliance_logs(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """
+        Count compliance-relevant audit logs.
 
-        if query_params.resource_id:
-            query["resource.resource_id"] = query_params.resource_id
+        The filter only touches keys of the partial compliance index, so
+        MongoDB counts from the index without fetching any documents.
+        """
+        return self.count(self._compliance_query(start_date, end_date))
 
-        if query_params.candidate_id:
-            query["related_candidate_id"] = self._to_object_id(
-                query_params.candidate_id
-            )
+    async def count_compliance_logs_async(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """Count compliance-relevant audit logs asynchronously."""
+        return await self.count_async(self._compliance_query(start_date, end_date))
 
-        if query_params.job_id:
-            query["related_job_id"] = self._to_object_id(query_params.job_id)
+    def count_bias_detections(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """Count bias detection audit logs from the (action, created_at) index."""
+        return self.count(self._bias_query(start_date, end_date))
 
-        if query_params.compliance_only:
-            query["compliance_relevant"] = True
+    async def count_bias_detections_async(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """Count bias detection audit logs asynchronously."""
+        return await self.count_async(self._bias_query(start_date, end_date))
 
-        if query_params.start_date or query_params.end_date:
-            query["created_at"] = {}
-            if query_params.start_date:
-                query["created_at"]["$gte"] = query_params.start_date
-            if query_params.end_date:
-                query["created_at"]["$lte"] = query_params.end_date
+    def search(
+        self,
+        query_params: AuditLogQuery,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
+    ) -> list[AuditLog]:
+        """Search audit logs with multiple filters."""
+        query = self._build_search_query(query_params)
 
         return self.find(
-            query,
+            self._after(query, after),
             skip=query_params.offset,
             limit=query_params.limit,
-            sort_by="created_at",
-            sort_order=-1,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
         )
 
-    async def search_async(self, query_params: AuditLogQuery) -> list[AuditLog]:
+    async def search_async(
+        self,
+        query_params: AuditLogQuery,
+        projection: Optional[dict[str, Any]] = None,
+        after: Optional[tuple[datetime, ObjectId]] = None,
+    ) -> list[AuditLog]:
         """Search audit logs with multiple filters asynchronously."""
-        query: dict[str, Any] = {}
-
-        if query_params.action:
-            query["action"] = query_params.action.value
+        query = self._build_search_query(query_params)
 
-        if query_params.actor_id:
-            query["actor.actor_id"] = query_params.actor_id
+        return await self.find_async(
+            self._after(query, after),
+            skip=query_params.offset,
+            limit=query_params.limit,
+            sort_by=_NEWEST_FIRST,
+            projection=projection,
+        )
 
-        if query_params.resource_type:
-            query["resource.resource_type"] = query_params.resource_type
+    # -------------------------------------------------------------------------
+    # Query Builders
+    # -------------------------------------------------------------------------
 
-        if query_params.resource_id:
-            query["resource.resource_id"] = query_params.resource_id
+    @staticmethod
+    def _date_range(
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> dict[str, datetime]:
+        """Build a ``created_at`` range condition; empty when unbounded."""
+        created_at: dict[str, datetime] = {}
+        if start_date:
+            created_at["$gte"] = start_date
+        if end_date:
+            created_at["$lte"] = end_date
+        return created_at
+
+    @staticmethod
+    def _after(
+        query: dict[str, Any], after: Optional[tuple[datetime, ObjectId]]
+    ) -> dict[str, Any]:
+        """
+        Restrict ``query`` to logs older than the ``(created_at, _id)`` cursor.
 
-        if query_params.candidate_id:
-            query["related_candidate_id"] = self._to_object_id(
-                query_params.candidate_id
-            )
+        Keyset pagination: pass the last log of the previous page as
+        ``after=(log.created_at, log.id)`` instead of growing ``skip``, so
+        each page is an index seek rather than a scan of all earlier pages.
+        """
+        if after is None:
+            return query
+        created_at, last_id = after
+        keyset = {
+            "$or": [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": last_id}},
+            ]
+        }
+        return {"$and": [query, keyset]} if query else keyset
+
+    @staticmethod
+    def _compliance_query(
+        start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> dict[str, Any]:
+        """Build the filter for compliance-relevant logs in a date range."""
+        query: dict[str, Any] = {"compliance_relevant": True}
+        created_at = AuditRepository._date_range(start_date, end_date)
+        if created_at:
+            query["created_at"] = created_at
+        return query
+
+    @staticmethod
+    def _bias_query(
+        start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> dict[str, Any]:
+        """Build the filter for bias detection logs in a date range."""
+        query: dict[str, Any] = {"action": _BIAS_DETECTED}
+        created_at = AuditRepository._date_range(start_date, end_date)
+        if created_at:
+            query["created_at"] = created_at
+        return query
+
+    @staticmethod
+    def _build_resource_query(
+        resource_type: str, resource_id: Optional[str]
+    ) -> dict[str, Any]:
+        """Build the filter for resource lookups."""
+        query: dict[str, Any] = {"resource.resource_type": resource_type}
+        if resource_id:
+            query["resource.resource_id"] = resource_id
+        return query
 
-        if query_params.job_id:
-            query["related_job_id"] = self._to_object_id(query_params.job_id)
+    def _build_search_query(self, query_params: AuditLogQuery) -> dict[str, Any]:
+        """Build the filter for ``search`` / ``search_async``."""
+        query: dict[str, Any] = {}
 
-        if query_params.compliance_only:
-            query["compliance_relevant"] = True
+        for attr, key, convert in _SEARCH_FIELDS:
+            value = getattr(query_params, attr)
+            if value:
+                query[key] = convert(value) if convert else value
 
-        if query_params.start_date or query_params.end_date:
-            query["created_at"] = {}
-            if query_params.start_date:
-                query["created_at"]["$gte"] = query_params.start_date
-            if query_params.end_date:
-                query["created_at"]["$lte"] = query_params.end_date
+        created_at = self._date_range(query_params.start_date, query_params.end_date)
+        if created_at:
+            query["created_at"] = created_at
 
-        return await self.find_async(
-            query,
-            skip=query_params.offset,
-            limit=query_params.limit,
-            sort_by="created_at",
-            sort_order=-1,
-        )
+        return query
 
     # -------------------------------------------------------------------------
     # Aggregation Operations
@@ -454,91 +712,23 @@ class AuditRepository(BaseRepository[AuditLog]):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> AuditSummary:
-        """Get summary statistics for audit logs."""
-        collection = self._get_sync_collection()
+        """
+        Get summary statistics for audit logs.
 
-        match_stage: dict[str, Any] = {}
-        if start_date or end_date:
-            match_stage["created_at"] = {}
-            if start_date:
-                match_stage["created_at"]["$gte"] = start_date
-            if end_date:
-                match_stage["created_at"]["$lte"] = end_date
-
-        pipeline = []
-        if match_stage:
-            pipeline.append({"$match": match_stage})
-
-        pipeline.extend(
-            [
-                {
-                    "$group": {
-                        "_id": None,
-                        "total_actions": {"$sum": 1},
-                        "ai_decisions_count": {
-                            "$sum": {"$cond": [{"$ne": ["$ai_decision", None]}, 1, 0]}
-                        },
-                        "manual_overrides_count": {
-                            "$sum": {
-                                "$cond": [
-                                    {
-                                        "$eq": [
-                                            "$action",
-                                            AuditAction.MANUAL_OVERRIDE.value,
-                                        ]
-                                    },
-                                    1,
-                                    0,
-                                ]
-                            }
-                        },
-                        "bias_detections_count": {
-                            "$sum": {
-                                "$cond": [
-                                    {
-                                        "$eq": [
-                                            "$action",
-                                            AuditAction.BIAS_DETECTED.value,
-                                        ]
-                                    },
-                                    1,
-                                    0,
-                                ]
-                            }
-                        },
-                        "compliance_events_count": {
-                            "$sum": {"$cond": ["$compliance_relevant", 1, 0]}
-                        },
-                    }
-                }
-            ]
-        )
+        Results are cached for ``SUMMARY_CACHE_TTL`` seconds per exact date
+        range so polling dashboards share one aggregation.
+        """
+        key = (start_date, end_date)
+        cached = self._get_cached_summary(key)
+        if cached is not None:
+            return cached
 
+        collection = self._get_sync_collection()
+        pipeline = self._build_summary_pipeline(start_date, end_date)
         results = list(collection.aggregate(pipeline))
-
-        # Get action counts
-        action_pipeline = []
-        if match_stage:
-            action_pipeline.append({"$match": match_stage})
-        action_pipeline.append({"$group": {"_id": "$action", "count": {"$sum": 1}}})
-
-        action_results = list(collection.aggregate(action_pipeline))
-        actions_by_type = {r["_id"]: r["count"] for r in action_results}
-
-        if results:
-            result = results[0]
-            return AuditSummary(
-                total_actions=result["total_actions"],
-                actions_by_type=actions_by_type,
-                ai_decisions_count=result["ai_decisions_count"],
-                manual_overrides_count=result["manual_overrides_count"],
-                bias_detections_count=result["bias_detections_count"],
-                compliance_events_count=result["compliance_events_count"],
-                period_start=start_date,
-                period_end=end_date,
-            )
-
-        return AuditSummary(period_start=start_date, period_end=end_date)
+        summary = self._to_summary(results, start_date, end_date)
+        self._store_summary(key, summary)
+        return summary
 
     async def get_summary_async(
         self,
@@ -546,92 +736,113 @@ class AuditRepository(BaseRepository[AuditLog]):
         end_date: Optional[datetime] = None,
     ) -> AuditSummary:
         """Get summary statistics for audit logs asynchronously."""
-        collection = self._get_async_collection()
-
-        match_stage: dict[str, Any] = {}
-        if start_date or end_date:
-            match_stage["created_at"] = {}
-            if start_date:
-                match_stage["created_at"]["$gte"] = start_date
-            if end_date:
-                match_stage["created_at"]["$lte"] = end_date
-
-        pipeline = []
-        if match_stage:
-            pipeline.append({"$match": match_stage})
-
-        pipeline.extend(
-            [
-                {
-                    "$group": {
-                        "_id": None,
-                        "total_actions": {"$sum": 1},
-                        "ai_decisions_count": {
-                            "$sum": {"$cond": [{"$ne": ["$ai_decision", None]}, 1, 0]}
-                        },
-                        "manual_overrides_count": {
-                            "$sum": {
-                                "$cond": [
-                                    {
-                                        "$eq": [
-                                            "$action",
-                                            AuditAction.MANUAL_OVERRIDE.value,
-                                        ]
-                                    },
-                                    1,
-                                    0,
-                                ]
-                            }
-                        },
-                        "bias_detections_count": {
-                            "$sum": {
-                                "$cond": [
-                                    {
-                                        "$eq": [
-                                            "$action",
-                                            AuditAction.BIAS_DETECTED.value,
-                                        ]
-                                    },
-                                    1,
-                                    0,
-                                ]
-                            }
-                        },
-                        "compliance_events_count": {
-                            "$sum": {"$cond": ["$compliance_relevant", 1, 0]}
-                        },
-                    }
-                }
-            ]
-        )
-
-        results = await collection.aggregate(pipeline).to_list(length=1)
-
-        # Get action counts
-        action_pipeline = []
-        if match_stage:
-            action_pipeline.append({"$match": match_stage})
-        action_pipeline.append({"$group": {"_id": "$action", "count": {"$sum": 1}}})
+        key = (start_date, end_date)
+        cached = self._get_cached_summary(key)
+        if cached is not None:
+            return cached
+
+        async with self._get_summary_lock():
+            # Another task may have filled the cache while we waited
+            cached = self._get_cached_summary(key)
+            if cached is not None:
+                return cached
+
+            collection = self._get_async_collection()
+            pipeline = self._build_summary_pipeline(start_date, end_date)
+            cursor = await collection.aggregate(pipeline)
+            results = await cursor.to_list(length=1)
+            summary = self._to_summary(results, start_date, end_date)
+            self._store_summary(key, summary)
+            return summary
+
+    def invalidate_summary_cache(self) -> None:
+        """Drop all cached summaries."""
+        if self._summary_cache is not None:
+            self._summary_cache.clear()
+
+    def _get_summary_lock(self) -> asyncio.Lock:
+        """Return the running loop's summary lock (asyncio locks are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        if self._summary_locks is None:
+            self._summary_locks = {}
+        for other in [other for other in list(self._summary_locks) if other.is_closed()]:
+            self._summary_locks.pop(other, None)
+        return self._summary_locks.setdefault(loop, asyncio.Lock())
+
+    def _get_cached_summary(
+        self, key: tuple[Optional[datetime], Optional[datetime]]
+    ) -> Optional[AuditSummary]:
+        """Return a fresh cached summary for ``key``, or None."""
+        if self._summary_cache is None:
+            return None
+        entry = self._summary_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, summary = entry
+        if time.monotonic() - stored_at > self.SUMMARY_CACHE_TTL:
+            del self._summary_cache[key]
+            return None
+        self._summary_cache.move_to_end(key)
+        return summary.model_copy()
+
+    def _store_summary(
+        self,
+        key: tuple[Optional[datetime], Optional[datetime]],
+        summary: AuditSummary,
+    ) -> None:
+        """Cache ``summary`` under ``key``, evicting the oldest entry if full."""
+        if self.SUMMARY_CACHE_TTL <= 0:
+            return
+        if self._summary_cache is None:
+            self._summary_cache = OrderedDict()
+        self._summary_cache[key] = (time.monotonic(), summary)
+        self._summary_cache.move_to_end(key)
+        if len(self._summary_cache) > self.SUMMARY_CACHE_MAXSIZE:
+            self._summary_cache.popitem(last=False)
+
+    @staticmethod
+    def _build_summary_pipeline(
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> list[dict[str, Any]]:
+        """
+        Build a single-pass summary pipeline.
 
-        action_results = await collection.aggregate(action_pipeline).to_list(
-            length=None
+        One ``$facet`` computes the totals and the per-action counts from
+        the same matched documents, so the collection is scanned once.
+        """
+        pipeline: list[dict[str, Any]] = []
+        created_at = AuditRepository._date_range(start_date, end_date)
+        if created_at:
+            pipeline.append({"$match": {"created_at": created_at}})
+
+        pipeline.append(_SUMMARY_FACET_STAGE)
+        return pipeline
+
+    @staticmethod
+    def _to_summary(
+        results: list[dict[str, Any]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> AuditSummary:
+        """Convert the ``$facet`` output into an AuditSummary."""
+        facets = results[0] if results else {}
+        totals = facets.get("totals") or []
+        if not totals:
+            return AuditSummary(period_start=start_date, period_end=end_date)
+
+        result = totals[0]
+        actions_by_type = {r["_id"]: r["count"] for r in facets.get("by_action", [])}
+        return AuditSummary(
+            total_actions=result["total_actions"],
+            actions_by_type=actions_by_type,
+            ai_decisions_count=result["ai_decisions_count"],
+            manual_overrides_count=result["manual_overrides_count"],
+            bias_detections_count=result["bias_detections_count"],
+            compliance_events_count=result["compliance_events_count"],
+            period_start=start_date,
+            period_end=end_date,
         )
-        actions_by_type = {r["_id"]: r["count"] for r in action_results}
-
-        if results:
-            result = results[0]
-            return AuditSummary(
-                total_actions=result["total_actions"],
-                actions_by_type=actions_by_type,
-                ai_decisions_count=result["ai_decisions_count"],
-                manual_overrides_count=result["manual_overrides_count"],
-                bias_detections_count=result["bias_detections_count"],
-                compliance_events_count=result["compliance_events_count"],
-                period_start=start_date,
-                period_end=end_date,
-            )
-
-        return AuditSummary(period_start=start_date, period_end=end_date)
 
     # -------------------------------------------------------------------------
     # Cleanup Operations
@@ -644,78 +855,59 @@ class AuditRepository(BaseRepository[AuditLog]):
         Returns the number of deleted documents.
         """
         collection = self._get_sync_collection()
-
-        # Calculate cutoff date based on retention period
-        # Default is 7 years (2555 days)
-        pipeline = [
-            {
-                "$match": {
-                    "$expr": {
-                        "$lt": [
-                            "$created_at",
-                            {
-                                "$subtract": [
-                                    datetime.now(timezone.utc),
-                                    {"$multiply": ["$retention_period_days", 86400000]},
-                                ]
-                            },
-                        ]
-                    }
-                }
-            },
-            {"$project": {"_id": 1}},
-        ]
-
-        expired_ids = [doc["_id"] for doc in collection.aggregate(pipeline)]
-
-        if expired_ids:
-            result = collection.delete_many({"_id": {"$in": expired_ids}})
-            logger.info(f"Cleaned up {result.deleted_count} expired audit logs")
-            return result.deleted_count
-
-        return 0
+        now = utc_now()
+        deleted = 0
+        for days in collection.distinct("retention_period_days"):
+            if days is None:
+                continue
+            result = collection.delete_many(self._expired_filter(days, now))
+            deleted += result.deleted_count
+        self._evict()
+        if deleted:
+            logger.info(f"Cleaned up {deleted} expired audit logs")
+        return deleted
 
     async def cleanup_expired_async(self) -> int:
         """Delete audit logs past their retention period asynchronously."""
         collection = self._get_async_collection()
+        now = utc_now()
+        deleted = 0
+        for days in await collection.distinct("retention_period_days"):
+            if days is None:
+                continue
+            result = await collection.delete_many(self._expired_filter(days, now))
+            deleted += result.deleted_count
+        self._evict()
+        if deleted:
+            logger.info(f"Cleaned up {deleted} expired audit logs")
+        return deleted
+
+    @staticmethod
+    def _expired_filter(retention_days: int, now: datetime) -> dict[str, Any]:
+        """
+        Filter matching logs of one retention bucket older than its cutoff.
 
-        pipeline = [
-            {
-                "$match": {
-                    "$expr": {
-                        "$lt": [
-                            "$created_at",
-                            {
-                                "$subtract": [
-                                    datetime.now(timezone.utc),
-                                    {"$multiply": ["$retention_period_days", 86400000]},
-                                ]
-                            },
-                        ]
-                    }
-                }
-            },
-            {"$project": {"_id": 1}},
-        ]
-
-        expired_docs = await collection.aggregate(pipeline).to_list(length=None)
-        expired_ids = [doc["_id"] for doc in expired_docs]
-
-        if expired_ids:
-            result = await collection.delete_many({"_id": {"$in": expired_ids}})
-            logger.info(f"Cleaned up {result.deleted_count} expired audit logs")
-            return result.deleted_count
-
-        return 0
+        Retention periods take only a handful of distinct values (default
+        2555 days, ~7 years), so deleting per bucket with a precomputed
+        cutoff lets each delete use the (retention_period_days, created_at)
+        index instead of evaluating ``$expr`` against every document.
+        """
+        return {
+            "retention_period_days": retention_days,
+            "created_at": {"$lt": now - timedelta(days=retention_days)},
+        }
 
 
 # Singleton instance
 _audit_repository: Optional[AuditRepository] = None
+_audit_repository_lock = threading.Lock()
 
 
 def get_audit_repository() -> AuditRepository:
-    """Get the audit repository singleton instance."""
+    """Get the audit repository singleton instance (thread-safe)."""
     global _audit_repository
     if _audit_repository is None:
-        _audit_repository = AuditRepository()
+        with _audit_repository_lock:
+            if _audit_repository is None:
+                _audit_repository = AuditRepository()
     return _audit_repository
@@ -4,17 +4,27 @@ Base repository class providing common CRUD operations.
 All entity-specific repositories inherit from this base class.
 """
 
+import asyncio
+import copy
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Any, Generic, Optional, TypeVar
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, ClassVar, Generic, Optional, TypeVar
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection
+from bson.errors import InvalidId
+from pymongo import DeleteOne, InsertOne, ReturnDocument, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.collection import Collection
-from pymongo.results import DeleteResult, InsertOneResult, UpdateResult
+from pymongo.results import BulkWriteResult, DeleteResult, InsertOneResult
+from pymongo.write_concern import WriteConcern
 
 from src.data.database import get_database_manager
-from src.data.models.base import BaseDocument
+from src.data.models.base import BaseDocument, parse_object_id, pinned_utc_now, utc_now
+from src.utils.config import get_settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,6 +32,92 @@ logger = get_logger(__name__)
 # Type variable for document models
 T = TypeVar("T", bound=BaseDocument)
 
+# Largest page fetched in a single batch (see BaseRepository._single_batch)
+_SINGLE_BATCH_MAX = 1000
+
+# Documents per insert_many call in bulk_create_async; matches the server's
+# default maxWriteBatchSize so each chunk is a single write command
+_BULK_INSERT_CHUNK = 100_000
+
+# Documents per getMore when streaming with find_stream_async
+_STREAM_BATCH_SIZE = 500
+
+# Sentinel for "not cached" in the aggregation cache (None is a valid result)
+_MISS = object()
+
+# get_by_id results inside a cached_reads() block, keyed by (collection, _id)
+_read_cache: ContextVar[Optional[dict[tuple[str, ObjectId], Any]]] = ContextVar(
+    "repository_read_cache", default=None
+)
+
+
+@contextmanager
+def cached_reads() -> Iterator[None]:
+    """
+    Serve repeated ``get_by_id`` lookups from memory for the block.
+
+    One unit of work (an import, a ranking run, a view refresh) often loads
+    the same candidate or job several times. Inside the block only the
+    first lookup of an id reaches MongoDB; later ones return the same model
+    instance. Writes made through a repository evict the ids they touch,
+    but changes made by other processes are not seen until the block ends.
+    """
+    token = _read_cache.set({})
+    try:
+        yield
+    finally:
+        _read_cache.reset(token)
+
+
+class BulkWriter(Generic[T]):
+    """
+    Collects writes for one repository and sends them as a single bulk_write.
+
+    Obtained from ``BaseRepository.bulk()`` / ``bulk_async()``; the queued
+    operations are sent unordered when the block exits without an error,
+    and discarded if it raises.
+    """
+
+    def __init__(self, repository: "BaseRepository[T]") -> None:
+        self._repository = repository
+        self.operations: list[Any] = []
+        # Ids of updated/deleted documents, evicted from cached_reads() once written
+        self.touched_ids: list[ObjectId] = []
+
+    def insert(self, model: T) -> T:
+        """Queue an insert; the model's id is assigned immediately."""
+        document = self._repository._to_document(model, self._repository._TIMESTAMP_FIELDS)
+        document["created_at"] = document["updated_at"] = utc_now()
+        document.setdefault("_id", ObjectId())
+        model.id = document["_id"]
+        self.operations.append(InsertOne(document))
+        return model
+
+    def update(self, id_value: str | ObjectId, update_data: dict[str, Any]) -> None:
+        """Queue a ``$set`` on one document, stamping ``updated_at``."""
+        oid = self._repository._to_object_id(id_value)
+        self.touched_ids.append(oid)
+        self.operations.append(
+            UpdateOne({"_id": oid}, {"$set": {**update_data, "updated_at": utc_now()}})
+        )
+
+    def add_to_set(self, id_value: str | ObjectId, field: str, values: list[Any]) -> None:
+        """Queue adding ``values`` to an array field, skipping ones already present."""
+        oid = self._repository._to_object_id(id_value)
+        self.touched_ids.append(oid)
+        self.operations.append(
+            UpdateOne(
+                {"_id": oid},
+                {"$addToSet": {field: {"$each": values}}, "$set": {"updated_at": utc_now()}},
+            )
+        )
+
+    def delete(self, id_value: str | ObjectId) -> None:
+        """Queue the deletion of one document."""
+        oid = self._repository._to_object_id(id_value)
+        self.touched_ids.append(oid)
+        self.operations.append(DeleteOne({"_id": oid}))
+
 
 class BaseRepository(ABC, Generic[T]):
     """
@@ -43,9 +139,31 @@ class BaseRepository(ABC, Generic[T]):
         """Pydantic model class for this repository."""
         pass
 
+    # Skip validation when rehydrating documents (DB_TRUST_DOCUMENTS)
+    _trust_documents: bool = False
+
+    # Fields the write methods set themselves, so they are left out of model_dump
+    _TIMESTAMP_FIELDS: ClassVar[set[str]] = {"created_at", "updated_at"}
+    _REPLACE_EXCLUDED_FIELDS: ClassVar[set[str]] = {"id", "updated_at"}  # no _id in replace_one
+
+    # Seconds a _memoized aggregation result is reused; 0 disables the cache
+    AGGREGATE_CACHE_TTL: float = 0.0
+    AGGREGATE_CACHE_SIZE: int = 512
+    _aggregate_cache: Optional[dict[tuple, tuple[float, int, Any]]] = None
+    _aggregate_lock = threading.Lock()
+    # Single-flight futures per event loop, since a future is bound to its loop
+    _aggregate_inflight: Optional[
+        dict[asyncio.AbstractEventLoop, dict[tuple, asyncio.Future]]
+    ] = None
+
+    # Bumped by every write through this repository, so result caches can
+    # tell whether an entry predates the latest change
+    _write_generation: int = 0
+
     def __init__(self) -> None:
         """Initialize repository with database connection."""
         self._db_manager = get_database_manager()
+        self._trust_documents = get_settings().database.trust_documents
 
     # -------------------------------------------------------------------------
     # Collection Access
@@ -55,7 +173,7 @@ class BaseRepository(ABC, Generic[T]):
         """Get synchronous collection instance."""
         return self._db_manager.get_sync_collection(self.collection_name)
 
-    def _get_async_collection(self) -> AsyncIOMotorCollection:
+    def _get_async_collection(self) -> AsyncCollection:
         """Get asynchronous collection instance."""
         return self._db_manager.get_async_collection(self.collection_name)
 
@@ -67,15 +185,25 @@ class BaseRepository(ABC, Generic[T]):
         """Convert MongoDB document to Pydantic model."""
         if document is None:
             return None
+        if self._trust_documents:
+            return self.model_class.from_trusted_dict(document)
         return self.model_class.model_validate(document)
 
-    def _to_models(self, documents: list[dict[str, Any]]) -> list[T]:
-        """Convert list of MongoDB documents to Pydantic models."""
-        return [self._to_model(doc) for doc in documents if doc is not None]
+    def _to_models(self, documents: Iterable[dict[str, Any]]) -> list[T]:
+        """
+        Convert MongoDB documents to Pydantic models.
+
+        ``documents`` may be a live cursor; it is consumed once, so the raw
+        documents never need to be collected into a list of their own.
+        """
+        if self._trust_documents:
+            from_trusted = self.model_class.from_trusted_dict
+            return [from_trusted(doc) for doc in documents if doc is not None]
+        return self.model_class.validate_many([doc for doc in documents if doc is not None])
 
-    def _to_document(self, model: T) -> dict[str, Any]:
-        """Convert Pydantic model to MongoDB document."""
-        return model.model_dump_mongo()
+    def _to_document(self, model: T, exclude: Optional[set[str]] = None) -> dict[str, Any]:
+        """Convert Pydantic model to MongoDB document, skipping ``exclude`` fields."""
+        return model.model_dump_mongo(exclude)
 
     @staticmethod
     def _to_object_id(id_value: str | ObjectId) -> ObjectId:
@@ -87,7 +215,8 @@ class BaseRepository(ABC, Generic[T]):
         Raises:
             ValueError: If the id_value is not a valid ObjectId format.
         """
-        if isinstance(id_value, ObjectId):
+        # Exact type check first: callers on hot paths pass parsed ObjectIds
+        if type(id_value) is ObjectId or isinstance(id_value, ObjectId):
             return id_value
 
         # Validate ObjectId format (24 hex characters)
@@ -98,32 +227,197 @@ class BaseRepository(ABC, Generic[T]):
         if not id_value:
             raise ValueError("ID cannot be empty")
 
-        if not ObjectId.is_valid(id_value):
-            raise ValueError(f"Invalid ObjectId format: {id_value[:50]}")
+        try:
+            return parse_object_id(id_value)
+        except InvalidId:
+            raise ValueError(f"Invalid ObjectId format: {id_value[:50]}") from None
+
+    @staticmethod
+    def _single_batch(cursor: Any, limit: int) -> Any:
+        """
+        Size the first batch to ``limit`` for bounded queries.
+
+        The server's default first batch is 101 documents, so larger pages
+        needed a follow-up getMore round-trip.
+        """
+        if 0 < limit <= _SINGLE_BATCH_MAX:
+            cursor = cursor.batch_size(limit)
+        return cursor
+
+    @staticmethod
+    def _aggregate_batch(limit: int) -> dict[str, Any]:
+        """``aggregate`` options that fit a pipeline's ``$limit`` in the first batch."""
+        if 0 < limit <= _SINGLE_BATCH_MAX:
+            return {"batchSize": limit}
+        return {}
+
+    # -------------------------------------------------------------------------
+    # Aggregation Cache
+    # -------------------------------------------------------------------------
+
+    def _memoized(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Return ``compute()``, reusing the result for ``AGGREGATE_CACHE_TTL`` seconds.
+
+        Meant for dashboard aggregations that scan a whole collection but
+        change slowly. ``key`` must include every argument that shapes the
+        result. A write through this repository invalidates every entry.
+        Callers get a deep copy, so mutating it cannot corrupt the cache.
+        """
+        hit = self._memo_lookup(key)
+        if hit is not _MISS:
+            return copy.deepcopy(hit)
+        generation = self._write_generation
+        return self._memo_store(key, generation, compute())
+
+    async def _memoized_async(self, key: tuple, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async ``_memoized`` with single flight.
+
+        Concurrent misses for the same key wait on the first caller's query
+        instead of each running the aggregation.
+        """
+        hit = self._memo_lookup(key)
+        if hit is not _MISS:
+            return copy.deepcopy(hit)
+        pending = self._inflight_for_loop()
+        inflight = pending.get(key)
+        if inflight is not None:
+            return copy.deepcopy(await asyncio.shield(inflight))
+        generation = self._write_generation
+        future = asyncio.ensure_future(compute())
+        pending[key] = future
+        try:
+            value = await future
+        finally:
+            pending.pop(key, None)
+        return self._memo_store(key, generation, value)
+
+    def _inflight_for_loop(self) -> dict[tuple, asyncio.Future]:
+        """Return the running loop's in-flight aggregations, pruning closed loops."""
+        loop = asyncio.get_running_loop()
+        if self._aggregate_inflight is None:
+            self._aggregate_inflight = {}
+        for other in [other for other in list(self._aggregate_inflight) if other.is_closed()]:
+            self._aggregate_inflight.pop(other, None)
+        return self._aggregate_inflight.setdefault(loop, {})
+
+    def invalidate_aggregate_cache(self) -> None:
+        """Drop all memoized aggregation results."""
+        with self._aggregate_lock:
+            if self._aggregate_cache is not None:
+                self._aggregate_cache.clear()
+
+    def _memo_lookup(self, key: tuple) -> Any:
+        """Return the fresh cached value for ``key``, or ``_MISS``."""
+        with self._aggregate_lock:
+            if self._aggregate_cache is None:
+                return _MISS
+            entry = self._aggregate_cache.get(key)
+            if entry is None:
+                return _MISS
+            stored_at, generation, value = entry
+            if (
+                generation != self._write_generation
+                or time.monotonic() - stored_at > self.AGGREGATE_CACHE_TTL
+            ):
+                self._aggregate_cache.pop(key, None)
+                return _MISS
+        return value
+
+    def _memo_store(self, key: tuple, generation: int, value: Any) -> Any:
+        """
+        Cache ``value`` under ``key`` and hand the caller its own copy.
+
+        ``generation`` is the write generation read before computing, so a
+        result that raced with a write is dropped on its next lookup. The
+        oldest entry is evicted once ``AGGREGATE_CACHE_SIZE`` is reached.
+        """
+        if self.AGGREGATE_CACHE_TTL <= 0:
+            return value
+        with self._aggregate_lock:
+            if self._aggregate_cache is None:
+                self._aggregate_cache = {}
+            self._aggregate_cache.pop(key, None)
+            if len(self._aggregate_cache) >= self.AGGREGATE_CACHE_SIZE:
+                self._aggregate_cache.pop(next(iter(self._aggregate_cache)), None)
+            self._aggregate_cache[key] = (time.monotonic(), generation, value)
+        return copy.deepcopy(value)
+
+    # -------------------------------------------------------------------------
+    # Read Cache
+    # -------------------------------------------------------------------------
+
+    def _cached(self, oid: ObjectId) -> Optional[T]:
+        """Return the model cached by ``cached_reads()`` for ``oid``, if any."""
+        cache = _read_cache.get()
+        if cache is None:
+            return None
+        return cache.get((self.collection_name, oid))
+
+    def _cache(self, oid: ObjectId, model: Optional[T]) -> Optional[T]:
+        """Remember a loaded model while a ``cached_reads()`` block is active."""
+        cache = _read_cache.get()
+        if cache is not None and model is not None:
+            cache[(self.collection_name, oid)] = model
+        return model
+
+    def _evict(self, *id_values: str | ObjectId) -> None:
+        """
+        Drop cached models after a write.
+
+        With no ids, every cached model of this collection is dropped; use
+        that for writes that match documents by anything other than _id.
+        Also bumps ``_write_generation``, so call it once the write is done.
+        """
+        self._write_generation += 1
+        self._drop_cached(*id_values)
+
+    def _drop_cached(self, *id_values: str | ObjectId) -> None:
+        """
+        Drop models held by ``cached_reads()`` without touching the generation.
 
-        return ObjectId(id_value)
+        For writes such as counter increments that the result caches are
+        allowed to lag behind.
+        """
+        cache = _read_cache.get()
+        if not cache:
+            return
+        name = self.collection_name
+        if not id_values:
+            for key in [key for key in cache if key[0] == name]:
+                del cache[key]
+            return
+        for id_value in id_values:
+            cache.pop((name, self._to_object_id(id_value)), None)
 
     # -------------------------------------------------------------------------
     # Synchronous CRUD Operations
     # -------------------------------------------------------------------------
 
-    def create(self, model: T) -> T:
-        """Create a new document."""
+    def create(self, model: T, write_concern: Optional[WriteConcern] = None) -> T:
+        """Create a new document, optionally overriding the write concern."""
         collection = self._get_sync_collection()
-        document = self._to_document(model)
-        document["created_at"] = datetime.now(timezone.utc)
-        document["updated_at"] = datetime.now(timezone.utc)
+        if write_concern is not None:
+            collection = collection.with_options(write_concern=write_concern)
+        document = self._to_document(model, self._TIMESTAMP_FIELDS)
+        document["created_at"] = document["updated_at"] = utc_now()
 
         result: InsertOneResult = collection.insert_one(document)
         model.id = result.inserted_id
+        self._write_generation += 1
         logger.debug(f"Created {self.collection_name} document: {result.inserted_id}")
         return model
 
     def get_by_id(self, id_value: str | ObjectId) -> Optional[T]:
         """Get a document by its ID."""
+        oid = self._to_object_id(id_value)
+        cached = self._cached(oid)
+        if cached is not None:
+            return cached
         collection = self._get_sync_collection()
-        document = collection.find_one({"_id": self._to_object_id(id_value)})
-        return self._to_model(document)
+        document = collection.find_one({"_id": oid})
+        return self._cache(oid, self._to_model(document))
 
     def get_all(
         self,
@@ -131,36 +425,52 @@ class BaseRepository(ABC, Generic[T]):
         limit: int = 100,
         sort_by: Optional[str] = None,
         sort_order: int = -1,
+        projection: Optional[dict[str, Any]] = None,
     ) -> list[T]:
         """Get all documents with pagination."""
         collection = self._get_sync_collection()
-        cursor = collection.find().skip(skip).limit(limit)
+        cursor = collection.find({}, projection).skip(skip).limit(limit)
+        cursor = self._single_batch(cursor, limit)
 
         if sort_by:
             cursor = cursor.sort(sort_by, sort_order)
         else:
             cursor = cursor.sort("created_at", -1)
 
-        return self._to_models(list(cursor))
+        return self._to_models(cursor)
 
     def find(
         self,
         query: dict[str, Any],
         skip: int = 0,
         limit: int = 100,
-        sort_by: Optional[str] = None,
+        sort_by: Optional[str | list[tuple[str, Any]]] = None,
         sort_order: int = -1,
+        projection: Optional[dict[str, Any]] = None,
+        collation: Optional[dict[str, Any]] = None,
     ) -> list[T]:
-        """Find documents matching a query."""
+        """
+        Find documents matching a query.
+
+        ``projection`` is passed to MongoDB to trim the returned fields. It
+        must keep every field the model requires; exclusion projections
+        of fields with defaults (``{"changes": 0}``) are always safe.
+        ``sort_by`` may also be a list of ``(field, direction)`` pairs, in
+        which case ``sort_order`` is ignored. ``collation`` must match an
+        index's collation for that index to serve the string comparisons.
+        """
         collection = self._get_sync_collection()
-        cursor = collection.find(query).skip(skip).limit(limit)
+        cursor = collection.find(query, projection, collation=collation).skip(skip).limit(limit)
+        cursor = self._single_batch(cursor, limit)
 
-        if sort_by:
+        if isinstance(sort_by, list):
+            cursor = cursor.sort(sort_by)
+        elif sort_by:
             cursor = cursor.sort(sort_by, sort_order)
         else:
             cursor = cursor.sort("created_at", -1)
 
-        return self._to_models(list(cursor))
+        return self._to_models(cursor)
 
     def find_one(self, query: dict[str, Any]) -> Optional[T]:
         """Find a single document matching a query."""
@@ -171,34 +481,35 @@ class BaseRepository(ABC, Generic[T]):
     def update(self, id_value: str | ObjectId, update_data: dict[str, Any]) -> Optional[T]:
         """Update a document by ID."""
         collection = self._get_sync_collection()
-        update_data["updated_at"] = datetime.now(timezone.utc)
+        update_data["updated_at"] = utc_now()
 
-        result: UpdateResult = collection.update_one(
+        document = collection.find_one_and_update(
             {"_id": self._to_object_id(id_value)},
             {"$set": update_data},
+            return_document=ReturnDocument.AFTER,
         )
+        self._evict(id_value)
 
-        if result.modified_count > 0:
+        if document is not None:
             logger.debug(f"Updated {self.collection_name} document: {id_value}")
-            return self.get_by_id(id_value)
-        return None
+        return self._to_model(document)
 
     def replace(self, id_value: str | ObjectId, model: T) -> Optional[T]:
         """Replace an entire document."""
         collection = self._get_sync_collection()
-        document = self._to_document(model)
-        document["updated_at"] = datetime.now(timezone.utc)
-        document.pop("_id", None)  # Remove _id to avoid duplication
+        document = self._to_document(model, self._REPLACE_EXCLUDED_FIELDS)
+        document["updated_at"] = utc_now()
 
-        result: UpdateResult = collection.replace_one(
+        document = collection.find_one_and_replace(
             {"_id": self._to_object_id(id_value)},
             document,
+            return_document=ReturnDocument.AFTER,
         )
+        self._evict(id_value)
 
-        if result.modified_count > 0:
+        if document is not None:
             logger.debug(f"Replaced {self.collection_name} document: {id_value}")
-            return self.get_by_id(id_value)
-        return None
+        return self._to_model(document)
 
     def delete(self, id_value: str | ObjectId) -> bool:
         """Delete a document by ID."""
@@ -206,6 +517,7 @@ class BaseRepository(ABC, Generic[T]):
         result: DeleteResult = collection.delete_one(
             {"_id": self._to_object_id(id_value)}
         )
+        self._evict(id_value)
         if result.deleted_count > 0:
             logger.debug(f"Deleted {self.collection_name} document: {id_value}")
             return True
@@ -227,23 +539,31 @@ class BaseRepository(ABC, Generic[T]):
     # Asynchronous CRUD Operations
     # -------------------------------------------------------------------------
 
-    async def create_async(self, model: T) -> T:
+    async def create_async(
+        self, model: T, write_concern: Optional[WriteConcern] = None
+    ) -> T:
         """Create a new document asynchronously."""
         collection = self._get_async_collection()
-        document = self._to_document(model)
-        document["created_at"] = datetime.now(timezone.utc)
-        document["updated_at"] = datetime.now(timezone.utc)
+        if write_concern is not None:
+            collection = collection.with_options(write_concern=write_concern)
+        document = self._to_document(model, self._TIMESTAMP_FIELDS)
+        document["created_at"] = document["updated_at"] = utc_now()
 
         result: InsertOneResult = await collection.insert_one(document)
         model.id = result.inserted_id
+        self._write_generation += 1
         logger.debug(f"Created {self.collection_name} document: {result.inserted_id}")
         return model
 
     async def get_by_id_async(self, id_value: str | ObjectId) -> Optional[T]:
         """Get a document by its ID asynchronously."""
+        oid = self._to_object_id(id_value)
+        cached = self._cached(oid)
+        if cached is not None:
+            return cached
         collection = self._get_async_collection()
-        document = await collection.find_one({"_id": self._to_object_id(id_value)})
-        return self._to_model(document)
+        document = await collection.find_one({"_id": oid})
+        return self._cache(oid, self._to_model(document))
 
     async def get_all_async(
         self,
@@ -251,10 +571,12 @@ class BaseRepository(ABC, Generic[T]):
         limit: int = 100,
         sort_by: Optional[str] = None,
         sort_order: int = -1,
+        projection: Optional[dict[str, Any]] = None,
     ) -> list[T]:
         """Get all documents with pagination asynchronously."""
         collection = self._get_async_collection()
-        cursor = collection.find().skip(skip).limit(limit)
+        cursor = collection.find({}, projection).skip(skip).limit(limit)
+        cursor = self._single_batch(cursor, limit)
 
         if sort_by:
             cursor = cursor.sort(sort_by, sort_order)
@@ -269,14 +591,19 @@ class BaseRepository(ABC, Generic[T]):
         query: dict[str, Any],
         skip: int = 0,
         limit: int = 100,
-        sort_by: Optional[str] = None,
+        sort_by: Optional[str | list[tuple[str, Any]]] = None,
         sort_order: int = -1,
+        projection: Optional[dict[str, Any]] = None,
+        collation: Optional[dict[str, Any]] = None,
     ) -> list[T]:
         """Find documents matching a query asynchronously."""
         collection = self._get_async_collection()
-        cursor = collection.find(query).skip(skip).limit(limit)
+        cursor = collection.find(query, projection, collation=collation).skip(skip).limit(limit)
+        cursor = self._single_batch(cursor, limit)
 
-        if sort_by:
+        if isinstance(sort_by, list):
+            cursor = cursor.sort(sort_by)
+        elif sort_by:
             cursor = cursor.sort(sort_by, sort_order)
         else:
             cursor = cursor.sort("created_at", -1)
@@ -284,6 +611,35 @@ class BaseRepository(ABC, Generic[T]):
         documents = await cursor.to_list(length=limit)
         return self._to_models(documents)
 
+    async def find_stream_async(
+        self,
+        query: dict[str, Any],
+        sort_by: Optional[str | list[tuple[str, Any]]] = None,
+        sort_order: int = -1,
+        projection: Optional[dict[str, Any]] = None,
+        batch_size: int = _STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[T]:
+        """
+        Stream models matching a query asynchronously.
+
+        Unlike ``find_async`` there is no limit and nothing is buffered:
+        each document is converted as it arrives, while the driver fetches
+        the next batch, so exports over a whole collection keep memory flat.
+        Use ``[m async for m in repo.find_stream_async(...)]`` for a list.
+        """
+        collection = self._get_async_collection()
+        cursor = collection.find(query, projection).batch_size(batch_size)
+
+        if isinstance(sort_by, list):
+            cursor = cursor.sort(sort_by)
+        elif sort_by:
+            cursor = cursor.sort(sort_by, sort_order)
+        else:
+            cursor = cursor.sort("created_at", -1)
+
+        async for document in cursor:
+            yield self._to_model(document)
+
     async def find_one_async(self, query: dict[str, Any]) -> Optional[T]:
         """Find a single document matching a query asynchronously."""
         collection = self._get_async_collection()
@@ -295,34 +651,35 @@ class BaseRepository(ABC, Generic[T]):
     ) -> Optional[T]:
         """Update a document by ID asynchronously."""
         collection = self._get_async_collection()
-        update_data["updated_at"] = datetime.now(timezone.utc)
+        update_data["updated_at"] = utc_now()
 
-        result: UpdateResult = await collection.update_one(
+        document = await collection.find_one_and_update(
             {"_id": self._to_object_id(id_value)},
             {"$set": update_data},
+            return_document=ReturnDocument.AFTER,
         )
+        self._evict(id_value)
 
-        if result.modified_count > 0:
+        if document is not None:
             logger.debug(f"Updated {self.collection_name} document: {id_value}")
-            return await self.get_by_id_async(id_value)
-        return None
+        return self._to_model(document)
 
     async def replace_async(self, id_value: str | ObjectId, model: T) -> Optional[T]:
         """Replace an entire document asynchronously."""
         collection = self._get_async_collection()
-        document = self._to_document(model)
-        document["updated_at"] = datetime.now(timezone.utc)
-        document.pop("_id", None)
+        document = self._to_document(model, self._REPLACE_EXCLUDED_FIELDS)
+        document["updated_at"] = utc_now()
 
-        result: UpdateResult = await collection.replace_one(
+        document = await collection.find_one_and_replace(
             {"_id": self._to_object_id(id_value)},
             document,
+            return_document=ReturnDocument.AFTER,
         )
+        self._evict(id_value)
 
-        if result.modified_count > 0:
+        if document is not None:
             logger.debug(f"Replaced {self.collection_name} document: {id_value}")
-            return await self.get_by_id_async(id_value)
-        return None
+        return self._to_model(document)
 
     async def delete_async(self, id_value: str | ObjectId) -> bool:
         """Delete a document by ID asynchronously."""
@@ -330,6 +687,7 @@ class BaseRepository(ABC, Generic[T]):
         result: DeleteResult = await collection.delete_one(
             {"_id": self._to_object_id(id_value)}
         )
+        self._evict(id_value)
         if result.deleted_count > 0:
             logger.debug(f"Deleted {self.collection_name} document: {id_value}")
             return True
@@ -352,25 +710,81 @@ class BaseRepository(ABC, Generic[T]):
     # Bulk Operations
     # -------------------------------------------------------------------------
 
+    @contextmanager
+    def bulk(self) -> Iterator[BulkWriter[T]]:
+        """
+        Batch writes into one round-trip.
+
+        Usage::
+
+            with repo.bulk() as writer:
+                for candidate in candidates:
+                    writer.update(candidate.id, {"status": "reviewed"})
+
+        The block runs under ``pinned_utc_now()``, so every queued write and
+        every model built inside it gets the same timestamp.
+        """
+        writer: BulkWriter[T] = BulkWriter(self)
+        with pinned_utc_now():
+            yield writer
+        if writer.operations:
+            # ordered=False still applies the other writes when one fails
+            try:
+                result: BulkWriteResult = self._get_sync_collection().bulk_write(
+                    writer.operations, ordered=False
+                )
+            finally:
+                self._write_generation += 1
+                if writer.touched_ids:
+                    self._drop_cached(*writer.touched_ids)
+            logger.debug(
+                f"Bulk wrote {len(writer.operations)} {self.collection_name} operations "
+                f"({result.modified_count} modified)"
+            )
+
+    @asynccontextmanager
+    async def bulk_async(self) -> AsyncIterator[BulkWriter[T]]:
+        """Batch writes into one round-trip asynchronously (see ``bulk``)."""
+        writer: BulkWriter[T] = BulkWriter(self)
+        with pinned_utc_now():
+            yield writer
+        if writer.operations:
+            collection = self._get_async_collection()
+            # ordered=False still applies the other writes when one fails
+            try:
+                result: BulkWriteResult = await collection.bulk_write(
+                    writer.operations, ordered=False
+                )
+            finally:
+                self._write_generation += 1
+                if writer.touched_ids:
+                    self._drop_cached(*writer.touched_ids)
+            logger.debug(
+                f"Bulk wrote {len(writer.operations)} {self.collection_name} operations "
+                f"({result.modified_count} modified)"
+            )
+
     def bulk_create(self, models: list[T]) -> list[T]:
         """Create multiple documents at once."""
         if not models:
             return []
 
         collection = self._get_sync_collection()
-        now = datetime.now(timezone.utc)
+        now = utc_now()
         documents = []
 
         for model in models:
-            doc = self._to_document(model)
+            doc = self._to_document(model, self._TIMESTAMP_FIELDS)
             doc["created_at"] = now
             doc["updated_at"] = now
             documents.append(doc)
 
-        result = collection.insert_many(documents)
+        # Inserts are independent, so let the server apply them unordered
+        result = collection.insert_many(documents, ordered=False)
 
-        for model, inserted_id in zip(models, result.inserted_ids):
+        for model, inserted_id in zip(models, result.inserted_ids, strict=True):
             model.id = inserted_id
+        self._write_generation += 1
 
         logger.debug(f"Bulk created {len(models)} {self.collection_name} documents")
         return models
@@ -381,19 +795,28 @@ class BaseRepository(ABC, Generic[T]):
             return []
 
         collection = self._get_async_collection()
-        now = datetime.now(timezone.utc)
+        now = utc_now()
         documents = []
 
         for model in models:
-            doc = self._to_document(model)
+            doc = self._to_document(model, self._TIMESTAMP_FIELDS)
             doc["created_at"] = now
             doc["updated_at"] = now
             documents.append(doc)
 
-        result = await collection.insert_many(documents)
+        results = await asyncio.gather(
+            *(
+                collection.insert_many(
+                    documents[start : start + _BULK_INSERT_CHUNK], ordered=False
+                )
+                for start in range(0, len(documents), _BULK_INSERT_CHUNK)
+            )
+        )
+        inserted_ids = [i for result in results for i in result.inserted_ids]
 
-        for model, inserted_id in zip(models, result.inserted_ids):
+        for model, inserted_id in zip(models, inserted_ids, strict=True):
             model.id = inserted_id
+        self._write_generation += 1
 
         logger.debug(f"Bulk created {len(models)} {self.collection_name} documents")
         return models
@@ -406,6 +829,7 @@ class BaseRepository(ABC, Generic[T]):
         collection = self._get_sync_collection()
         object_ids = [self._to_object_id(id_val) for id_val in ids]
         result = collection.delete_many({"_id": {"$in": object_ids}})
+        self._evict(*object_ids)
         logger.debug(f"Bulk deleted {result.deleted_count} {self.collection_name} documents")
         return result.deleted_count
 
@@ -417,5 +841,6 @@ class BaseRepository(ABC, Generic[T]):
         collection = self._get_async_collection()
         object_ids = [self._to_object_id(id_val) for id_val in ids]
         result = await collection.delete_many({"_id": {"$in": object_ids}})
+        self._evict(*object_ids)
         logger.debug(f"Bulk deleted {result.deleted_count} {self.collection_name} documents")
         return result.deleted_count
@@ -7,17 +7,21 @@ including search and filtering capabilities.
 
 from __future__ import annotations
 
-from typing import Any, Optional, TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from src.ml.nlp.accurate_resume_parser import ParsedResume
 
 from bson import ObjectId
+from pymongo import ReturnDocument
 
+from src.data.models.base import normalize_skill_name
 from src.data.models.candidate import (
     Candidate,
     CandidateCreate,
     CandidateMetadata,
+    CandidateSummary,
     CandidateUpdate,
 )
 from src.utils.constants import CandidateStatus
@@ -27,10 +31,35 @@ from .base import BaseRepository
 
 logger = get_logger(__name__)
 
+def _normalize_email(email: str) -> str:
+    """Normalize an email the way ContactInfo stores it."""
+    return email.strip().lower()
+
+
+# Only the indexed email is returned, so the unique contact.email index
+# answers email_exists on its own without fetching the document
+_EMAIL_COVERED_PROJECTION: dict[str, Any] = {"_id": 0, "contact.email": 1}
+
+# query_text goes through the candidates text index (see ensure_indexes), so
+# matches are whole, stemmed words ranked by relevance, newest first on ties
+_TEXT_SCORE_SORT: list[tuple[str, Any]] = [
+    ("text_score", {"$meta": "textScore"}),
+    ("created_at", -1),
+]
+
 
 class CandidateRepository(BaseRepository[Candidate]):
     """Repository for candidate document operations."""
 
+    # Fields needed to build a CandidateSummary; everything else stays on the server
+    SUMMARY_PROJECTION: dict[str, Any] = {
+        "first_name": 1,
+        "last_name": 1,
+        "headline": 1,
+        "status": 1,
+        "created_at": 1,
+    }
+
     @property
     def collection_name(self) -> str:
         return "candidates"
@@ -117,19 +146,27 @@ class CandidateRepository(BaseRepository[Candidate]):
 
     def get_by_email(self, email: str) -> Optional[Candidate]:
         """Get a candidate by email address."""
-        return self.find_one({"contact.email": email.lower()})
+        return self.find_one({"contact.email": _normalize_email(email)})
 
     async def get_by_email_async(self, email: str) -> Optional[Candidate]:
         """Get a candidate by email address asynchronously."""
-        return await self.find_one_async({"contact.email": email.lower()})
+        return await self.find_one_async({"contact.email": _normalize_email(email)})
 
     def email_exists(self, email: str) -> bool:
         """Check if a candidate with the given email exists."""
-        return self.exists({"contact.email": email.lower()})
+        collection = self._get_sync_collection()
+        document = collection.find_one(
+            {"contact.email": _normalize_email(email)}, _EMAIL_COVERED_PROJECTION
+        )
+        return document is not None
 
     async def email_exists_async(self, email: str) -> bool:
         """Check if a candidate with the given email exists asynchronously."""
-        return await self.exists_async({"contact.email": email.lower()})
+        collection = self._get_async_collection()
+        document = await collection.find_one(
+            {"contact.email": _normalize_email(email)}, _EMAIL_COVERED_PROJECTION
+        )
+        return document is not None
 
     def get_by_status(
         self,
@@ -177,6 +214,55 @@ class CandidateRepository(BaseRepository[Candidate]):
             query = {"metadata.tags": {"$in": tags}}
         return await self.find_async(query, skip=skip, limit=limit)
 
+    def list_summary(
+        self,
+        status: Optional[CandidateStatus] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[CandidateSummary]:
+        """List lightweight candidate summaries, newest first."""
+        collection = self._get_sync_collection()
+        query = {"status": status.value} if status else {}
+        cursor = (
+            collection.find(query, self.SUMMARY_PROJECTION)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit)
+        )
+        cursor = self._single_batch(cursor, limit)
+        return [self._to_summary(doc) for doc in cursor]
+
+    async def list_summary_async(
+        self,
+        status: Optional[CandidateStatus] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[CandidateSummary]:
+        """List lightweight candidate summaries asynchronously."""
+        collection = self._get_async_collection()
+        query = {"status": status.value} if status else {}
+        cursor = (
+            collection.find(query, self.SUMMARY_PROJECTION)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit)
+        )
+        cursor = self._single_batch(cursor, limit)
+        documents = await cursor.to_list(length=limit)
+        return [self._to_summary(doc) for doc in documents]
+
+    @staticmethod
+    def _to_summary(document: dict[str, Any]) -> CandidateSummary:
+        """Build a summary from a projected document without re-validating it."""
+        return CandidateSummary.model_construct(
+            candidate_id=str(document["_id"]),
+            first_name=document["first_name"],
+            last_name=document["last_name"],
+            headline=document.get("headline"),
+            status=CandidateStatus(document["status"]),
+            created_at=document["created_at"],
+        )
+
     # -------------------------------------------------------------------------
     # Search Operations
     # -------------------------------------------------------------------------
@@ -195,7 +281,7 @@ class CandidateRepository(BaseRepository[Candidate]):
         Search candidates with multiple filters.
 
         Args:
-            query_text: Text to search in name, headline, summary
+            query_text: Words to search for in name, headline, summary
             status: Filter by candidate status
             skills: Filter by skill names (matches any)
             min_experience_years: Minimum years of experience
@@ -209,18 +295,13 @@ class CandidateRepository(BaseRepository[Candidate]):
         query: dict[str, Any] = {}
 
         if query_text:
-            query["$or"] = [
-                {"first_name": {"$regex": query_text, "$options": "i"}},
-                {"last_name": {"$regex": query_text, "$options": "i"}},
-                {"headline": {"$regex": query_text, "$options": "i"}},
-                {"summary": {"$regex": query_text, "$options": "i"}},
-            ]
+            query["$text"] = {"$search": query_text}
 
         if status:
             query["status"] = status.value
 
         if skills:
-            normalized_skills = [s.lower() for s in skills]
+            normalized_skills = [normalize_skill_name(s) for s in skills]
             query["skills.name"] = {"$in": normalized_skills}
 
         if tags:
@@ -228,7 +309,8 @@ class CandidateRepository(BaseRepository[Candidate]):
 
         # Fast path: no experience filter — simple indexed find with correct pagination.
         if min_experience_years is None:
-            return self.find(query, skip=skip, limit=limit)
+            sort_by = _TEXT_SCORE_SORT if query_text else None
+            return self.find(query, skip=skip, limit=limit, sort_by=sort_by)
 
         # Aggregation path: compute experience server-side so that $skip/$limit
         # are applied AFTER filtering, giving correct page sizes.
@@ -293,8 +375,7 @@ class CandidateRepository(BaseRepository[Candidate]):
             pipeline.append({"$skip": skip})
         pipeline.append({"$limit": limit})
 
-        docs = list(collection.aggregate(pipeline))
-        return [Candidate.model_validate(doc) for doc in docs]
+        return self._to_models(collection.aggregate(pipeline))
 
     async def search_async(
         self,
@@ -310,25 +391,21 @@ class CandidateRepository(BaseRepository[Candidate]):
         query: dict[str, Any] = {}
 
         if query_text:
-            query["$or"] = [
-                {"first_name": {"$regex": query_text, "$options": "i"}},
-                {"last_name": {"$regex": query_text, "$options": "i"}},
-                {"headline": {"$regex": query_text, "$options": "i"}},
-                {"summary": {"$regex": query_text, "$options": "i"}},
-            ]
+            query["$text"] = {"$search": query_text}
 
         if status:
             query["status"] = status.value
 
         if skills:
-            normalized_skills = [s.lower() for s in skills]
+            normalized_skills = [normalize_skill_name(s) for s in skills]
             query["skills.name"] = {"$in": normalized_skills}
 
         if tags:
             query["metadata.tags"] = {"$in": tags}
 
         if min_experience_years is None:
-            return await self.find_async(query, skip=skip, limit=limit)
+            sort_by = _TEXT_SCORE_SORT if query_text else None
+            return await self.find_async(query, skip=skip, limit=limit, sort_by=sort_by)
 
         collection = self._get_async_collection()
         pipeline: list[dict[str, Any]] = []
@@ -385,8 +462,9 @@ class CandidateRepository(BaseRepository[Candidate]):
             pipeline.append({"$skip": skip})
         pipeline.append({"$limit": limit})
 
-        docs = await collection.aggregate(pipeline).to_list(length=limit)
-        return [Candidate.model_validate(doc) for doc in docs]
+        cursor = await collection.aggregate(pipeline)
+        docs = await cursor.to_list(length=limit)
+        return self._to_models(docs)
 
     # -------------------------------------------------------------------------
     # Aggregation Operations
@@ -407,30 +485,40 @@ class CandidateRepository(BaseRepository[Candidate]):
         pipeline = [
             {"$group": {"_id": "$status", "count": {"$sum": 1}}},
         ]
-        results = await collection.aggregate(pipeline).to_list(length=None)
+        cursor = await collection.aggregate(pipeline)
+        results = await cursor.to_list(length=None)
         return {r["_id"]: r["count"] for r in results}
 
     def get_skill_distribution(self, limit: int = 20) -> list[dict[str, Any]]:
         """Get most common skills across all candidates."""
         collection = self._get_sync_collection()
-        pipeline = [
-            {"$unwind": "$skills"},
-            {"$group": {"_id": "$skills.name", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": limit},
-        ]
-        return list(collection.aggregate(pipeline))
+        pipeline = self._skill_distribution_pipeline(limit)
+        return list(collection.aggregate(pipeline, **self._aggregate_batch(limit)))
 
     async def get_skill_distribution_async(self, limit: int = 20) -> list[dict[str, Any]]:
         """Get most common skills across all candidates asynchronously."""
         collection = self._get_async_collection()
-        pipeline = [
-            {"$unwind": "$skills"},
-            {"$group": {"_id": "$skills.name", "count": {"$sum": 1}}},
+        pipeline = self._skill_distribution_pipeline(limit)
+        cursor = await collection.aggregate(pipeline, **self._aggregate_batch(limit))
+        return await cursor.to_list(length=limit)
+
+    @staticmethod
+    def _skill_distribution_pipeline(limit: int) -> list[dict[str, Any]]:
+        """
+        Build the most-common-skills pipeline.
+
+        Candidates without skills are dropped by the first stage, and only
+        the skill names are carried into $unwind, so the unwound stream is
+        one small document per skill rather than a copy of each candidate.
+        """
+        return [
+            {"$match": {"skills.0": {"$exists": True}}},
+            {"$project": {"_id": 0, "skill": "$skills.name"}},
+            {"$unwind": "$skill"},
+            {"$group": {"_id": "$skill", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}},
             {"$limit": limit},
         ]
-        return await collection.aggregate(pipeline).to_list(length=limit)
 
     # -------------------------------------------------------------------------
     # Resume Linking
@@ -524,7 +612,7 @@ class CandidateRepository(BaseRepository[Candidate]):
         ]
 
         # ---- build contact info (email is required by Pydantic EmailStr) -----
-        raw_email: str = (contact.email or "").strip().lower()
+        raw_email: str = _normalize_email(contact.email or "")
         if not raw_email:
             raw_email = f"unknown_{file_hash[:8]}@imported.local"
 
@@ -540,7 +628,7 @@ class CandidateRepository(BaseRepository[Candidate]):
         existing: Optional[Candidate] = self.get_by_email(raw_email)
         if existing is not None:
             collection = self._get_sync_collection()
-            collection.update_one(
+            document = collection.find_one_and_update(
                 {"_id": existing.id},
                 {
                     "$set": {
@@ -550,8 +638,10 @@ class CandidateRepository(BaseRepository[Candidate]):
                     },
                     "$addToSet": {"file_hashes": file_hash},
                 },
+                return_document=ReturnDocument.AFTER,
             )
-            return self.get_by_id(existing.id)
+            self._evict(existing.id)
+            return self._to_model(document)
 
         # ---- create new candidate --------------------------------------------
         name_parts: list[str] = contact.name.split(None, 1) if contact.name else []
@@ -574,11 +664,14 @@ class CandidateRepository(BaseRepository[Candidate]):
 
 # Singleton instance
 _candidate_repository: Optional[CandidateRepository] = None
+_candidate_repository_lock = threading.Lock()
 
 
 def get_candidate_repository() -> CandidateRepository:
-    """Get the candidate repository singleton instance."""
+    """Get the candidate repository singleton instance (thread-safe)."""
     global _candidate_repository
     if _candidate_repository is None:
-        _candidate_repository = CandidateRepository()
+        with _candidate_repository_lock:
+            if _candidate_repository is None:
+                _candidate_repository = CandidateRepository()
     return _candidate_repository
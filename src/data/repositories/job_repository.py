@@ -6,20 +6,29 @@ including search, filtering, and analytics capabilities.
 """
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
-from typing import Any, Optional
+import asyncio
+import atexit
+import copy
+import re
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, time, timezone
+from time import monotonic
+from typing import Any, Literal, Optional
 
 from bson import ObjectId
+from bson.regex import Regex
+from pymongo import UpdateOne
 
+from src.data.models.base import normalize_skill_name, utc_now
 from src.data.models.job import (
     EmploymentType,
     ExperienceLevel,
     Job,
     JobCreate,
-    JobMetadata,
+    JobSummary,
     JobUpdate,
     Location,
-    ScoringWeights,
     WorkLocation,
 )
 from src.utils.constants import JobStatus
@@ -29,10 +38,74 @@ from .base import BaseRepository
 
 logger = get_logger(__name__)
 
+# Best text matches first (job_text_idx weights title over company over
+# description), then the most recently created
+_TEXT_SCORE_SORT: list[tuple[str, Any]] = [
+    ("text_score", {"$meta": "textScore"}),
+    ("created_at", -1),
+]
+
+# Case-insensitive comparison; the company_name index is built with it
+_CASE_INSENSITIVE: dict[str, Any] = {"locale": "en", "strength": 2}
+
+CompanyMatch = Literal["exact", "prefix", "contains"]
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a query document, independent of key order."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Regex):  # not hashable
+        return ("$regex", value.pattern, value.flags)
+    return value
+
+# Group-by-field stages shared by the single aggregations and the dashboard $facet
+_STATUS_COUNT_STAGES: list[dict[str, Any]] = [
+    {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+]
+_EXPERIENCE_LEVEL_STAGES: list[dict[str, Any]] = [
+    {"$group": {"_id": "$experience_level", "count": {"$sum": 1}}},
+]
+
 
 class JobRepository(BaseRepository[Job]):
     """Repository for job posting document operations."""
 
+    # View/application increments are coalesced for this many seconds and
+    # then written as one bulk_write; the singleton flushes what is left at
+    # interpreter exit, so only a crash loses up to one window
+    COUNTER_FLUSH_INTERVAL: float = 0.1
+
+    # Dashboard aggregations scan the whole collection but drift slowly
+    AGGREGATE_CACHE_TTL: float = 30.0
+
+    # Fields needed to render job list rows
+    SUMMARY_PROJECTION: dict[str, Any] = {
+        "title": 1,
+        "company_name": 1,
+        "location": 1,
+        "status": 1,
+        "posted_date": 1,
+    }
+
+    # Repeated searches (pagination, typing pauses) reuse results for this
+    # many seconds; any write through the repository invalidates them.
+    # 0 disables the cache
+    SEARCH_CACHE_TTL: float = 30.0
+    SEARCH_CACHE_SIZE: int = 256
+
+    _search_cache: Optional[OrderedDict[tuple, tuple[float, int, list[Job]]]] = None
+    _search_lock = threading.Lock()
+
+    _pending_counts: Optional[dict[tuple[ObjectId, str], int]] = None
+    _counts_lock = threading.Lock()
+    _flush_tasks: set[asyncio.Future] = set()
+    # Set while a flush is pending; _flush_loop is the loop it waits on, if any
+    _flush_scheduled: bool = False
+    _flush_loop: Optional[asyncio.AbstractEventLoop] = None
+
     @property
     def collection_name(self) -> str:
         return "jobs"
@@ -45,31 +118,19 @@ class JobRepository(BaseRepository[Job]):
     # Create Operations
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def _build_job(data: JobCreate) -> Job:
+        """
+        Build a Job from a create schema.
+
+        Fields left as None (location, scoring_weights, metadata, ...) are
+        dropped so Job's own defaults apply.
+        """
+        return Job(**{name: value for name, value in data if value is not None})
+
     def create_from_schema(self, data: "JobCreate") -> "Job":
         """Create a job from a create schema and auto-embed it (non-fatal)."""
-        job: Job = Job(
-            title=data.title,
-            description=data.description,
-            responsibilities=data.responsibilities,
-            benefits=data.benefits,
-            company_name=data.company_name,
-            company_description=data.company_description,
-            employment_type=data.employment_type,
-            work_location=data.work_location,
-            location=data.location or Location(),
-            salary=data.salary,
-            experience_level=data.experience_level,
-            skill_requirements=data.skill_requirements,
-            education_requirement=data.education_requirement,
-            experience_requirement=data.experience_requirement,
-            certifications_required=data.certifications_required,
-            languages_required=data.languages_required,
-            closing_date=data.closing_date,
-            target_hire_date=data.target_hire_date,
-            positions_available=data.positions_available,
-            scoring_weights=data.scoring_weights or ScoringWeights.from_defaults(),
-            metadata=data.metadata or JobMetadata(),
-        )
+        job: Job = self._build_job(data)
         created_job: Job = self.create(job)
 
         # Auto-embed (non-fatal — never blocks job creation)
@@ -84,29 +145,7 @@ class JobRepository(BaseRepository[Job]):
 
     async def create_from_schema_async(self, data: JobCreate) -> Job:
         """Create a job from a create schema asynchronously."""
-        job = Job(
-            title=data.title,
-            description=data.description,
-            responsibilities=data.responsibilities,
-            benefits=data.benefits,
-            company_name=data.company_name,
-            company_description=data.company_description,
-            employment_type=data.employment_type,
-            work_location=data.work_location,
-            location=data.location or Location(),
-            salary=data.salary,
-            experience_level=data.experience_level,
-            skill_requirements=data.skill_requirements,
-            education_requirement=data.education_requirement,
-            experience_requirement=data.experience_requirement,
-            certifications_required=data.certifications_required,
-            languages_required=data.languages_required,
-            closing_date=data.closing_date,
-            target_hire_date=data.target_hire_date,
-            positions_available=data.positions_available,
-            scoring_weights=data.scoring_weights or ScoringWeights.from_defaults(),
-            metadata=data.metadata or JobMetadata(),
-        )
+        job = self._build_job(data)
         return await self.create_async(job)
 
     # -------------------------------------------------------------------------
@@ -120,6 +159,7 @@ class JobRepository(BaseRepository[Job]):
         update_data = data.model_dump(exclude_unset=True, exclude_none=True)
         if not update_data:
             return self.get_by_id(id_value)
+        update_data = Job._convert_dates(update_data)
         return self.update(id_value, update_data)
 
     async def update_from_schema_async(
@@ -129,8 +169,42 @@ class JobRepository(BaseRepository[Job]):
         update_data = data.model_dump(exclude_unset=True, exclude_none=True)
         if not update_data:
             return await self.get_by_id_async(id_value)
+        update_data = Job._convert_dates(update_data)
         return await self.update_async(id_value, update_data)
 
+    def update_from_schema_if_changed(self, id_value: str | ObjectId, data: JobUpdate) -> bool:
+        """
+        Apply an update schema without reading the job back.
+
+        Returns False straight away, with no I/O, when the schema sets
+        nothing; otherwise whether a job was modified.
+        """
+        update_data = data.model_dump(exclude_unset=True, exclude_none=True)
+        if not update_data:
+            return False
+        update_data = Job._convert_dates(update_data)
+        update_data["updated_at"] = utc_now()
+        result = self._get_sync_collection().update_one(
+            {"_id": self._to_object_id(id_value)}, {"$set": update_data}
+        )
+        self._evict(id_value)
+        return result.modified_count > 0
+
+    async def update_from_schema_if_changed_async(
+        self, id_value: str | ObjectId, data: JobUpdate
+    ) -> bool:
+        """Apply an update schema without reading the job back, asynchronously."""
+        update_data = data.model_dump(exclude_unset=True, exclude_none=True)
+        if not update_data:
+            return False
+        update_data = Job._convert_dates(update_data)
+        update_data["updated_at"] = utc_now()
+        result = await self._get_async_collection().update_one(
+            {"_id": self._to_object_id(id_value)}, {"$set": update_data}
+        )
+        self._evict(id_value)
+        return result.modified_count > 0
+
     def update_status(
         self, id_value: str | ObjectId, status: JobStatus
     ) -> Optional[Job]:
@@ -149,7 +223,7 @@ class JobRepository(BaseRepository[Job]):
             id_value,
             {
                 "status": JobStatus.OPEN.value,
-                "posted_date": datetime.now(timezone.utc),
+                "posted_date": utc_now(),
             },
         )
 
@@ -159,7 +233,7 @@ class JobRepository(BaseRepository[Job]):
             id_value,
             {
                 "status": JobStatus.OPEN.value,
-                "posted_date": datetime.now(timezone.utc),
+                "posted_date": utc_now(),
             },
         )
 
@@ -204,13 +278,7 @@ class JobRepository(BaseRepository[Job]):
     def get_open_jobs(self, skip: int = 0, limit: int = 100) -> list[Job]:
         """Get all open job postings."""
         return self.find(
-            {
-                "status": JobStatus.OPEN.value,
-                "$or": [
-                    {"closing_date": None},
-                    {"closing_date": {"$gte": date.today().isoformat()}},
-                ],
-            },
+            self._open_jobs_query(),
             skip=skip,
             limit=limit,
             sort_by="posted_date",
@@ -220,45 +288,133 @@ class JobRepository(BaseRepository[Job]):
     async def get_open_jobs_async(self, skip: int = 0, limit: int = 100) -> list[Job]:
         """Get all open job postings asynchronously."""
         return await self.find_async(
-            {
-                "status": JobStatus.OPEN.value,
-                "$or": [
-                    {"closing_date": None},
-                    {"closing_date": {"$gte": date.today().isoformat()}},
-                ],
-            },
+            self._open_jobs_query(),
             skip=skip,
             limit=limit,
             sort_by="posted_date",
             sort_order=-1,
         )
 
+    def list_open_jobs_summary(self, skip: int = 0, limit: int = 100) -> list[JobSummary]:
+        """List lightweight summaries of open jobs, most recently posted first."""
+        collection = self._get_sync_collection()
+        cursor = (
+            collection.find(self._open_jobs_query(), self.SUMMARY_PROJECTION)
+            .sort("posted_date", -1)
+            .skip(skip)
+            .limit(limit)
+        )
+        cursor = self._single_batch(cursor, limit)
+        return [self._to_summary(doc) for doc in cursor]
+
+    async def list_open_jobs_summary_async(
+        self, skip: int = 0, limit: int = 100
+    ) -> list[JobSummary]:
+        """List lightweight summaries of open jobs asynchronously."""
+        collection = self._get_async_collection()
+        cursor = (
+            collection.find(self._open_jobs_query(), self.SUMMARY_PROJECTION)
+            .sort("posted_date", -1)
+            .skip(skip)
+            .limit(limit)
+        )
+        cursor = self._single_batch(cursor, limit)
+        documents = await cursor.to_list(length=limit)
+        return [self._to_summary(doc) for doc in documents]
+
+    @staticmethod
+    def _to_summary(document: dict[str, Any]) -> JobSummary:
+        """Build a summary from a projected document without re-validating it."""
+        location = document.get("location")
+        return JobSummary.model_construct(
+            job_id=str(document["_id"]),
+            title=document["title"],
+            company_name=document["company_name"],
+            location=Location(**location) if location else Location(),
+            status=JobStatus(document["status"]),
+            posted_date=document.get("posted_date"),
+        )
+
+    @staticmethod
+    def _open_jobs_query() -> dict[str, Any]:
+        """
+        Build the filter for open jobs that have not passed their closing date.
+
+        closing_date is stored as a BSON Date at midnight UTC (see
+        BaseDocument._convert_dates), so it is compared against today's
+        date in the same form; an ISO string would never match a Date.
+        """
+        today = datetime.combine(date.today(), time.min, tzinfo=timezone.utc)
+        return {
+            "status": JobStatus.OPEN.value,
+            "$or": [
+                {"closing_date": None},
+                {"closing_date": {"$gte": today}},
+            ],
+        }
+
     def get_by_company(
         self,
         company_name: str,
+        match: CompanyMatch = "prefix",
         skip: int = 0,
         limit: int = 100,
     ) -> list[Job]:
-        """Get jobs by company name."""
+        """
+        Get jobs by company name, ignoring case.
+
+        ``match`` is ``"exact"``, ``"prefix"`` (default) or ``"contains"``;
+        only the first two can use the company_name index.
+        """
+        condition, collation = self._company_name_filter(company_name, match)
         return self.find(
-            {"company_name": {"$regex": company_name, "$options": "i"}},
+            {"company_name": condition},
             skip=skip,
             limit=limit,
+            collation=collation,
         )
 
     async def get_by_company_async(
         self,
         company_name: str,
+        match: CompanyMatch = "prefix",
         skip: int = 0,
         limit: int = 100,
     ) -> list[Job]:
-        """Get jobs by company name asynchronously."""
+        """Get jobs by company name asynchronously, ignoring case."""
+        condition, collation = self._company_name_filter(company_name, match)
         return await self.find_async(
-            {"company_name": {"$regex": company_name, "$options": "i"}},
+            {"company_name": condition},
             skip=skip,
             limit=limit,
+            collation=collation,
         )
 
+    @staticmethod
+    def _company_name_filter(
+        company_name: str, match: CompanyMatch, collated: bool = True
+    ) -> tuple[Any, Optional[dict[str, Any]]]:
+        """
+        Build the company_name condition and the collation it needs.
+
+        Exact and prefix matches compare under the case-insensitive
+        collation of the company_name index, so they are index range
+        scans; ``"\\uffff"`` sorts after every character and closes the
+        prefix range. Where a collation cannot be applied (``$text``
+        queries), they fall back to anchored regexes. Only ``"contains"``
+        needs an unanchored regex. User input is always escaped, so regex
+        metacharacters match literally and cannot cause backtracking.
+        """
+        escaped = re.escape(company_name)
+        if match == "contains":
+            return Regex(escaped, "i"), None
+        if not collated:
+            suffix = "$" if match == "exact" else ""
+            return Regex(f"^{escaped}{suffix}", "i"), None
+        if match == "exact":
+            return company_name, _CASE_INSENSITIVE
+        return {"$gte": company_name, "$lt": company_name + "\uffff"}, _CASE_INSENSITIVE
+
     def get_by_tags(
         self,
         tags: list[str],
@@ -296,6 +452,7 @@ class JobRepository(BaseRepository[Job]):
         query_text: Optional[str] = None,
         status: Optional[JobStatus] = None,
         company_name: Optional[str] = None,
+        company_match: CompanyMatch = "prefix",
         employment_type: Optional[EmploymentType] = None,
         work_location: Optional[WorkLocation] = None,
         experience_level: Optional[ExperienceLevel] = None,
@@ -308,9 +465,10 @@ class JobRepository(BaseRepository[Job]):
         Search jobs with multiple filters.
 
         Args:
-            query_text: Text to search in title, description
+            query_text: Words to search for in title, company, description
             status: Filter by job status
-            company_name: Filter by company name (partial match)
+            company_name: Filter by company name, ignoring case
+            company_match: How company_name matches ("exact", "prefix", "contains")
             employment_type: Filter by employment type
             work_location: Filter by work location type
             experience_level: Filter by required experience level
@@ -320,21 +478,22 @@ class JobRepository(BaseRepository[Job]):
             limit: Maximum documents to return
 
         Returns:
-            List of matching jobs
+            List of matching jobs; results served from the search cache share
+            their Job models with other callers, so treat them as read-only
         """
         query: dict[str, Any] = {}
 
         if query_text:
-            query["$or"] = [
-                {"title": {"$regex": query_text, "$options": "i"}},
-                {"description": {"$regex": query_text, "$options": "i"}},
-            ]
+            query["$text"] = {"$search": query_text}
 
         if status:
             query["status"] = status.value
 
+        collation = None
         if company_name:
-            query["company_name"] = {"$regex": company_name, "$options": "i"}
+            query["company_name"], collation = self._company_name_filter(
+                company_name, company_match, collated=not query_text
+            )
 
         if employment_type:
             query["employment_type"] = employment_type.value
@@ -346,19 +505,27 @@ class JobRepository(BaseRepository[Job]):
             query["experience_level"] = experience_level.value
 
         if skills:
-            normalized_skills = [s.lower() for s in skills]
+            normalized_skills = sorted({normalize_skill_name(s) for s in skills})
             query["skill_requirements.name"] = {"$in": normalized_skills}
 
         if tags:
-            query["metadata.tags"] = {"$in": tags}
+            query["metadata.tags"] = {"$in": sorted(set(tags))}
 
-        return self.find(query, skip=skip, limit=limit)
+        sort_by = _TEXT_SCORE_SORT if query_text else None
+        key = (_freeze(query), _freeze(collation), skip, limit)
+        generation = self._write_generation
+        cached = self._search_lookup(key)
+        if cached is not None:
+            return cached
+        jobs = self.find(query, skip=skip, limit=limit, sort_by=sort_by, collation=collation)
+        return self._search_store(key, generation, jobs)
 
     async def search_async(
         self,
         query_text: Optional[str] = None,
         status: Optional[JobStatus] = None,
         company_name: Optional[str] = None,
+        company_match: CompanyMatch = "prefix",
         employment_type: Optional[EmploymentType] = None,
         work_location: Optional[WorkLocation] = None,
         experience_level: Optional[ExperienceLevel] = None,
@@ -371,16 +538,16 @@ class JobRepository(BaseRepository[Job]):
         query: dict[str, Any] = {}
 
         if query_text:
-            query["$or"] = [
-                {"title": {"$regex": query_text, "$options": "i"}},
-                {"description": {"$regex": query_text, "$options": "i"}},
-            ]
+            query["$text"] = {"$search": query_text}
 
         if status:
             query["status"] = status.value
 
+        collation = None
         if company_name:
-            query["company_name"] = {"$regex": company_name, "$options": "i"}
+            query["company_name"], collation = self._company_name_filter(
+                company_name, company_match, collated=not query_text
+            )
 
         if employment_type:
             query["employment_type"] = employment_type.value
@@ -392,13 +559,66 @@ class JobRepository(BaseRepository[Job]):
             query["experience_level"] = experience_level.value
 
         if skills:
-            normalized_skills = [s.lower() for s in skills]
+            normalized_skills = sorted({normalize_skill_name(s) for s in skills})
             query["skill_requirements.name"] = {"$in": normalized_skills}
 
         if tags:
-            query["metadata.tags"] = {"$in": tags}
+            query["metadata.tags"] = {"$in": sorted(set(tags))}
+
+        sort_by = _TEXT_SCORE_SORT if query_text else None
+        key = (_freeze(query), _freeze(collation), skip, limit)
+        generation = self._write_generation
+        cached = self._search_lookup(key)
+        if cached is not None:
+            return cached
+        jobs = await self.find_async(
+            query, skip=skip, limit=limit, sort_by=sort_by, collation=collation
+        )
+        return self._search_store(key, generation, jobs)
 
-        return await self.find_async(query, skip=skip, limit=limit)
+    def _search_lookup(self, key: tuple) -> Optional[list[Job]]:
+        """
+        Return the cached search result for ``key``, if still valid.
+
+        Entries expire after ``SEARCH_CACHE_TTL`` seconds or as soon as a
+        write bumps ``_write_generation``. The list is the caller's own, but
+        the Job models in it are shared with every other hit and must not be
+        mutated.
+        """
+        with self._search_lock:
+            if self._search_cache is None:
+                return None
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, generation, jobs = entry
+            if (
+                generation != self._write_generation
+                or monotonic() - stored_at > self.SEARCH_CACHE_TTL
+            ):
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+        return list(jobs)
+
+    def _search_store(self, key: tuple, generation: int, jobs: list[Job]) -> list[Job]:
+        """
+        Cache a search result, dropping the least recently used entries.
+
+        ``generation`` is the write generation read before the query ran,
+        so a result that raced with a write is never served. The cache keeps
+        one deep copy, so the caller may still modify the models it gets back.
+        """
+        if self.SEARCH_CACHE_TTL <= 0:
+            return jobs
+        with self._search_lock:
+            if self._search_cache is None:
+                self._search_cache = OrderedDict()
+            self._search_cache[key] = (monotonic(), generation, copy.deepcopy(jobs))
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return jobs
 
     # -------------------------------------------------------------------------
     # Aggregation Operations
@@ -407,69 +627,136 @@ class JobRepository(BaseRepository[Job]):
     def get_status_counts(self) -> dict[str, int]:
         """Get count of jobs by status."""
         collection = self._get_sync_collection()
-        pipeline = [
-            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
-        ]
-        results = list(collection.aggregate(pipeline))
-        return {r["_id"]: r["count"] for r in results}
+        pipeline = _STATUS_COUNT_STAGES
+        return self._memoized(
+            ("status_counts",),
+            lambda: {r["_id"]: r["count"] for r in collection.aggregate(pipeline)},
+        )
 
     async def get_status_counts_async(self) -> dict[str, int]:
         """Get count of jobs by status asynchronously."""
         collection = self._get_async_collection()
-        pipeline = [
-            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
-        ]
-        results = await collection.aggregate(pipeline).to_list(length=None)
-        return {r["_id"]: r["count"] for r in results}
+        pipeline = _STATUS_COUNT_STAGES
+
+        async def run() -> dict[str, int]:
+            cursor = await collection.aggregate(pipeline)
+            results = await cursor.to_list(length=None)
+            return {r["_id"]: r["count"] for r in results}
+
+        return await self._memoized_async(("status_counts",), run)
 
     def get_company_distribution(self, limit: int = 20) -> list[dict[str, Any]]:
         """Get job count by company."""
         collection = self._get_sync_collection()
-        pipeline = [
-            {"$group": {"_id": "$company_name", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": limit},
-        ]
-        return list(collection.aggregate(pipeline))
+        pipeline = self._company_distribution_pipeline(limit)
+        options = self._aggregate_batch(limit)
+        return self._memoized(
+            ("company_distribution", limit), lambda: list(collection.aggregate(pipeline, **options))
+        )
 
     async def get_company_distribution_async(
         self, limit: int = 20
     ) -> list[dict[str, Any]]:
         """Get job count by company asynchronously."""
         collection = self._get_async_collection()
-        pipeline = [
-            {"$group": {"_id": "$company_name", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": limit},
-        ]
-        return await collection.aggregate(pipeline).to_list(length=limit)
+        pipeline = self._company_distribution_pipeline(limit)
+
+        async def run() -> list[dict[str, Any]]:
+            cursor = await collection.aggregate(pipeline, **self._aggregate_batch(limit))
+            return await cursor.to_list(length=limit)
+
+        return await self._memoized_async(("company_distribution", limit), run)
 
     def get_skill_demand(self, limit: int = 30) -> list[dict[str, Any]]:
         """Get most in-demand skills across all job postings."""
         collection = self._get_sync_collection()
-        pipeline = [
-            {"$match": {"status": JobStatus.OPEN.value}},
-            {"$unwind": "$skill_requirements"},
+        pipeline = self._skill_demand_pipeline(limit)
+        options = self._aggregate_batch(limit)
+        return self._memoized(
+            ("skill_demand", limit), lambda: list(collection.aggregate(pipeline, **options))
+        )
+
+    async def get_skill_demand_async(self, limit: int = 30) -> list[dict[str, Any]]:
+        """Get most in-demand skills across all job postings asynchronously."""
+        collection = self._get_async_collection()
+        pipeline = self._skill_demand_pipeline(limit)
+
+        async def run() -> list[dict[str, Any]]:
+            cursor = await collection.aggregate(pipeline, **self._aggregate_batch(limit))
+            return await cursor.to_list(length=limit)
+
+        return await self._memoized_async(("skill_demand", limit), run)
+
+    def get_dashboard_stats(
+        self, company_limit: int = 20, skill_limit: int = 30
+    ) -> dict[str, Any]:
+        """
+        Get all job dashboard aggregations in one round-trip.
+
+        Returns ``status_counts`` and ``experience_levels`` (value -> count)
+        plus the ``companies`` and ``skills`` lists, in the same shapes as
+        the individual ``get_*`` methods.
+        """
+        collection = self._get_sync_collection()
+        pipeline = self._dashboard_pipeline(company_limit, skill_limit)
+        return self._memoized(
+            ("dashboard", company_limit, skill_limit),
+            lambda: self._to_dashboard_stats(list(collection.aggregate(pipeline))),
+        )
+
+    async def get_dashboard_stats_async(
+        self, company_limit: int = 20, skill_limit: int = 30
+    ) -> dict[str, Any]:
+        """Get all job dashboard aggregations in one round-trip asynchronously."""
+        collection = self._get_async_collection()
+        pipeline = self._dashboard_pipeline(company_limit, skill_limit)
+
+        async def run() -> dict[str, Any]:
+            cursor = await collection.aggregate(pipeline)
+            return self._to_dashboard_stats(await cursor.to_list(length=1))
+
+        return await self._memoized_async(("dashboard", company_limit, skill_limit), run)
+
+    @classmethod
+    def _dashboard_pipeline(cls, company_limit: int, skill_limit: int) -> list[dict[str, Any]]:
+        """Run the four dashboard pipelines as $facet branches over one scan."""
+        return [
             {
-                "$group": {
-                    "_id": "$skill_requirements.name",
-                    "count": {"$sum": 1},
-                    "required_count": {
-                        "$sum": {
-                            "$cond": ["$skill_requirements.is_required", 1, 0]
-                        }
-                    },
+                "$facet": {
+                    "status_counts": _STATUS_COUNT_STAGES,
+                    "experience_levels": _EXPERIENCE_LEVEL_STAGES,
+                    "companies": cls._company_distribution_pipeline(company_limit),
+                    "skills": cls._skill_demand_pipeline(skill_limit),
                 }
+            }
+        ]
+
+    @staticmethod
+    def _to_dashboard_stats(results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Shape the single $facet document like the individual methods' results."""
+        facets = results[0] if results else {}
+        return {
+            "status_counts": {r["_id"]: r["count"] for r in facets.get("status_counts", [])},
+            "experience_levels": {
+                r["_id"]: r["count"] for r in facets.get("experience_levels", [])
             },
+            "companies": facets.get("companies", []),
+            "skills": facets.get("skills", []),
+        }
+
+    @staticmethod
+    def _company_distribution_pipeline(limit: int) -> list[dict[str, Any]]:
+        """Count jobs per company, largest first."""
+        return [
+            {"$group": {"_id": "$company_name", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}},
             {"$limit": limit},
         ]
-        return list(collection.aggregate(pipeline))
 
-    async def get_skill_demand_async(self, limit: int = 30) -> list[dict[str, Any]]:
-        """Get most in-demand skills across all job postings asynchronously."""
-        collection = self._get_async_collection()
-        pipeline = [
+    @staticmethod
+    def _skill_demand_pipeline(limit: int) -> list[dict[str, Any]]:
+        """Count open jobs per required skill, most demanded first."""
+        return [
             {"$match": {"status": JobStatus.OPEN.value}},
             {"$unwind": "$skill_requirements"},
             {
@@ -486,61 +773,142 @@ class JobRepository(BaseRepository[Job]):
             {"$sort": {"count": -1}},
             {"$limit": limit},
         ]
-        return await collection.aggregate(pipeline).to_list(length=limit)
 
     def get_experience_level_distribution(self) -> dict[str, int]:
         """Get distribution of jobs by experience level."""
         collection = self._get_sync_collection()
-        pipeline = [
-            {"$group": {"_id": "$experience_level", "count": {"$sum": 1}}},
-        ]
-        results = list(collection.aggregate(pipeline))
-        return {r["_id"]: r["count"] for r in results}
+        pipeline = _EXPERIENCE_LEVEL_STAGES
+        return self._memoized(
+            ("experience_level_distribution",),
+            lambda: {r["_id"]: r["count"] for r in collection.aggregate(pipeline)},
+        )
 
     async def get_experience_level_distribution_async(self) -> dict[str, int]:
         """Get distribution of jobs by experience level asynchronously."""
         collection = self._get_async_collection()
-        pipeline = [
-            {"$group": {"_id": "$experience_level", "count": {"$sum": 1}}},
-        ]
-        results = await collection.aggregate(pipeline).to_list(length=None)
-        return {r["_id"]: r["count"] for r in results}
+        pipeline = _EXPERIENCE_LEVEL_STAGES
+
+        async def run() -> dict[str, int]:
+            cursor = await collection.aggregate(pipeline)
+            results = await cursor.to_list(length=None)
+            return {r["_id"]: r["count"] for r in results}
+
+        return await self._memoized_async(("experience_level_distribution",), run)
 
     # -------------------------------------------------------------------------
     # Metrics Operations
     # -------------------------------------------------------------------------
 
     def increment_views(self, id_value: str | ObjectId) -> None:
-        """Increment the view count for a job."""
-        collection = self._get_sync_collection()
-        collection.update_one(
-            {"_id": self._to_object_id(id_value)},
-            {"$inc": {"metadata.views_count": 1}},
-        )
+        """Increment the view count for a job (written within one flush interval)."""
+        if self._add_count(id_value, "metadata.views_count"):
+            self._schedule_flush()
 
     async def increment_views_async(self, id_value: str | ObjectId) -> None:
         """Increment the view count for a job asynchronously."""
-        collection = self._get_async_collection()
-        await collection.update_one(
-            {"_id": self._to_object_id(id_value)},
-            {"$inc": {"metadata.views_count": 1}},
-        )
+        if self._add_count(id_value, "metadata.views_count"):
+            self._schedule_flush_async()
 
     def increment_applications(self, id_value: str | ObjectId) -> None:
-        """Increment the application count for a job."""
-        collection = self._get_sync_collection()
-        collection.update_one(
-            {"_id": self._to_object_id(id_value)},
-            {"$inc": {"metadata.applications_count": 1}},
-        )
+        """Increment the application count for a job (written within one flush interval)."""
+        if self._add_count(id_value, "metadata.applications_count"):
+            self._schedule_flush()
 
     async def increment_applications_async(self, id_value: str | ObjectId) -> None:
         """Increment the application count for a job asynchronously."""
-        collection = self._get_async_collection()
-        await collection.update_one(
-            {"_id": self._to_object_id(id_value)},
-            {"$inc": {"metadata.applications_count": 1}},
-        )
+        if self._add_count(id_value, "metadata.applications_count"):
+            self._schedule_flush_async()
+
+    def flush_counters(self) -> int:
+        """
+        Write all pending counter increments in one bulk_write.
+
+        Returns the number of jobs updated.
+        """
+        operations = self._take_counts()
+        if operations:
+            self._get_sync_collection().bulk_write(operations, ordered=False)
+        return len(operations)
+
+    async def flush_counters_async(self) -> int:
+        """Write all pending counter increments asynchronously."""
+        operations = self._take_counts()
+        if operations:
+            await self._get_async_collection().bulk_write(operations, ordered=False)
+        return len(operations)
+
+    def _add_count(self, id_value: str | ObjectId, field: str) -> bool:
+        """
+        Record one increment of ``field``.
+
+        Returns True when no flush is pending, in which case the caller
+        schedules one. A flush left on an event loop that has since stopped
+        will never run, so it counts as not pending.
+        """
+        oid = self._to_object_id(id_value)
+        self._drop_cached(oid)
+        key = (oid, field)
+        with self._counts_lock:
+            if self._pending_counts is None:
+                self._pending_counts = {}
+            self._pending_counts[key] = self._pending_counts.get(key, 0) + 1
+            loop = self._flush_loop
+            if self._flush_scheduled and (loop is None or loop.is_running()):
+                return False
+            self._flush_scheduled = True
+            self._flush_loop = None
+        return True
+
+    def _take_counts(self) -> list[UpdateOne]:
+        """Swap out the pending increments and build one $inc per job."""
+        with self._counts_lock:
+            pending, self._pending_counts = self._pending_counts, {}
+            self._flush_scheduled = False
+            self._flush_loop = None
+        increments: dict[ObjectId, dict[str, int]] = {}
+        for (oid, field), count in (pending or {}).items():
+            increments.setdefault(oid, {})[field] = count
+        return [UpdateOne({"_id": oid}, {"$inc": inc}) for oid, inc in increments.items()]
+
+    def _schedule_flush(self) -> None:
+        """Flush from a daemon timer thread once the window closes."""
+        timer = threading.Timer(self.COUNTER_FLUSH_INTERVAL, self._flush_in_background)
+        timer.daemon = True
+        timer.start()
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush_counters()
+        except Exception as e:
+            logger.error(f"Failed to flush job counters: {e}")
+
+    def _schedule_flush_async(self) -> None:
+        """
+        Flush from a task on the running loop once the window closes.
+
+        Falls back to the timer thread when there is no usable loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or loop.is_closed():
+            self._schedule_flush()
+            return
+        with self._counts_lock:
+            if self._flush_scheduled:
+                self._flush_loop = loop
+        loop.call_later(self.COUNTER_FLUSH_INTERVAL, self._start_flush_task)
+
+    def _start_flush_task(self) -> None:
+        task = asyncio.ensure_future(self.flush_counters_async())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Future) -> None:
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Failed to flush job counters: {task.exception()}")
 
     def set_embedding_id(
         self, id_value: str | ObjectId, embedding_id: str
@@ -557,11 +925,16 @@ class JobRepository(BaseRepository[Job]):
 
 # Singleton instance
 _job_repository: Optional[JobRepository] = None
+_job_repository_lock = threading.Lock()
 
 
 def get_job_repository() -> JobRepository:
-    """Get the job repository singleton instance."""
+    """Get the job repository singleton instance (thread-safe)."""
     global _job_repository
     if _job_repository is None:
-        _job_repository = JobRepository()
+        with _job_repository_lock:
+            if _job_repository is None:
+                _job_repository = JobRepository()
+                # The flush timer is a daemon thread and dies with the process
+                atexit.register(_job_repository._flush_in_background)
     return _job_repository
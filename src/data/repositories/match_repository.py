@@ -5,12 +5,16 @@ Provides data access operations for candidate-job match documents,
 including ranking, scoring, and analytics capabilities.
 """
 
+import threading
 from typing import Any, Optional
 
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import OperationFailure
 
 from src.data.models.match import (
     Match,
+    MatchRankEntry,
     MatchStatus,
     MatchSummary,
     RecruiterFeedback,
@@ -22,10 +26,58 @@ from .base import BaseRepository
 
 logger = get_logger(__name__)
 
+# Keyset order for score pages: best first, _id breaks ties so every
+# match has exactly one position
+_SCORE_PAGE_SORT: list[tuple[str, Any]] = [("overall_score", -1), ("_id", 1)]
+
+# (overall_score, _id) of the last match on a page
+ScoreCursor = tuple[float, ObjectId]
+
+# Every field lives in the (job_id, overall_score, _id, status, rank,
+# candidate_id) index, so rank lists never fetch documents
+_RANK_ENTRY_PROJECTION: dict[str, Any] = {
+    "_id": 1,
+    "candidate_id": 1,
+    "overall_score": 1,
+    "status": 1,
+    "rank": 1,
+}
+
+# Per-job aggregation stages shared by the single methods and get_job_analytics
+_STATUS_COUNT_STAGES: list[dict[str, Any]] = [
+    {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+]
+_SCORE_LEVEL_STAGES: list[dict[str, Any]] = [
+    {"$group": {"_id": "$score_level", "count": {"$sum": 1}}},
+]
+_SCORE_STATS_STAGES: list[dict[str, Any]] = [
+    {
+        "$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "avg_score": {"$avg": "$overall_score"},
+            "max_score": {"$max": "$overall_score"},
+            "min_score": {"$min": "$overall_score"},
+            "shortlisted": {
+                "$sum": {
+                    "$cond": [
+                        {"$eq": ["$status", MatchStatus.SHORTLISTED.value]},
+                        1,
+                        0,
+                    ]
+                }
+            },
+        }
+    },
+]
+
 
 class MatchRepository(BaseRepository[Match]):
     """Repository for candidate-job match document operations."""
 
+    # Per-job analytics absorb dashboard polling; writes invalidate them
+    AGGREGATE_CACHE_TTL: float = 15.0
+
     @property
     def collection_name(self) -> str:
         return "matches"
@@ -156,6 +208,78 @@ class MatchRepository(BaseRepository[Match]):
             sort_order=-1,
         )
 
+    def page_by_job(
+        self,
+        job_id: str | ObjectId,
+        limit: int = 100,
+        after: Optional[ScoreCursor] = None,
+    ) -> tuple[list[Match], Optional[ScoreCursor]]:
+        """
+        Get one page of a job's matches, best score first.
+
+        Pass the returned cursor as ``after`` to get the next page; it is
+        None once the last page has been read. Unlike ``skip``, the cost of
+        a page does not grow with its depth.
+        """
+        query = self._after_score({"job_id": self._to_object_id(job_id)}, after)
+        matches = self.find(query, limit=limit, sort_by=_SCORE_PAGE_SORT)
+        return matches, self._next_cursor(matches, limit)
+
+    async def page_by_job_async(
+        self,
+        job_id: str | ObjectId,
+        limit: int = 100,
+        after: Optional[ScoreCursor] = None,
+    ) -> tuple[list[Match], Optional[ScoreCursor]]:
+        """Get one page of a job's matches asynchronously."""
+        query = self._after_score({"job_id": self._to_object_id(job_id)}, after)
+        matches = await self.find_async(query, limit=limit, sort_by=_SCORE_PAGE_SORT)
+        return matches, self._next_cursor(matches, limit)
+
+    def page_by_candidate(
+        self,
+        candidate_id: str | ObjectId,
+        limit: int = 100,
+        after: Optional[ScoreCursor] = None,
+    ) -> tuple[list[Match], Optional[ScoreCursor]]:
+        """Get one page of a candidate's matches, best score first."""
+        query = self._after_score({"candidate_id": self._to_object_id(candidate_id)}, after)
+        matches = self.find(query, limit=limit, sort_by=_SCORE_PAGE_SORT)
+        return matches, self._next_cursor(matches, limit)
+
+    async def page_by_candidate_async(
+        self,
+        candidate_id: str | ObjectId,
+        limit: int = 100,
+        after: Optional[ScoreCursor] = None,
+    ) -> tuple[list[Match], Optional[ScoreCursor]]:
+        """Get one page of a candidate's matches asynchronously."""
+        query = self._after_score({"candidate_id": self._to_object_id(candidate_id)}, after)
+        matches = await self.find_async(query, limit=limit, sort_by=_SCORE_PAGE_SORT)
+        return matches, self._next_cursor(matches, limit)
+
+    @staticmethod
+    def _after_score(query: dict[str, Any], after: Optional[ScoreCursor]) -> dict[str, Any]:
+        """Restrict ``query`` to matches that sort after the ``after`` cursor."""
+        if after is None:
+            return query
+        score, last_id = after
+        return {
+            **query,
+            "$or": [
+                {"overall_score": {"$lt": score}},
+                {"overall_score": score, "_id": {"$gt": last_id}},
+            ],
+        }
+
+    @staticmethod
+    def _next_cursor(matches: list[Match], limit: int) -> Optional[ScoreCursor]:
+        """Cursor for the page after ``matches``, or None if this was the last."""
+        if not matches or len(matches) < limit:
+            return None
+        last = matches[-1]
+        return last.overall_score, last.id
+
     def get_by_status(
         self,
         status: MatchStatus,
@@ -227,10 +351,7 @@ class MatchRepository(BaseRepository[Match]):
         min_score: float = 0.0,
     ) -> list[Match]:
         """Get top N matches for a job above a minimum score."""
-        query = {
-            "job_id": self._to_object_id(job_id),
-            "overall_score": {"$gte": min_score},
-        }
+        query = self._top_matches_query(job_id, min_score)
         return self.find(
             query,
             limit=limit,
@@ -245,10 +366,7 @@ class MatchRepository(BaseRepository[Match]):
         min_score: float = 0.0,
     ) -> list[Match]:
         """Get top N matches for a job asynchronously."""
-        query = {
-            "job_id": self._to_object_id(job_id),
-            "overall_score": {"$gte": min_score},
-        }
+        query = self._top_matches_query(job_id, min_score)
         return await self.find_async(
             query,
             limit=limit,
@@ -256,6 +374,58 @@ class MatchRepository(BaseRepository[Match]):
             sort_order=-1,
         )
 
+    def list_top_ranks(
+        self,
+        job_id: str | ObjectId,
+        limit: int = 10,
+        min_score: float = 0.0,
+    ) -> list[MatchRankEntry]:
+        """
+        Get score and rank of a job's top matches without loading documents.
+
+        Same selection as ``get_top_matches``, best score first, but
+        answered from the job's score index alone (a covered query).
+        """
+        collection = self._get_sync_collection()
+        cursor = collection.find(
+            self._top_matches_query(job_id, min_score), _RANK_ENTRY_PROJECTION
+        ).sort(_SCORE_PAGE_SORT).limit(limit)
+        cursor = self._single_batch(cursor, limit)
+        return [self._to_rank_entry(doc) for doc in cursor]
+
+    async def list_top_ranks_async(
+        self,
+        job_id: str | ObjectId,
+        limit: int = 10,
+        min_score: float = 0.0,
+    ) -> list[MatchRankEntry]:
+        """Get score and rank of a job's top matches asynchronously."""
+        collection = self._get_async_collection()
+        cursor = collection.find(
+            self._top_matches_query(job_id, min_score), _RANK_ENTRY_PROJECTION
+        ).sort(_SCORE_PAGE_SORT).limit(limit)
+        cursor = self._single_batch(cursor, limit)
+        documents = await cursor.to_list(length=limit)
+        return [self._to_rank_entry(doc) for doc in documents]
+
+    def _top_matches_query(self, job_id: str | ObjectId, min_score: float) -> dict[str, Any]:
+        """Filter for a job's matches scoring at least ``min_score``."""
+        return {
+            "job_id": self._to_object_id(job_id),
+            "overall_score": {"$gte": min_score},
+        }
+
+    @staticmethod
+    def _to_rank_entry(document: dict[str, Any]) -> MatchRankEntry:
+        """Build a rank entry from a projected document without re-validating it."""
+        return MatchRankEntry.model_construct(
+            match_id=str(document["_id"]),
+            candidate_id=str(document["candidate_id"]),
+            overall_score=document["overall_score"],
+            status=MatchStatus(document["status"]),
+            rank=document.get("rank"),
+        )
+
     def get_shortlisted(
         self,
         job_id: str | ObjectId,
@@ -348,17 +518,14 @@ class MatchRepository(BaseRepository[Match]):
     ) -> Optional[Match]:
         """Add recruiter feedback to a match."""
         collection = self._get_sync_collection()
-        feedback = RecruiterFeedback(
-            recruiter_id=recruiter_id,
-            rating=rating,
-            comments=comments,
-            decision=decision,
-        )
-        collection.update_one(
+        feedback = self._feedback_document(recruiter_id, rating, comments, decision)
+        document = collection.find_one_and_update(
             {"_id": self._to_object_id(id_value)},
-            {"$push": {"feedback": feedback.model_dump()}},
+            {"$push": {"feedback": feedback}},
+            return_document=ReturnDocument.AFTER,
         )
-        return self.get_by_id(id_value)
+        self._evict(id_value)
+        return self._to_model(document)
 
     async def add_feedback_async(
         self,
@@ -370,17 +537,34 @@ class MatchRepository(BaseRepository[Match]):
     ) -> Optional[Match]:
         """Add recruiter feedback to a match asynchronously."""
         collection = self._get_async_collection()
-        feedback = RecruiterFeedback(
+        feedback = self._feedback_document(recruiter_id, rating, comments, decision)
+        document = await collection.find_one_and_update(
+            {"_id": self._to_object_id(id_value)},
+            {"$push": {"feedback": feedback}},
+            return_document=ReturnDocument.AFTER,
+        )
+        self._evict(id_value)
+        return self._to_model(document)
+
+    @staticmethod
+    def _feedback_document(
+        recruiter_id: str,
+        rating: Optional[int],
+        comments: Optional[str],
+        decision: Optional[str],
+    ) -> dict[str, Any]:
+        """
+        Build the stored form of a ``RecruiterFeedback`` entry.
+
+        Goes through the model so a bad value (e.g. a fractional rating)
+        is rejected here rather than stored and failing every later read.
+        """
+        return RecruiterFeedback(
             recruiter_id=recruiter_id,
             rating=rating,
             comments=comments,
             decision=decision,
-        )
-        await collection.update_one(
-            {"_id": self._to_object_id(id_value)},
-            {"$push": {"feedback": feedback.model_dump()}},
-        )
-        return await self.get_by_id_async(id_value)
+        ).model_dump()
 
     # -------------------------------------------------------------------------
     # Ranking Operations
@@ -390,42 +574,103 @@ class MatchRepository(BaseRepository[Match]):
         """
         Update ranks for all matches of a job based on scores.
 
-        Returns the number of matches updated.
+        Ranks are computed and written on the server by one aggregation;
+        servers older than MongoDB 5.0 fall back to ranking on the client.
+        Returns the number of matches ranked.
         """
         collection = self._get_sync_collection()
         job_oid = self._to_object_id(job_id)
-
-        # Get all matches sorted by score
-        matches = list(
-            collection.find({"job_id": job_oid}).sort("overall_score", -1)
-        )
-
-        # Update ranks
-        for rank, match in enumerate(matches, start=1):
-            collection.update_one({"_id": match["_id"]}, {"$set": {"rank": rank}})
-
-        logger.debug(f"Updated ranks for {len(matches)} matches for job {job_id}")
-        return len(matches)
+        try:
+            collection.aggregate(self._rank_pipeline(job_oid))
+        except OperationFailure as e:
+            logger.debug(f"Server-side ranking unavailable, ranking on client: {e}")
+            count = self._update_ranks_on_client(collection, job_oid)
+        else:
+            count = collection.count_documents({"job_id": job_oid})
+        self._evict()
+        logger.debug(f"Updated ranks for {count} matches for job {job_id}")
+        return count
 
     async def update_ranks_for_job_async(self, job_id: str | ObjectId) -> int:
         """Update ranks for all matches of a job asynchronously."""
         collection = self._get_async_collection()
         job_oid = self._to_object_id(job_id)
+        try:
+            cursor = await collection.aggregate(self._rank_pipeline(job_oid))
+            await cursor.to_list(length=None)
+        except OperationFailure as e:
+            logger.debug(f"Server-side ranking unavailable, ranking on client: {e}")
+            count = await self._update_ranks_on_client_async(collection, job_oid)
+        else:
+            count = await collection.count_documents({"job_id": job_oid})
+        self._evict()
+        logger.debug(f"Updated ranks for {count} matches for job {job_id}")
+        return count
+
+    def _rank_pipeline(self, job_oid: ObjectId) -> list[dict[str, Any]]:
+        """
+        Number a job's matches by score and merge changed ranks back in place.
 
-        # Get all matches sorted by score
-        matches = await collection.find({"job_id": job_oid}).sort(
-            "overall_score", -1
-        ).to_list(length=None)
+        ``$documentNumber`` keeps ranks sequential like the client-side
+        path (ties get consecutive ranks, broken by _id), and only matches
+        whose rank changes reach the ``$merge``.
+        """
+        return [
+            {"$match": {"job_id": job_oid}},
+            {
+                "$setWindowFields": {
+                    "sortBy": {"overall_score": -1, "_id": 1},
+                    "output": {"new_rank": {"$documentNumber": {}}},
+                }
+            },
+            {"$match": {"$expr": {"$ne": ["$rank", "$new_rank"]}}},
+            {"$project": {"rank": "$new_rank"}},
+            {
+                "$merge": {
+                    "into": self.collection_name,
+                    "on": "_id",
+                    "whenMatched": "merge",
+                    "whenNotMatched": "discard",
+                }
+            },
+        ]
 
-        # Update ranks
-        for rank, match in enumerate(matches, start=1):
-            await collection.update_one(
-                {"_id": match["_id"]}, {"$set": {"rank": rank}}
+    def _update_ranks_on_client(self, collection: Any, job_oid: ObjectId) -> int:
+        """Rank a job's matches with one read and one bulk_write."""
+        matches = list(
+            collection.find({"job_id": job_oid}, {"_id": 1, "rank": 1}).sort(
+                [("overall_score", -1), ("_id", 1)]
             )
+        )
+        operations = self._rank_operations(matches)
+        if operations:
+            collection.bulk_write(operations, ordered=False)
+        return len(matches)
 
-        logger.debug(f"Updated ranks for {len(matches)} matches for job {job_id}")
+    async def _update_ranks_on_client_async(self, collection: Any, job_oid: ObjectId) -> int:
+        """Rank a job's matches with one read and one bulk_write asynchronously."""
+        matches = await collection.find(
+            {"job_id": job_oid}, {"_id": 1, "rank": 1}
+        ).sort([("overall_score", -1), ("_id", 1)]).to_list(length=None)
+        operations = self._rank_operations(matches)
+        if operations:
+            await collection.bulk_write(operations, ordered=False)
         return len(matches)
 
+    @staticmethod
+    def _rank_operations(matches: list[dict[str, Any]]) -> list[UpdateOne]:
+        """
+        Build one ``$set`` per match whose rank differs from its position.
+
+        ``matches`` must already be sorted best first. The driver splits
+        large bulk writes into server-sized batches itself.
+        """
+        return [
+            UpdateOne({"_id": match["_id"]}, {"$set": {"rank": rank}})
+            for rank, match in enumerate(matches, start=1)
+            if match.get("rank") != rank
+        ]
+
     # -------------------------------------------------------------------------
     # Aggregation Operations
     # -------------------------------------------------------------------------
@@ -433,113 +678,139 @@ class MatchRepository(BaseRepository[Match]):
     def get_status_counts_for_job(self, job_id: str | ObjectId) -> dict[str, int]:
         """Get count of matches by status for a specific job."""
         collection = self._get_sync_collection()
-        pipeline = [
-            {"$match": {"job_id": self._to_object_id(job_id)}},
-            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
-        ]
-        results = list(collection.aggregate(pipeline))
-        return {r["_id"]: r["count"] for r in results}
+        job_oid = self._to_object_id(job_id)
+        pipeline = [self._job_match_stage(job_oid), *_STATUS_COUNT_STAGES]
+        return self._memoized(
+            ("status_counts", job_oid),
+            lambda: {r["_id"]: r["count"] for r in collection.aggregate(pipeline)},
+        )
 
     async def get_status_counts_for_job_async(
         self, job_id: str | ObjectId
     ) -> dict[str, int]:
         """Get count of matches by status for a specific job asynchronously."""
         collection = self._get_async_collection()
-        pipeline = [
-            {"$match": {"job_id": self._to_object_id(job_id)}},
-            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
-        ]
-        results = await collection.aggregate(pipeline).to_list(length=None)
-        return {r["_id"]: r["count"] for r in results}
+        job_oid = self._to_object_id(job_id)
+        pipeline = [self._job_match_stage(job_oid), *_STATUS_COUNT_STAGES]
+
+        async def run() -> dict[str, int]:
+            cursor = await collection.aggregate(pipeline)
+            results = await cursor.to_list(length=None)
+            return {r["_id"]: r["count"] for r in results}
+
+        return await self._memoized_async(("status_counts", job_oid), run)
 
     def get_score_distribution_for_job(
         self, job_id: str | ObjectId
     ) -> dict[str, int]:
         """Get distribution of score levels for a job."""
         collection = self._get_sync_collection()
-        pipeline = [
-            {"$match": {"job_id": self._to_object_id(job_id)}},
-            {"$group": {"_id": "$score_level", "count": {"$sum": 1}}},
-        ]
-        results = list(collection.aggregate(pipeline))
-        return {r["_id"]: r["count"] for r in results}
+        job_oid = self._to_object_id(job_id)
+        pipeline = [self._job_match_stage(job_oid), *_SCORE_LEVEL_STAGES]
+        return self._memoized(
+            ("score_distribution", job_oid),
+            lambda: {r["_id"]: r["count"] for r in collection.aggregate(pipeline)},
+        )
 
     async def get_score_distribution_for_job_async(
         self, job_id: str | ObjectId
     ) -> dict[str, int]:
         """Get distribution of score levels for a job asynchronously."""
         collection = self._get_async_collection()
-        pipeline = [
-            {"$match": {"job_id": self._to_object_id(job_id)}},
-            {"$group": {"_id": "$score_level", "count": {"$sum": 1}}},
-        ]
-        results = await collection.aggregate(pipeline).to_list(length=None)
-        return {r["_id"]: r["count"] for r in results}
+        job_oid = self._to_object_id(job_id)
+        pipeline = [self._job_match_stage(job_oid), *_SCORE_LEVEL_STAGES]
+
+        async def run() -> dict[str, int]:
+            cursor = await collection.aggregate(pipeline)
+            results = await cursor.to_list(length=None)
+            return {r["_id"]: r["count"] for r in results}
+
+        return await self._memoized_async(("score_distribution", job_oid), run)
 
     def get_score_stats_for_job(self, job_id: str | ObjectId) -> dict[str, Any]:
         """Get score statistics for a job."""
         collection = self._get_sync_collection()
-        pipeline = [
-            {"$match": {"job_id": self._to_object_id(job_id)}},
-            {
-                "$group": {
-                    "_id": None,
-                    "count": {"$sum": 1},
-                    "avg_score": {"$avg": "$overall_score"},
-                    "max_score": {"$max": "$overall_score"},
-                    "min_score": {"$min": "$overall_score"},
-                    "shortlisted": {
-                        "$sum": {
-                            "$cond": [
-                                {"$eq": ["$status", MatchStatus.SHORTLISTED.value]},
-                                1,
-                                0,
-                            ]
-                        }
-                    },
-                }
-            },
-        ]
-        results = list(collection.aggregate(pipeline))
-        if results:
-            result = results[0]
-            result.pop("_id", None)
-            return result
-        return {
-            "count": 0,
-            "avg_score": 0,
-            "max_score": 0,
-            "min_score": 0,
-            "shortlisted": 0,
-        }
+        job_oid = self._to_object_id(job_id)
+        pipeline = [self._job_match_stage(job_oid), *_SCORE_STATS_STAGES]
+        return self._memoized(
+            ("score_stats", job_oid),
+            lambda: self._to_score_stats(list(collection.aggregate(pipeline))),
+        )
 
     async def get_score_stats_for_job_async(
         self, job_id: str | ObjectId
     ) -> dict[str, Any]:
         """Get score statistics for a job asynchronously."""
         collection = self._get_async_collection()
-        pipeline = [
-            {"$match": {"job_id": self._to_object_id(job_id)}},
+        job_oid = self._to_object_id(job_id)
+        pipeline = [self._job_match_stage(job_oid), *_SCORE_STATS_STAGES]
+
+        async def run() -> dict[str, Any]:
+            cursor = await collection.aggregate(pipeline)
+            return self._to_score_stats(await cursor.to_list(length=1))
+
+        return await self._memoized_async(("score_stats", job_oid), run)
+
+    def get_job_analytics(self, job_id: str | ObjectId) -> dict[str, Any]:
+        """
+        Get a job's status counts, score distribution and score stats at once.
+
+        The job's matches are read once and fanned out with ``$facet``; the
+        result holds ``status_counts``, ``score_distribution`` and
+        ``score_stats`` in the same shapes as the individual methods.
+        """
+        collection = self._get_sync_collection()
+        job_oid = self._to_object_id(job_id)
+        pipeline = self._job_analytics_pipeline(job_oid)
+        return self._memoized(
+            ("job_analytics", job_oid),
+            lambda: self._to_job_analytics(list(collection.aggregate(pipeline))),
+        )
+
+    async def get_job_analytics_async(self, job_id: str | ObjectId) -> dict[str, Any]:
+        """Get a job's match analytics in one round-trip asynchronously."""
+        collection = self._get_async_collection()
+        job_oid = self._to_object_id(job_id)
+        pipeline = self._job_analytics_pipeline(job_oid)
+
+        async def run() -> dict[str, Any]:
+            cursor = await collection.aggregate(pipeline)
+            return self._to_job_analytics(await cursor.to_list(length=1))
+
+        return await self._memoized_async(("job_analytics", job_oid), run)
+
+    def _job_match_stage(self, job_id: str | ObjectId) -> dict[str, Any]:
+        """``$match`` stage selecting one job's matches."""
+        return {"$match": {"job_id": self._to_object_id(job_id)}}
+
+    def _job_analytics_pipeline(self, job_id: str | ObjectId) -> list[dict[str, Any]]:
+        """Match a job once and run the three per-job aggregations as $facet branches."""
+        return [
+            self._job_match_stage(job_id),
             {
-                "$group": {
-                    "_id": None,
-                    "count": {"$sum": 1},
-                    "avg_score": {"$avg": "$overall_score"},
-                    "max_score": {"$max": "$overall_score"},
-                    "min_score": {"$min": "$overall_score"},
-                    "shortlisted": {
-                        "$sum": {
-                            "$cond": [
-                                {"$eq": ["$status", MatchStatus.SHORTLISTED.value]},
-                                1,
-                                0,
-                            ]
-                        }
-                    },
+                "$facet": {
+                    "status_counts": _STATUS_COUNT_STAGES,
+                    "score_distribution": _SCORE_LEVEL_STAGES,
+                    "score_stats": _SCORE_STATS_STAGES,
                 }
             },
         ]
-        results = await collection.aggregate(pipeline).to_list(length=1)
+
+    @classmethod
+    def _to_job_analytics(cls, results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Shape the single $facet document like the individual methods' results."""
+        facets = results[0] if results else {}
+        return {
+            "status_counts": {r["_id"]: r["count"] for r in facets.get("status_counts", [])},
+            "score_distribution": {
+                r["_id"]: r["count"] for r in facets.get("score_distribution", [])
+            },
+            "score_stats": cls._to_score_stats(facets.get("score_stats", [])),
+        }
+
+    @staticmethod
+    def _to_score_stats(results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Return the score stats group without its _id, or zeros for no matches."""
         if results:
             result = results[0]
             result.pop("_id", None)
@@ -560,6 +831,7 @@ class MatchRepository(BaseRepository[Match]):
         """Delete all matches for a job."""
         collection = self._get_sync_collection()
         result = collection.delete_many({"job_id": self._to_object_id(job_id)})
+        self._evict()
         logger.debug(f"Deleted {result.deleted_count} matches for job {job_id}")
         return result.deleted_count
 
@@ -567,6 +839,7 @@ class MatchRepository(BaseRepository[Match]):
         """Delete all matches for a job asynchronously."""
         collection = self._get_async_collection()
         result = await collection.delete_many({"job_id": self._to_object_id(job_id)})
+        self._evict()
         logger.debug(f"Deleted {result.deleted_count} matches for job {job_id}")
         return result.deleted_count
 
@@ -576,6 +849,7 @@ class MatchRepository(BaseRepository[Match]):
         result = collection.delete_many(
             {"candidate_id": self._to_object_id(candidate_id)}
         )
+        self._evict()
         logger.debug(
             f"Deleted {result.deleted_count} matches for candidate {candidate_id}"
         )
@@ -587,6 +861,7 @@ class MatchRepository(BaseRepository[Match]):
         result = await collection.delete_many(
             {"candidate_id": self._to_object_id(candidate_id)}
         )
+        self._evict()
         logger.debug(
             f"Deleted {result.deleted_count} matches for candidate {candidate_id}"
         )
@@ -595,11 +870,14 @@ class MatchRepository(BaseRepository[Match]):
 
 # Singleton instance
 _match_repository: Optional[MatchRepository] = None
+_match_repository_lock = threading.Lock()
 
 
 def get_match_repository() -> MatchRepository:
-    """Get the match repository singleton instance."""
+    """Get the match repository singleton instance (thread-safe)."""
     global _match_repository
     if _match_repository is None:
-        _match_repository = MatchRepository()
+        with _match_repository_lock:
+            if _match_repository is None:
+                _match_repository = MatchRepository()
     return _match_repository
@@ -5,11 +5,13 @@ Provides data access operations for resume documents,
 including file tracking and processing status management.
 """
 
-from datetime import datetime, timezone
+import threading
 from typing import Any, Optional
 
 from bson import ObjectId
+from pymongo import ReturnDocument
 
+from src.data.models.base import utc_now
 from src.data.models.resume import (
     ParsedContent,
     ProcessingMetrics,
@@ -247,24 +249,27 @@ class ResumeRepository(BaseRepository[Resume]):
     ) -> Optional[Resume]:
         """Mark resume as failed with error details."""
         collection = self._get_sync_collection()
+        now = utc_now()
         error = {
             "stage": error_stage,
             "error_type": error_type,
             "error_message": error_message,
-            "occurred_at": datetime.now(timezone.utc),
+            "occurred_at": now,
             "is_recoverable": False,
         }
-        collection.update_one(
+        document = collection.find_one_and_update(
             {"_id": self._to_object_id(id_value)},
             {
                 "$set": {
                     "status": ProcessingStatus.FAILED.value,
-                    "updated_at": datetime.now(timezone.utc),
+                    "updated_at": now,
                 },
                 "$push": {"processing_errors": error},
             },
+            return_document=ReturnDocument.AFTER,
         )
-        return self.get_by_id(id_value)
+        self._evict(id_value)
+        return self._to_model(document)
 
     async def mark_failed_async(
         self,
@@ -275,24 +280,27 @@ class ResumeRepository(BaseRepository[Resume]):
     ) -> Optional[Resume]:
         """Mark resume as failed with error details asynchronously."""
         collection = self._get_async_collection()
+        now = utc_now()
         error = {
             "stage": error_stage,
             "error_type": error_type,
             "error_message": error_message,
-            "occurred_at": datetime.now(timezone.utc),
+            "occurred_at": now,
             "is_recoverable": False,
         }
-        await collection.update_one(
+        document = await collection.find_one_and_update(
             {"_id": self._to_object_id(id_value)},
             {
                 "$set": {
                     "status": ProcessingStatus.FAILED.value,
-                    "updated_at": datetime.now(timezone.utc),
+                    "updated_at": now,
                 },
                 "$push": {"processing_errors": error},
             },
+            return_document=ReturnDocument.AFTER,
         )
-        return await self.get_by_id_async(id_value)
+        self._evict(id_value)
+        return self._to_model(document)
 
     # -------------------------------------------------------------------------
     # Candidate Linking
@@ -333,7 +341,8 @@ class ResumeRepository(BaseRepository[Resume]):
         pipeline = [
             {"$group": {"_id": "$status", "count": {"$sum": 1}}},
         ]
-        results = await collection.aggregate(pipeline).to_list(length=None)
+        cursor = await collection.aggregate(pipeline)
+        results = await cursor.to_list(length=None)
         return {r["_id"]: r["count"] for r in results}
 
     def get_format_distribution(self) -> dict[str, int]:
@@ -353,7 +362,8 @@ class ResumeRepository(BaseRepository[Resume]):
             {"$group": {"_id": "$file.file_format", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}},
         ]
-        results = await collection.aggregate(pipeline).to_list(length=None)
+        cursor = await collection.aggregate(pipeline)
+        results = await cursor.to_list(length=None)
         return {r["_id"]: r["count"] for r in results}
 
     def get_processing_stats(self) -> dict[str, Any]:
@@ -439,7 +449,8 @@ class ResumeRepository(BaseRepository[Resume]):
                 }
             }
         ]
-        results = await collection.aggregate(pipeline).to_list(length=1)
+        cursor = await collection.aggregate(pipeline)
+        results = await cursor.to_list(length=1)
         if results:
             return results[0]
         return {"total": 0, "completed": 0, "failed": 0, "pending": 0}
@@ -447,11 +458,14 @@ class ResumeRepository(BaseRepository[Resume]):
 
 # Singleton instance
 _resume_repository: Optional[ResumeRepository] = None
+_resume_repository_lock = threading.Lock()
 
 
 def get_resume_repository() -> ResumeRepository:
-    """Get the resume repository singleton instance."""
+    """Get the resume repository singleton instance (thread-safe)."""
     global _resume_repository
     if _resume_repository is None:
-        _resume_repository = ResumeRepository()
+        with _resume_repository_lock:
+            if _resume_repository is None:
+                _resume_repository = ResumeRepository()
     return _resume_repository
@@ -168,8 +168,11 @@ class ResumeParser:
                 return result
 
             # Calculate file hash
+            digest = hashlib.sha256()
             with open(path, "rb") as f:
-                result.file_hash = hashlib.sha256(f.read()).hexdigest()
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            result.file_hash = digest.hexdigest()
 
             # Extract text
             extraction = ExtractorFactory.extract(path)
@@ -123,11 +123,14 @@ class IngestionService:
         result.candidate_name = parsed.contact.name
         result.candidate_email = parsed.contact.email
 
-        # 4. Upsert candidate
+        # 4. Upsert candidate — one clock read for the model defaults and the write
         try:
-            candidate_doc: object = self._repo.upsert_by_email(
-                parsed, validation.file_hash, filename
-            )
+            from src.data.models.base import pinned_utc_now
+
+            with pinned_utc_now():
+                candidate_doc: object = self._repo.upsert_by_email(
+                    parsed, validation.file_hash, filename
+                )
             result.candidate_id = str(candidate_doc.id) if candidate_doc else None  # type: ignore[union-attr]
             result.status = "success"
         except Exception as exc:
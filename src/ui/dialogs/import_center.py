@@ -1147,22 +1147,22 @@ class ImportCenterDialog(QDialog):
             from src.data.repositories.candidate_repository import get_candidate_repository
             repo = get_candidate_repository()
             updated = 0
-            for row in metadata:
-                email = row.get("email_col", "").strip().lower()
-                if not email:
-                    continue
-                candidate = repo.get_by_email(email)
-                if not candidate:
-                    continue
-                new_tags = []
-                if row.get("roll_col", "").strip():
-                    new_tags.append(f"roll:{row['roll_col'].strip()}")
-                if row.get("branch_col", "").strip():
-                    new_tags.append(f"dept:{row['branch_col'].strip()}")
-                if new_tags:
-                    existing_tags = candidate.metadata.tags if candidate.metadata else []
-                    repo.update(candidate.id, {"metadata.tags": list(set(existing_tags + new_tags))})
-                    updated += 1
+            with repo.bulk() as writer:
+                for row in metadata:
+                    email = row.get("email_col", "").strip().lower()
+                    if not email:
+                        continue
+                    candidate = repo.get_by_email(email)
+                    if not candidate:
+                        continue
+                    new_tags = []
+                    if row.get("roll_col", "").strip():
+                        new_tags.append(f"roll:{row['roll_col'].strip()}")
+                    if row.get("branch_col", "").strip():
+                        new_tags.append(f"dept:{row['branch_col'].strip()}")
+                    if new_tags:
+                        writer.add_to_set(candidate.id, "metadata.tags", new_tags)
+                        updated += 1
             QMessageBox.information(
                 self, "Metadata Imported",
                 f"Updated metadata for {updated} candidate(s) matched by email."
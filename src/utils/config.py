@@ -23,6 +23,21 @@ class DatabaseSettings(BaseSettings):
     name: str = "ai_ats"
     username: str | None = None
     password: str | None = None
+    # Rebuild documents read from MongoDB with model_construct instead of
+    # full validation. Only enable when this application is the sole writer.
+    trust_documents: bool = False
+    # Coalesce concurrent async audit writes into insert_many batches.
+    # Compliance-relevant entries are always written immediately.
+    audit_batch_writes: bool = False
+    audit_batch_max_size: int = Field(default=500, ge=1)
+    audit_batch_interval_ms: int = Field(default=20, ge=0)
+    # Write routine audit events with w=0 (unacknowledged). Compliance,
+    # bias-detection and manual-override events are always acknowledged.
+    audit_unacknowledged_writes: bool = False
+    # Connection pool bounds shared by every repository through the single
+    # DatabaseManager clients. Tune per deployment (DB_MAX_POOL_SIZE, ...).
+    max_pool_size: int = Field(default=50, ge=1)
+    min_pool_size: int = Field(default=5, ge=0)
 
     @field_validator("host")
     @classmethod
@@ -5,6 +5,7 @@ This module contains all constant values used throughout the application.
 Modify these values to customize behavior without changing code logic.
 """
 
+from collections.abc import Sequence
 from enum import Enum, auto
 from typing import Final
 
@@ -200,6 +201,35 @@ class MatchScoreLevel(Enum):
             return cls.FAIR
         return cls.POOR
 
+    @classmethod
+    def from_scores(cls, scores: Sequence[float]) -> list["MatchScoreLevel"]:
+        """
+        Convert many numeric scores to levels in one vectorized pass.
+
+        Same bucketing as from_score(), via a binary search over the
+        threshold edges.
+        """
+        import numpy as np
+
+        indices = np.searchsorted(
+            _SCORE_LEVEL_EDGES, np.asarray(scores, dtype=np.float64), side="right"
+        )
+        return [_SCORE_LEVELS_ASCENDING[i] for i in indices.tolist()]
+
+
+# Ascending threshold edges and the level each bucket maps to (MatchScoreLevel.from_scores)
+_SCORE_LEVEL_EDGES: Final[tuple[float, ...]] = (
+    SCORE_THRESHOLDS["fair"],
+    SCORE_THRESHOLDS["good"],
+    SCORE_THRESHOLDS["excellent"],
+)
+_SCORE_LEVELS_ASCENDING: Final[tuple[MatchScoreLevel, ...]] = (
+    MatchScoreLevel.POOR,
+    MatchScoreLevel.FAIR,
+    MatchScoreLevel.GOOD,
+    MatchScoreLevel.EXCELLENT,
+)
+
 
 class AuditAction(str, Enum):
     """Types of actions that can be audited."""
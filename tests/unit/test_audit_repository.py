@@ -0,0 +1,276 @@
+"""
+Unit tests for AuditRepository query construction.
+No live DB — uses MagicMock to stub the collection.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+
+from src.data.models.audit import ActorInfo, AuditLogCreate, AuditLogQuery
+from src.data.models.base import pinned_utc_now
+from src.data.repositories.audit_repository import AuditRepository
+from src.utils.constants import AuditAction
+
+
+def _make_repo(collection: MagicMock) -> AuditRepository:
+    """Return an AuditRepository whose sync collection is a mock."""
+    repo: AuditRepository = AuditRepository.__new__(AuditRepository)
+    repo._get_sync_collection = MagicMock(return_value=collection)  # type: ignore[method-assign]
+    repo._get_async_collection = MagicMock(return_value=collection)  # type: ignore[method-assign]
+    return repo
+
+
+def _make_create(**kwargs) -> AuditLogCreate:
+    return AuditLogCreate(
+        action=AuditAction.CANDIDATE_ADDED,
+        action_description="Candidate added",
+        actor=ActorInfo(),
+        **kwargs,
+    )
+
+
+class TestQueryBuilders:
+    def test_date_range_omits_missing_bounds(self) -> None:
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert AuditRepository._date_range(start, None) == {"$gte": start}
+        assert AuditRepository._date_range(None, None) == {}
+
+    def test_search_query(self) -> None:
+        repo: AuditRepository = AuditRepository.__new__(AuditRepository)
+        end = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        query = repo._build_search_query(
+            AuditLogQuery(actor_id="u1", compliance_only=True, end_date=end)
+        )
+        assert query == {
+            "actor.actor_id": "u1",
+            "compliance_relevant": True,
+            "created_at": {"$lte": end},
+        }
+
+
+    def test_after_adds_keyset_condition(self) -> None:
+        created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        last_id = ObjectId()
+        query = AuditRepository._after({"action": "bias_detected"}, (created_at, last_id))
+        assert query == {
+            "$and": [
+                {"action": "bias_detected"},
+                {
+                    "$or": [
+                        {"created_at": {"$lt": created_at}},
+                        {"created_at": created_at, "_id": {"$lt": last_id}},
+                    ]
+                },
+            ]
+        }
+        assert AuditRepository._after({"action": "x"}, None) == {"action": "x"}
+
+
+class TestAuditSummary:
+    def test_summary_uses_single_aggregation(self) -> None:
+        collection = MagicMock()
+        collection.aggregate.return_value = iter([
+            {
+                "totals": [{
+                    "_id": None,
+                    "total_actions": 3,
+                    "ai_decisions_count": 1,
+                    "manual_overrides_count": 1,
+                    "bias_detections_count": 0,
+                    "compliance_events_count": 2,
+                }],
+                "by_action": [
+                    {"_id": "match_created", "count": 2},
+                    {"_id": "manual_override", "count": 1},
+                ],
+            }
+        ])
+        summary = _make_repo(collection).get_summary()
+
+        collection.aggregate.assert_called_once()
+        pipeline = collection.aggregate.call_args.args[0]
+        assert list(pipeline[-1]) == ["$facet"]
+        assert summary.total_actions == 3
+        assert summary.actions_by_type == {"match_created": 2, "manual_override": 1}
+
+    def test_summary_cached_until_invalidated(self) -> None:
+        collection = MagicMock()
+        collection.aggregate.side_effect = lambda pipeline: iter(
+            [{"totals": [], "by_action": []}]
+        )
+        repo = _make_repo(collection)
+        start = datetime(2024, 1, 1, 12, 0, 5, tzinfo=timezone.utc)
+
+        repo.get_summary(start_date=start)
+        summary = repo.get_summary(start_date=start)
+        assert collection.aggregate.call_count == 1
+        assert summary.period_start == start
+
+        repo.invalidate_summary_cache()
+        repo.get_summary(start_date=start)
+        assert collection.aggregate.call_count == 2
+
+    def test_nearby_ranges_do_not_share_a_summary(self) -> None:
+        collection = MagicMock()
+        collection.aggregate.side_effect = lambda pipeline: iter(
+            [{"totals": [], "by_action": []}]
+        )
+        repo = _make_repo(collection)
+        start = datetime(2024, 1, 1, 12, 0, 5, tzinfo=timezone.utc)
+
+        repo.get_summary(start_date=start)
+        summary = repo.get_summary(start_date=start.replace(second=40))
+        assert collection.aggregate.call_count == 2
+        assert summary.period_start == start.replace(second=40)
+
+    def test_async_summary_works_across_event_loops(self) -> None:
+        collection = MagicMock()
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[{"totals": [], "by_action": []}])
+        collection.aggregate = AsyncMock(return_value=cursor)
+        repo = _make_repo(collection)
+
+        for day in (1, 2):
+            start = datetime(2024, 1, day, tzinfo=timezone.utc)
+            summary = asyncio.run(repo.get_summary_async(start_date=start))
+            assert summary.period_start == start
+        assert collection.aggregate.await_count == 2
+
+    def test_summary_empty_collection(self) -> None:
+        collection = MagicMock()
+        collection.aggregate.return_value = iter([{"totals": [], "by_action": []}])
+        summary = _make_repo(collection).get_summary()
+        assert summary.total_actions == 0
+        assert summary.actions_by_type == {}
+
+
+class TestCleanupExpired:
+    def test_deletes_once_per_retention_bucket(self) -> None:
+        collection = MagicMock()
+        collection.distinct.return_value = [30, 2555]
+        collection.delete_many.return_value = MagicMock(deleted_count=2)
+        assert _make_repo(collection).cleanup_expired() == 4
+        assert collection.delete_many.call_count == 2
+        collection.aggregate.assert_not_called()
+
+        first_filter = collection.delete_many.call_args_list[0].args[0]
+        assert first_filter["retention_period_days"] == 30
+        assert "$lt" in first_filter["created_at"]
+
+    def test_logs_without_retention_period_are_kept(self) -> None:
+        collection = MagicMock()
+        collection.distinct.return_value = [None, 30]
+        collection.delete_many.return_value = MagicMock(deleted_count=1)
+        assert _make_repo(collection).cleanup_expired() == 1
+        assert collection.delete_many.call_count == 1
+
+    def test_cutoff_follows_pinned_clock(self) -> None:
+        collection = MagicMock()
+        collection.distinct.return_value = [30]
+        collection.delete_many.return_value = MagicMock(deleted_count=0)
+        with pinned_utc_now() as now:
+            _make_repo(collection).cleanup_expired()
+        (query,) = collection.delete_many.call_args.args
+        assert query["created_at"] == {"$lt": now - timedelta(days=30)}
+
+
+class TestBatchedWrites:
+    async def test_concurrent_logs_share_one_insert(self) -> None:
+        collection = MagicMock()
+        collection.insert_many = AsyncMock(
+            side_effect=lambda docs, ordered: MagicMock(
+                inserted_ids=[ObjectId() for _ in docs]
+            )
+        )
+        repo = _make_repo(collection)
+        repo._batch_writes = True
+
+        logs = await asyncio.gather(*(repo.log_async(_make_create()) for _ in range(3)))
+
+        collection.insert_many.assert_awaited_once()
+        assert len(collection.insert_many.call_args.args[0]) == 3
+        assert all(log.id is not None for log in logs)
+        stored = collection.insert_many.call_args.args[0][0]
+        assert logs[0].created_at == stored["created_at"]
+        assert logs[0].updated_at == stored["updated_at"]
+        for _, flusher in repo._write_queues.values():
+            flusher.cancel()
+
+    def test_each_event_loop_gets_its_own_queue(self) -> None:
+        collection = MagicMock()
+        collection.insert_many = AsyncMock(
+            side_effect=lambda docs, ordered: MagicMock(
+                inserted_ids=[ObjectId() for _ in docs]
+            )
+        )
+        repo = _make_repo(collection)
+        repo._batch_writes = True
+
+        first = asyncio.run(repo.log_async(_make_create()))
+        second = asyncio.run(repo.log_async(_make_create()))
+
+        assert first.id is not None and second.id is not None
+        assert collection.insert_many.await_count == 2
+
+    async def test_pending_logs_fail_when_the_writer_stops(self) -> None:
+        collection = MagicMock()
+        collection.insert_many = AsyncMock(side_effect=asyncio.CancelledError)
+        repo = _make_repo(collection)
+        repo._batch_writes = True
+
+        with pytest.raises(RuntimeError, match="writer stopped"):
+            await repo.log_async(_make_create())
+
+    async def test_compliance_logs_bypass_batch(self) -> None:
+        collection = MagicMock()
+        collection.insert_one = AsyncMock(return_value=MagicMock(inserted_id=ObjectId()))
+        repo = _make_repo(collection)
+        repo._batch_writes = True
+
+        await repo.log_async(_make_create(compliance_relevant=True))
+
+        collection.insert_one.assert_awaited_once()
+        assert repo._write_queues is None
+
+
+class TestWriteConcern:
+    def test_routine_event_unacknowledged_when_enabled(self) -> None:
+        collection = MagicMock()
+        fast_lane = collection.with_options.return_value
+        fast_lane.insert_one.return_value = MagicMock(inserted_id=ObjectId())
+        repo = _make_repo(collection)
+        repo._unacknowledged_writes = True
+
+        repo.log(_make_create())
+
+        write_concern = collection.with_options.call_args.kwargs["write_concern"]
+        assert write_concern.document == {"w": 0}
+        fast_lane.insert_one.assert_called_once()
+
+    def test_compliance_event_stays_acknowledged(self) -> None:
+        collection = MagicMock()
+        collection.insert_one.return_value = MagicMock(inserted_id=ObjectId())
+        repo = _make_repo(collection)
+        repo._unacknowledged_writes = True
+
+        repo.log(_make_create(compliance_relevant=True))
+
+        collection.with_options.assert_not_called()
+        collection.insert_one.assert_called_once()
+
+
+class TestCounts:
+    def test_count_compliance_logs_filters_on_index_keys(self) -> None:
+        collection = MagicMock()
+        collection.count_documents.return_value = 7
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        assert _make_repo(collection).count_compliance_logs(start_date=start) == 7
+        collection.count_documents.assert_called_once_with(
+            {"compliance_relevant": True, "created_at": {"$gte": start}}
+        )
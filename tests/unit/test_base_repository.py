@@ -0,0 +1,164 @@
+"""
+Unit tests for BaseRepository read caching and bulk writes.
+No live DB — uses MagicMock to stub the collection.
+"""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from src.data.models.base import BaseDocument
+from src.data.repositories import cached_reads
+from src.data.repositories.base import BaseRepository
+
+
+class _Note(BaseDocument):
+    text: str = ""
+
+
+class _NoteRepository(BaseRepository[_Note]):
+    @property
+    def collection_name(self) -> str:
+        return "notes"
+
+    @property
+    def model_class(self) -> type[_Note]:
+        return _Note
+
+
+def _make_repo(collection: MagicMock) -> _NoteRepository:
+    """Return a repository whose collections are mocks."""
+    repo: _NoteRepository = _NoteRepository.__new__(_NoteRepository)
+    repo._get_sync_collection = MagicMock(return_value=collection)  # type: ignore[method-assign]
+    repo._get_async_collection = MagicMock(return_value=collection)  # type: ignore[method-assign]
+    return repo
+
+
+class TestCachedReads:
+    def test_get_by_id_hits_database_once_per_block(self) -> None:
+        collection = MagicMock()
+        oid = ObjectId()
+        collection.find_one.return_value = {"_id": oid, "text": "hello"}
+        repo = _make_repo(collection)
+        with cached_reads():
+            first = repo.get_by_id(str(oid))
+            assert repo.get_by_id(oid) is first
+        assert collection.find_one.call_count == 1
+        repo.get_by_id(oid)
+        assert collection.find_one.call_count == 2
+
+    def test_delete_evicts_cached_model(self) -> None:
+        collection = MagicMock()
+        oid = ObjectId()
+        collection.find_one.return_value = {"_id": oid, "text": "hello"}
+        collection.delete_one.return_value.deleted_count = 1
+        repo = _make_repo(collection)
+        with cached_reads():
+            repo.get_by_id(oid)
+            repo.delete(oid)
+            repo.get_by_id(oid)
+        assert collection.find_one.call_count == 2
+
+    def test_read_during_a_write_is_not_served_afterwards(self) -> None:
+        collection = MagicMock()
+        oid = ObjectId()
+        collection.find_one.return_value = {"_id": oid, "text": "hello"}
+        repo = _make_repo(collection)
+
+        def read_while_updating(*args, **kwargs):
+            # A concurrent reader caches the old document while the update is in flight
+            repo.get_by_id(oid)
+            return {"_id": oid, "text": "bye"}
+
+        collection.find_one_and_update.side_effect = read_while_updating
+        with cached_reads():
+            repo.update(oid, {"text": "bye"})
+            repo.get_by_id(oid)
+        assert collection.find_one.call_count == 2
+
+
+class TestBulkWriter:
+    def test_writes_sent_in_one_bulk_write(self) -> None:
+        collection = MagicMock()
+        repo = _make_repo(collection)
+        oid = ObjectId()
+        with repo.bulk() as writer:
+            writer.update(oid, {"text": "bye"})
+            writer.delete(str(oid))
+        collection.bulk_write.assert_called_once()
+        operations = collection.bulk_write.call_args.args[0]
+        assert len(operations) == 2
+        assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+
+    def test_error_discards_queued_writes(self) -> None:
+        collection = MagicMock()
+        repo = _make_repo(collection)
+        with pytest.raises(RuntimeError):
+            with repo.bulk() as writer:
+                writer.delete(ObjectId())
+                raise RuntimeError("abort")
+        collection.bulk_write.assert_not_called()
+
+    def test_add_to_set_appends_only_new_values(self) -> None:
+        collection = MagicMock()
+        repo = _make_repo(collection)
+        oid = ObjectId()
+        with repo.bulk() as writer:
+            writer.add_to_set(oid, "metadata.tags", ["roll:42"])
+        (operation,) = collection.bulk_write.call_args.args[0]
+        assert operation._doc["$addToSet"] == {"metadata.tags": {"$each": ["roll:42"]}}
+        assert "updated_at" in operation._doc["$set"]
+
+    def test_queued_writes_share_one_timestamp(self) -> None:
+        collection = MagicMock()
+        repo = _make_repo(collection)
+        with repo.bulk() as writer:
+            writer.insert(_Note(text="a"))
+            writer.update(ObjectId(), {"text": "b"})
+        inserted, updated = collection.bulk_write.call_args.args[0]
+        assert inserted._doc["created_at"] == updated._doc["$set"]["updated_at"]
+
+    def test_written_ids_evicted_after_bulk_write(self) -> None:
+        collection = MagicMock()
+        oid = ObjectId()
+        collection.find_one.return_value = {"_id": oid, "text": "hello"}
+        repo = _make_repo(collection)
+        with cached_reads():
+            with repo.bulk() as writer:
+                writer.update(oid, {"text": "bye"})
+                # Read between queueing and sending caches the old document
+                repo.get_by_id(oid)
+            repo.get_by_id(oid)
+        assert collection.find_one.call_count == 2
+
+    def test_failed_bulk_write_still_evicts(self) -> None:
+        collection = MagicMock()
+        oid = ObjectId()
+        collection.find_one.return_value = {"_id": oid, "text": "hello"}
+        collection.bulk_write.side_effect = BulkWriteError({"writeErrors": []})
+        repo = _make_repo(collection)
+        generation = repo._write_generation
+        with cached_reads():
+            repo.get_by_id(oid)
+            with pytest.raises(BulkWriteError):
+                with repo.bulk() as writer:
+                    writer.update(oid, {"text": "bye"})
+            repo.get_by_id(oid)
+        assert collection.find_one.call_count == 2
+        assert repo._write_generation == generation + 1
+
+    async def test_async_written_ids_evicted_after_bulk_write(self) -> None:
+        collection = MagicMock()
+        oid = ObjectId()
+        collection.find_one = AsyncMock(return_value={"_id": oid, "text": "hello"})
+        collection.bulk_write = AsyncMock()
+        repo = _make_repo(collection)
+        with cached_reads():
+            async with repo.bulk_async() as writer:
+                writer.delete(oid)
+                await repo.get_by_id_async(oid)
+            await repo.get_by_id_async(oid)
+        assert collection.find_one.await_count == 2
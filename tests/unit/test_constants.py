@@ -50,6 +50,12 @@ class TestMatchScoreLevelFromScore:
     def test_poor_low_value(self):
         assert MatchScoreLevel.from_score(0.29) == MatchScoreLevel.POOR
 
+    def test_from_scores_matches_from_score(self):
+        scores = [0.0, 0.29, 0.499, 0.50, 0.699, 0.70, 0.849, 0.85, 1.0]
+        assert MatchScoreLevel.from_scores(scores) == [
+            MatchScoreLevel.from_score(s) for s in scores
+        ]
+
 
 # ── Enum value correctness ──────────────────────────────────────────────────
 
@@ -1,6 +1,11 @@
 from pathlib import Path
 import pytest
-from src.services.file_validator import FileValidator, ValidationResult
+from src.services.file_validator import (
+    FileValidator,
+    ValidationResult,
+    compute_file_hash,
+    compute_file_hashes,
+)
 
 RESUMES_DIR = Path("data/raw/resumes")
 VIVEK_PDF = RESUMES_DIR / "vivek_resume.pdf"
@@ -78,3 +83,12 @@ class TestBytesValidation:
         result = validator.validate_bytes(b"", "resume.pdf")
         assert result.ok is False
         assert "empty" in result.error.lower()
+
+
+class TestFileHashes:
+    def test_batch_matches_single_in_order(self):
+        contents = [b"%PDF-a", b"%PDF-b" * 10000, b"%PDF-c"]
+        assert compute_file_hashes(contents) == [compute_file_hash(c) for c in contents]
+
+    def test_batch_empty(self):
+        assert compute_file_hashes([]) == []
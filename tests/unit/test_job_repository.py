@@ -0,0 +1,351 @@
+"""
+Unit tests for JobRepository query construction.
+No live DB — uses MagicMock to stub the collection.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+
+from src.data.models.job import (
+    JobCreate,
+    JobMetadata,
+    JobUpdate,
+    Location,
+    ScoringWeights,
+    SkillRequirement,
+)
+from src.data.repositories import base as repositories_base
+from src.data.repositories import job_repository
+from src.data.repositories.job_repository import JobRepository
+from src.utils.constants import JobStatus
+
+
+def _make_repo(collection: MagicMock) -> JobRepository:
+    """Return a JobRepository whose collections are mocks."""
+    repo: JobRepository = JobRepository.__new__(JobRepository)
+    repo._get_sync_collection = MagicMock(return_value=collection)  # type: ignore[method-assign]
+    repo._get_async_collection = MagicMock(return_value=collection)  # type: ignore[method-assign]
+    return repo
+
+
+class TestOpenJobsQuery:
+    def test_closing_date_compared_as_bson_date(self) -> None:
+        query = JobRepository._open_jobs_query()
+        assert query["status"] == JobStatus.OPEN.value
+        bound = query["$or"][1]["closing_date"]["$gte"]
+        today = date.today()
+        assert bound == datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+
+
+class TestOpenJobsSummary:
+    def test_projected_documents_become_summaries(self) -> None:
+        job_id = ObjectId()
+        collection = MagicMock()
+        cursor = collection.find.return_value.sort.return_value.skip.return_value.limit.return_value
+        cursor.batch_size.return_value = [
+            {
+                "_id": job_id,
+                "title": "Backend Engineer",
+                "company_name": "Acme Corp",
+                "location": {"city": "Austin", "state": "TX"},
+                "status": "open",
+            }
+        ]
+        repo = _make_repo(collection)
+
+        (summary,) = repo.list_open_jobs_summary(limit=10)
+
+        query, projection = collection.find.call_args.args
+        assert query == JobRepository._open_jobs_query()
+        assert projection == JobRepository.SUMMARY_PROJECTION
+        assert "hint" not in collection.find.call_args.kwargs
+        assert summary.job_id == str(job_id)
+        assert summary.location.city == "Austin"
+        assert summary.status == JobStatus.OPEN
+        assert summary.posted_date is None
+
+
+class TestBuildJob:
+    def test_unset_optionals_fall_back_to_job_defaults(self) -> None:
+        job = JobRepository._build_job(
+            JobCreate(
+                title="Backend Engineer",
+                description="Build scalable services with Python.",
+                company_name="Acme Corp",
+                skill_requirements=[SkillRequirement(name="Python")],
+            )
+        )
+        assert job.location == Location()
+        assert job.metadata == JobMetadata()
+        assert job.scoring_weights == ScoringWeights.from_defaults()
+        assert job.skill_requirements[0].name == "python"
+
+
+class TestSearchQuery:
+    def test_skills_normalized_like_stored_names(self) -> None:
+        repo = _make_repo(MagicMock())
+        repo.find = MagicMock(return_value=[])  # type: ignore[method-assign]
+
+        repo.search(skills=[" Python ", "SQL"])
+
+        query = repo.find.call_args.args[0]
+        assert query["skill_requirements.name"] == {"$in": ["python", "sql"]}
+
+
+class TestCompanyNameFilter:
+    def test_prefix_is_collated_range(self) -> None:
+        condition, collation = JobRepository._company_name_filter("Acme", "prefix")
+        assert condition == {"$gte": "Acme", "$lt": "Acme\uffff"}
+        assert collation == {"locale": "en", "strength": 2}
+
+    def test_exact_without_collation_is_escaped_anchored_regex(self) -> None:
+        condition, collation = JobRepository._company_name_filter(
+            "A.C.M.E", "exact", collated=False
+        )
+        assert condition.pattern == r"^A\.C\.M\.E$"
+        assert collation is None
+
+    def test_contains_escapes_metacharacters(self) -> None:
+        condition, collation = JobRepository._company_name_filter("(a+)+", "contains")
+        assert condition.pattern == r"\(a\+\)\+"
+        assert collation is None
+
+    def test_text_search_never_sends_collation(self) -> None:
+        repo = _make_repo(MagicMock())
+        repo.find = MagicMock(return_value=[])  # type: ignore[method-assign]
+
+        repo.search(query_text="engineer", company_name="Acme")
+
+        assert repo.find.call_args.kwargs["collation"] is None
+        assert repo.find.call_args.args[0]["company_name"].pattern == "^Acme"
+
+
+class TestSearchCache:
+    def test_equivalent_searches_share_one_query(self) -> None:
+        repo = _make_repo(MagicMock())
+        repo.find = MagicMock(return_value=[])  # type: ignore[method-assign]
+
+        repo.search(skills=["SQL", "python"], tags=["b", "a"])
+        repo.search(skills=["python", "sql"], tags=["a", "b"])
+
+        repo.find.assert_called_once()
+
+    def test_hits_share_the_cached_copy(self) -> None:
+        job = JobRepository._build_job(
+            JobCreate(
+                title="Backend Engineer",
+                description="Build scalable services with Python.",
+                company_name="Acme Corp",
+            )
+        )
+        repo = _make_repo(MagicMock())
+        repo.find = MagicMock(return_value=[job])  # type: ignore[method-assign]
+
+        (first,) = repo.search(status=JobStatus.OPEN)
+        first.title = "Changed"  # the first caller owns its models
+        (second,) = repo.search(status=JobStatus.OPEN)
+        (third,) = repo.search(status=JobStatus.OPEN)
+
+        assert second.title == "Backend Engineer"
+        assert second is third
+
+    def test_write_invalidates_cached_results(self) -> None:
+        repo = _make_repo(MagicMock())
+        repo.find = MagicMock(return_value=[])  # type: ignore[method-assign]
+
+        repo.search(status=JobStatus.OPEN)
+        repo._evict(ObjectId())
+        repo.search(status=JobStatus.OPEN)
+
+        assert repo.find.call_count == 2
+
+    def test_view_increments_keep_cached_results(self) -> None:
+        repo = _make_repo(MagicMock())
+        repo.find = MagicMock(return_value=[])  # type: ignore[method-assign]
+        repo._schedule_flush = MagicMock()  # type: ignore[method-assign]
+
+        repo.search(status=JobStatus.OPEN)
+        repo.increment_views(ObjectId())
+        repo.search(status=JobStatus.OPEN)
+
+        repo.find.assert_called_once()
+
+    def test_search_during_a_write_is_not_reused(self) -> None:
+        collection = MagicMock()
+        repo = _make_repo(collection)
+        repo.find = MagicMock(return_value=[])  # type: ignore[method-assign]
+
+        def search_while_updating(*args, **kwargs):
+            # The search runs while the update is in flight and sees the old data
+            repo.search(status=JobStatus.OPEN)
+            return None
+
+        collection.find_one_and_update.side_effect = search_while_updating
+
+        repo.update(ObjectId(), {"status": JobStatus.CLOSED.value})
+        repo.search(status=JobStatus.OPEN)
+
+        assert repo.find.call_count == 2
+
+
+class TestCounterCoalescing:
+    def test_increments_share_one_bulk_write(self) -> None:
+        collection = MagicMock()
+        repo = _make_repo(collection)
+        repo._schedule_flush = MagicMock()  # type: ignore[method-assign]
+        job_a, job_b = ObjectId(), ObjectId()
+
+        repo.increment_views(job_a)
+        repo.increment_views(str(job_a))
+        repo.increment_applications(job_a)
+        repo.increment_views(job_b)
+
+        repo._schedule_flush.assert_called_once()
+        assert repo.flush_counters() == 2
+        operations = collection.bulk_write.call_args.args[0]
+        increments = {op._filter["_id"]: op._doc["$inc"] for op in operations}
+        assert increments[job_a] == {"metadata.views_count": 2, "metadata.applications_count": 1}
+        assert increments[job_b] == {"metadata.views_count": 1}
+
+    def test_flush_with_nothing_pending_skips_write(self) -> None:
+        collection = MagicMock()
+        repo = _make_repo(collection)
+        assert repo.flush_counters() == 0
+        collection.bulk_write.assert_not_called()
+
+    def test_flush_left_on_a_finished_loop_is_rescheduled(self) -> None:
+        collection = MagicMock()
+        collection.bulk_write = AsyncMock()
+        repo = _make_repo(collection)
+        repo.COUNTER_FLUSH_INTERVAL = 0.01
+        job_id = ObjectId()
+
+        async def view_and_leave() -> None:
+            await repo.increment_views_async(job_id)
+
+        async def view_and_wait() -> None:
+            await repo.increment_views_async(job_id)
+            await asyncio.sleep(0.05)
+
+        # The first loop ends before its flush fires; the second must still write
+        asyncio.run(view_and_leave())
+        asyncio.run(view_and_wait())
+
+        collection.bulk_write.assert_awaited_once()
+        (operation,) = collection.bulk_write.call_args.args[0]
+        assert operation._doc["$inc"] == {"metadata.views_count": 2}
+
+    def test_singleton_flushes_pending_counts_at_exit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        registered = []
+        monkeypatch.setattr(job_repository.atexit, "register", registered.append)
+        monkeypatch.setattr(job_repository, "_job_repository", None)
+        monkeypatch.setattr(repositories_base, "get_database_manager", MagicMock())
+
+        repo = job_repository.get_job_repository()
+        job_repository.get_job_repository()
+
+        assert registered == [repo._flush_in_background]
+
+    def test_increment_after_a_flush_schedules_the_next_one(self) -> None:
+        repo = _make_repo(MagicMock())
+        repo._schedule_flush = MagicMock()  # type: ignore[method-assign]
+
+        repo.increment_views(ObjectId())
+        repo.flush_counters()
+        repo.increment_views(ObjectId())
+
+        assert repo._schedule_flush.call_count == 2
+
+
+class TestAggregateCache:
+    def test_status_counts_reused_within_ttl(self) -> None:
+        collection = MagicMock()
+        collection.aggregate.return_value = [{"_id": "open", "count": 3}]
+        repo = _make_repo(collection)
+
+        first = repo.get_status_counts()
+        first["open"] = 99  # callers get their own copy
+        assert repo.get_status_counts() == {"open": 3}
+        assert collection.aggregate.call_count == 1
+
+        repo.invalidate_aggregate_cache()
+        repo.get_status_counts()
+        assert collection.aggregate.call_count == 2
+
+    async def test_concurrent_misses_share_one_query(self) -> None:
+        collection = MagicMock()
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[{"_id": "python", "count": 5}])
+        collection.aggregate = AsyncMock(return_value=cursor)
+        repo = _make_repo(collection)
+
+        results = await asyncio.gather(
+            repo.get_skill_demand_async(10), repo.get_skill_demand_async(10)
+        )
+        assert results[0] == results[1] == [{"_id": "python", "count": 5}]
+        assert collection.aggregate.await_count == 1
+
+    async def test_query_left_on_another_loop_is_not_awaited(self) -> None:
+        collection = MagicMock()
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[{"_id": "python", "count": 5}])
+        collection.aggregate = AsyncMock(return_value=cursor)
+        repo = _make_repo(collection)
+        # A finished loop left its query behind; awaiting it here would fail
+        other = asyncio.new_event_loop()
+        repo._aggregate_inflight = {other: {("skill_demand", 10): other.create_future()}}
+        other.close()
+
+        assert await repo.get_skill_demand_async(10) == [{"_id": "python", "count": 5}]
+        assert collection.aggregate.await_count == 1
+        assert other not in repo._aggregate_inflight
+
+
+class TestDashboardStats:
+    def test_one_facet_query_shaped_like_single_methods(self) -> None:
+        collection = MagicMock()
+        collection.aggregate.return_value = [
+            {
+                "status_counts": [{"_id": "open", "count": 2}],
+                "experience_levels": [{"_id": "mid", "count": 2}],
+                "companies": [{"_id": "Acme", "count": 2}],
+                "skills": [{"_id": "python", "count": 2, "required_count": 1}],
+            }
+        ]
+        repo = _make_repo(collection)
+
+        stats = repo.get_dashboard_stats(company_limit=5, skill_limit=5)
+
+        collection.aggregate.assert_called_once()
+        (pipeline,) = collection.aggregate.call_args.args
+        assert set(pipeline[0]["$facet"]) == {
+            "status_counts", "experience_levels", "companies", "skills"
+        }
+        assert stats["status_counts"] == {"open": 2}
+        assert stats["experience_levels"] == {"mid": 2}
+        assert stats["companies"] == [{"_id": "Acme", "count": 2}]
+
+
+class TestUpdateIfChanged:
+    def test_empty_update_does_no_io(self) -> None:
+        collection = MagicMock()
+        repo = _make_repo(collection)
+        assert repo.update_from_schema_if_changed(ObjectId(), JobUpdate()) is False
+        collection.update_one.assert_not_called()
+
+    def test_reports_modification(self) -> None:
+        collection = MagicMock()
+        collection.update_one.return_value.modified_count = 1
+        repo = _make_repo(collection)
+        changed = repo.update_from_schema_if_changed(ObjectId(), JobUpdate(title="Staff Engineer"))
+        assert changed is True
+        (_, update), _ = collection.update_one.call_args
+        assert update["$set"]["title"] == "Staff Engineer"
+        assert "updated_at" in update["$set"]
@@ -0,0 +1,191 @@
+"""
+Unit tests for MatchRepository ranking and query helpers.
+No live DB — uses MagicMock to stub the collection.
+"""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+from pydantic import ValidationError
+from pymongo.errors import OperationFailure
+
+from src.data.models.match import RecruiterFeedback
+from src.data.repositories.match_repository import MatchRepository
+
+
+def _make_repo(collection: MagicMock) -> MatchRepository:
+    """Return a MatchRepository whose collections are mocks."""
+    repo: MatchRepository = MatchRepository.__new__(MatchRepository)
+    repo._get_sync_collection = MagicMock(return_value=collection)  # type: ignore[method-assign]
+    repo._get_async_collection = MagicMock(return_value=collection)  # type: ignore[method-assign]
+    return repo
+
+
+class TestUpdateRanks:
+    def test_ranks_computed_and_merged_on_server(self) -> None:
+        job_id = ObjectId()
+        collection = MagicMock()
+        collection.count_documents.return_value = 4
+        repo = _make_repo(collection)
+
+        assert repo.update_ranks_for_job(job_id) == 4
+
+        (pipeline,) = collection.aggregate.call_args.args
+        assert pipeline[0] == {"$match": {"job_id": job_id}}
+        assert "$setWindowFields" in pipeline[1]
+        assert pipeline[-1]["$merge"]["whenNotMatched"] == "discard"
+        collection.find.assert_not_called()
+
+    def test_old_servers_write_only_changed_ranks_in_one_bulk_write(self) -> None:
+        first, second, third = ObjectId(), ObjectId(), ObjectId()
+        collection = MagicMock()
+        collection.aggregate.side_effect = OperationFailure("Unrecognized pipeline stage")
+        collection.find.return_value.sort.return_value = [
+            {"_id": first, "rank": 1},
+            {"_id": second, "rank": 3},
+            {"_id": third},
+        ]
+        repo = _make_repo(collection)
+
+        assert repo.update_ranks_for_job(ObjectId()) == 3
+
+        collection.update_one.assert_not_called()
+        operations = collection.bulk_write.call_args.args[0]
+        assert {op._filter["_id"]: op._doc["$set"]["rank"] for op in operations} == {
+            second: 2,
+            third: 3,
+        }
+
+
+class TestScorePages:
+    def test_first_page_has_no_range_filter(self) -> None:
+        job_id = ObjectId()
+        assert MatchRepository._after_score({"job_id": job_id}, None) == {"job_id": job_id}
+
+    def test_next_page_starts_after_cursor(self) -> None:
+        last_id = ObjectId()
+        query = MatchRepository._after_score({"job_id": ObjectId()}, (0.8, last_id))
+        assert query["$or"] == [
+            {"overall_score": {"$lt": 0.8}},
+            {"overall_score": 0.8, "_id": {"$gt": last_id}},
+        ]
+
+    def test_cursor_points_at_last_match_of_a_full_page(self) -> None:
+        last = MagicMock(overall_score=0.5, id=ObjectId())
+        repo = _make_repo(MagicMock())
+        repo.find = MagicMock(return_value=[MagicMock(), last])  # type: ignore[method-assign]
+
+        matches, cursor = repo.page_by_job(ObjectId(), limit=2)
+
+        assert cursor == (0.5, last.id)
+        assert repo.find.call_args.kwargs["sort_by"] == [("overall_score", -1), ("_id", 1)]
+        assert MatchRepository._next_cursor(matches[:1], limit=2) is None
+
+
+class TestJobAnalytics:
+    def test_one_facet_query_shaped_like_single_methods(self) -> None:
+        job_id = ObjectId()
+        collection = MagicMock()
+        collection.aggregate.return_value = [
+            {
+                "status_counts": [{"_id": "shortlisted", "count": 2}],
+                "score_distribution": [{"_id": "strong", "count": 2}],
+                "score_stats": [{"_id": None, "count": 2, "avg_score": 0.8}],
+            }
+        ]
+        repo = _make_repo(collection)
+
+        analytics = repo.get_job_analytics(job_id)
+
+        collection.aggregate.assert_called_once()
+        (pipeline,) = collection.aggregate.call_args.args
+        assert pipeline[0] == {"$match": {"job_id": job_id}}
+        assert analytics["status_counts"] == {"shortlisted": 2}
+        assert analytics["score_distribution"] == {"strong": 2}
+        assert analytics["score_stats"] == {"count": 2, "avg_score": 0.8}
+
+    def test_job_without_matches_gets_zero_stats(self) -> None:
+        collection = MagicMock()
+        collection.aggregate.return_value = [
+            {"status_counts": [], "score_distribution": [], "score_stats": []}
+        ]
+        repo = _make_repo(collection)
+
+        assert repo.get_job_analytics(ObjectId())["score_stats"]["count"] == 0
+
+
+class TestAnalyticsCache:
+    def test_stats_reused_until_a_write(self) -> None:
+        job_id = ObjectId()
+        collection = MagicMock()
+        collection.aggregate.return_value = [{"_id": "pending", "count": 3}]
+        repo = _make_repo(collection)
+
+        repo.get_status_counts_for_job(job_id)
+        assert repo.get_status_counts_for_job(str(job_id)) == {"pending": 3}
+        assert collection.aggregate.call_count == 1
+
+        repo.delete_by_candidate(ObjectId())
+        repo.get_status_counts_for_job(job_id)
+        assert collection.aggregate.call_count == 2
+
+    def test_counts_read_while_ranking_are_not_reused(self) -> None:
+        job_id = ObjectId()
+        collection = MagicMock()
+        repo = _make_repo(collection)
+
+        def aggregate(pipeline):
+            if "$merge" in pipeline[-1]:
+                # A dashboard reads the counts while the $merge is still running
+                repo.get_status_counts_for_job(job_id)
+            return [{"_id": "pending_review", "count": 3}]
+
+        collection.aggregate.side_effect = aggregate
+
+        repo.update_ranks_for_job(job_id)
+        repo.get_status_counts_for_job(job_id)
+        assert collection.aggregate.call_count == 3
+
+
+class TestTopRanks:
+    def test_projection_stays_inside_the_score_index(self) -> None:
+        match_id, candidate_id = ObjectId(), ObjectId()
+        collection = MagicMock()
+        cursor = collection.find.return_value.sort.return_value.limit.return_value
+        cursor.batch_size.return_value = [
+            {
+                "_id": match_id,
+                "candidate_id": candidate_id,
+                "overall_score": 0.9,
+                "status": "pending_review",
+                "rank": 1,
+            }
+        ]
+        repo = _make_repo(collection)
+
+        (entry,) = repo.list_top_ranks(ObjectId(), limit=5, min_score=0.5)
+
+        query, projection = collection.find.call_args.args
+        assert query["overall_score"] == {"$gte": 0.5}
+        assert set(projection) == {"_id", "candidate_id", "overall_score", "status", "rank"}
+        assert entry.match_id == str(match_id)
+        assert entry.candidate_id == str(candidate_id)
+        assert entry.rank == 1
+
+
+class TestFeedbackDocument:
+    def test_matches_the_model_it_replaces(self) -> None:
+        document = MatchRepository._feedback_document("r-1", 4, "Strong fit", "shortlist")
+        assert set(document) == set(RecruiterFeedback.model_fields)
+        expected = RecruiterFeedback(**document).model_dump()
+        assert document == expected
+
+    def test_invalid_rating_rejected_before_write(self) -> None:
+        collection = MagicMock()
+        repo = _make_repo(collection)
+
+        with pytest.raises(ValidationError):
+            repo.add_feedback(ObjectId(), "r-1", rating=4.5)  # type: ignore[arg-type]
+        collection.find_one_and_update.assert_not_called()
@@ -16,6 +16,7 @@ from src.data.models import (
     BiasCheckResult,
     Candidate,
     CandidateMetadata,
+    CandidateSummary,
     Certification,
     ChangeRecord,
     ContactInfo,
@@ -26,6 +27,7 @@ from src.data.models import (
     ExperienceRequirement,
     Explanation,
     ExplanationFactor,
+    ExtractedEntity,
     FileMetadata,
     Job,
     JobCreate,
@@ -54,7 +56,7 @@ from src.data.models import (
     create_candidate_scored_audit,
     create_manual_override_audit,
 )
-from src.data.models.base import BaseDocument, PyObjectId, TimestampMixin
+from src.data.models.base import BaseDocument, PyObjectId, TimestampMixin, pinned_utc_now
 from src.utils.constants import (
     AuditAction,
     CandidateStatus,
@@ -82,6 +84,10 @@ class TestPyObjectId:
         with pytest.raises(ValueError, match="Invalid ObjectId"):
             PyObjectId.validate("not-a-valid-id")
 
+    def test_validate_reuses_parsed_id(self):
+        oid = str(ObjectId())
+        assert PyObjectId.validate(oid) is PyObjectId.validate(oid)
+
 
 class TestTimestampMixin:
     def test_auto_created_at(self):
@@ -92,6 +98,16 @@ class TestTimestampMixin:
         ts = TimestampMixin()
         assert isinstance(ts.updated_at, datetime)
 
+    def test_pinned_utc_now_shares_timestamp(self):
+        with pinned_utc_now() as now:
+            first, second = TimestampMixin(), TimestampMixin()
+        assert first.created_at == second.updated_at == now
+        assert TimestampMixin().created_at >= now
+
+    def test_nested_pin_keeps_outer_timestamp(self):
+        with pinned_utc_now() as outer, pinned_utc_now() as inner:
+            assert inner == outer
+
 
 class TestBaseDocument:
     def test_model_dump_mongo_excludes_none_id(self):
@@ -105,11 +121,60 @@ class TestBaseDocument:
         data = doc.model_dump_mongo()
         assert data["_id"] == oid
 
+    def test_model_dump_mongo_exclude(self):
+        doc = BaseDocument(id=ObjectId())
+        data = doc.model_dump_mongo(exclude={"id", "updated_at"})
+        assert "_id" not in data
+        assert "updated_at" not in data
+        assert "created_at" in data
+
+    def test_model_dump_mongo_converts_nested_dates(self, sample_candidate):
+        data = sample_candidate.model_dump_mongo()
+        start = data["work_experience"][0]["start_date"]
+        assert type(start) is datetime
+        assert start.date() == date(2020, 1, 15)
+
+    def test_date_field_keys_skip_date_free_fields(self):
+        from src.data.models.base import _date_field_keys
+
+        keys = _date_field_keys(Match)
+        assert "score_breakdown" not in keys
+        assert "skill_matches" not in keys
+
     def test_timestamps_present(self):
         doc = BaseDocument()
         assert doc.created_at is not None
         assert doc.updated_at is not None
 
+    def test_validate_many(self):
+        oid = ObjectId()
+        docs = [{"_id": oid}, {"_id": str(oid)}, {}]
+        models = BaseDocument.validate_many(docs)
+        assert [m.id for m in models] == [oid, oid, None]
+
+    def test_from_trusted_dict_rebuilds_nested_models(self, sample_match):
+        doc = sample_match.model_dump_mongo()
+        doc["_id"] = ObjectId()
+        rebuilt = Match.from_trusted_dict(doc)
+        assert rebuilt.id == doc["_id"]
+        assert isinstance(rebuilt.score_breakdown, ScoreBreakdown)
+        assert all(isinstance(sm, SkillMatch) for sm in rebuilt.skill_matches)
+        assert rebuilt.skills_match_percentage == sample_match.skills_match_percentage
+
+    def test_from_trusted_dict_restores_dates(self, sample_job):
+        sample_job.closing_date = date.today() + timedelta(days=7)
+        rebuilt = Job.from_trusted_dict(sample_job.model_dump_mongo())
+        assert type(rebuilt.closing_date) is date
+        assert rebuilt.is_active is True
+
+    def test_to_json_stringifies_object_id(self):
+        import json
+
+        oid = ObjectId()
+        data = json.loads(BaseDocument(id=oid).to_json())
+        assert data["_id"] == str(oid)
+        assert data["created_at"].endswith("+00:00")
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  match.py
@@ -131,8 +196,42 @@ class TestScoreBreakdown:
         bd = ScoreBreakdown()
         assert bd.total_score == 0.0
 
+    def test_weighted_filled_from_score_and_weight(self):
+        bd = ScoreBreakdown(skills_score=0.8, experience_score=0.4)
+        assert abs(bd.skills_weighted - 0.28) < 1e-9
+        assert abs(bd.experience_weighted - 0.10) < 1e-9
+        assert abs(bd.total_score - 0.38) < 1e-9
+
+    def test_from_components_matches_validated_model(self):
+        kwargs = {
+            "skills_score": 0.8, "skills_weight": 0.35,
+            "experience_score": 1.4, "experience_weight": 0.25,
+            "education_score": 0.5, "education_weight": 0.15,
+            "semantic_score": 0.6, "semantic_weight": 0.20,
+            "keyword_score": -0.1, "keyword_weight": 0.05,
+        }
+        fast = ScoreBreakdown.from_components(**kwargs)
+        assert fast.experience_score == 1.0
+        assert fast.keyword_score == 0.0
+        assert fast.model_dump() == ScoreBreakdown.model_validate(fast.model_dump()).model_dump()
+        assert abs(fast.total_score - (0.28 + 0.25 + 0.075 + 0.12)) < 1e-9
+
 
 class TestMatch:
+    def test_to_json_matches_model_dump(self, sample_match):
+        import json
+
+        data = json.loads(sample_match.to_json())
+        expected = json.loads(sample_match.model_dump_json(by_alias=True))
+        assert data["score_breakdown"] == expected["score_breakdown"]
+        assert data["skill_matches"] == expected["skill_matches"]
+        assert data["_id"] == expected["_id"]
+
+    def test_skill_match_names_are_interned(self):
+        a = SkillMatch(skill_name="".join(["py", "thon"]))
+        b = SkillMatch(skill_name="".join(["pyt", "hon"]))
+        assert a.skill_name is b.skill_name
+
     def test_effective_score_no_override(self, sample_match):
         assert sample_match.effective_score == sample_match.overall_score
 
@@ -160,12 +259,48 @@ class TestMatch:
         )
         assert m.skills_match_percentage == 100.0
 
+    def test_batch_scores_match_scalar_properties(self, sample_match):
+        no_required = Match(
+            candidate_id=ObjectId(),
+            job_id=ObjectId(),
+            skill_matches=[SkillMatch(skill_name="docker", required=False)],
+        )
+        matches = [sample_match, no_required]
+        totals = Match.batch_total_scores(matches)
+        pcts = Match.batch_skills_match_percentage(matches)
+        assert list(totals) == pytest.approx([m.score_breakdown.total_score for m in matches])
+        assert list(pcts) == pytest.approx([m.skills_match_percentage for m in matches])
+
+    def test_keyword_match_is_frozen(self):
+        km = KeywordMatch(total_keywords=3, matched_keywords=2)
+        with pytest.raises(ValueError):
+            km.matched_keywords = 3
+
     def test_calculate_score_level(self):
         m = Match(candidate_id=ObjectId(), job_id=ObjectId(), overall_score=0.90)
         level = m.calculate_score_level()
         assert level == MatchScoreLevel.EXCELLENT
         assert m.score_level == MatchScoreLevel.EXCELLENT
 
+    def test_calculate_score_levels_bulk(self):
+        matches = [
+            Match(candidate_id=ObjectId(), job_id=ObjectId(), overall_score=score)
+            for score in (0.9, 0.6, 0.1)
+        ]
+        Match.calculate_score_levels_bulk(matches)
+        assert [m.score_level for m in matches] == [
+            MatchScoreLevel.EXCELLENT,
+            MatchScoreLevel.FAIR,
+            MatchScoreLevel.POOR,
+        ]
+
+    def test_to_summary(self, sample_match):
+        summary = sample_match.to_summary("Jane Smith", "Backend Engineer")
+        assert summary.candidate_id == str(sample_match.candidate_id)
+        assert summary.score_level == MatchScoreLevel(sample_match.score_level)
+        assert summary.skills_match_percentage == sample_match.skills_match_percentage
+        assert len(summary.top_strengths) <= 3
+
     def test_add_feedback(self, sample_match):
         sample_match.add_feedback(recruiter_id="rec1", rating=4, comments="Strong candidate")
         assert len(sample_match.feedback) == 1
@@ -285,6 +420,17 @@ class TestCandidate:
         assert "django" in names
         assert "postgresql" in names
 
+    def test_skill_name_set(self, sample_candidate):
+        assert sample_candidate.skill_name_set == frozenset(sample_candidate.skill_names)
+        assert {"python", "rust"} & sample_candidate.skill_name_set == {"python"}
+
+    def test_skill_name_set_follows_skill_changes(self, sample_candidate):
+        sample_candidate.skill_name_set
+        sample_candidate.skills.append(Skill(name="Go"))
+        assert "go" in sample_candidate.skill_name_set
+        sample_candidate.skills = [Skill(name="Rust")]
+        assert sample_candidate.skill_name_set == frozenset({"rust"})
+
     def test_total_experience_years(self, sample_candidate):
         years = sample_candidate.total_experience_years
         # Two jobs: 2020-01 to now + 2017-06 to 2019-12
@@ -317,6 +463,21 @@ class TestCandidate:
         assert c.highest_education_level is not None
         assert "master" in c.highest_education_level.lower()
 
+    def test_contact_email_lowercased(self):
+        contact = ContactInfo(email="Jane.Smith@Example.COM")
+        assert contact.email == "jane.smith@example.com"
+
+    def test_summary_full_name(self):
+        summary = CandidateSummary(
+            candidate_id=str(ObjectId()),
+            first_name="Jane",
+            last_name="Smith",
+            status=CandidateStatus.NEW,
+            created_at=datetime(2024, 1, 1),
+        )
+        assert summary.full_name == "Jane Smith"
+        assert summary.headline is None
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  job.py
@@ -353,6 +514,12 @@ class TestLocation:
         # country defaults to "USA"
         assert loc.display_string == "USA"
 
+    def test_location_is_frozen(self):
+        loc = Location(city="Austin", state="TX")
+        with pytest.raises(ValueError):
+            loc.city = "Dallas"
+        assert loc.display_string == "Austin, TX, USA"
+
 
 class TestJob:
     def test_required_skills(self, sample_job):
@@ -370,6 +537,16 @@ class TestJob:
         all_s = sample_job.all_skills
         assert len(all_s) == 5
 
+    def test_skill_names_follow_reassignment(self, sample_job):
+        assert "python" in sample_job.required_skills
+        sample_job.skill_requirements = [SkillRequirement(name="Go")]
+        assert sample_job.required_skills == ("go",)
+        sample_job.skill_requirements.append(SkillRequirement(name="Rust", is_required=False))
+        assert sample_job.preferred_skills == ("rust",)
+
+    def test_skill_names_are_not_copied_per_access(self, sample_job):
+        assert sample_job.all_skills is sample_job.all_skills
+
     def test_is_active_open(self, sample_job):
         assert sample_job.is_active is True
 
@@ -415,6 +592,10 @@ class TestSalaryRange:
         with pytest.raises(ValueError, match="non-negative"):
             SalaryRange(min_amount=-1000)
 
+    def test_negative_max_amount_raises(self):
+        with pytest.raises(ValueError, match="non-negative"):
+            SalaryRange(min_amount=1000, max_amount=-1)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  resume.py
@@ -452,6 +633,26 @@ class TestResume:
         sample_resume.add_error("parsing", "FatalError", "critical failure", is_recoverable=False)
         assert sample_resume.status == ProcessingStatus.FAILED
 
+    def test_entities_of_type(self):
+        content = ParsedContent(
+            raw_text="Python at Acme",
+            cleaned_text="python at acme",
+            entities=[
+                ExtractedEntity(
+                    entity_type="SKILL", value="Python", start_position=0, end_position=6
+                ),
+                ExtractedEntity(
+                    entity_type="ORG", value="Acme", start_position=10, end_position=14
+                ),
+            ],
+        )
+        assert [e.value for e in content.entities_of_type("SKILL")] == ["Python"]
+        content.entities.append(
+            ExtractedEntity(entity_type="SKILL", value="SQL", start_position=15, end_position=18)
+        )
+        assert [e.value for e in content.entities_of_type("SKILL")] == ["Python", "SQL"]
+        assert content.entities_of_type("DATE") == []
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  audit.py